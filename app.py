@@ -5,13 +5,14 @@ Main Streamlit application file.
 import streamlit as st
 import time
 import os
-import json
 from utils.i18n import tr
 
 # Import utilities
 from utils.config import get_config, set_config, initialize_product_database
 from utils.db import db, initialize_session_from_db, save_session_state_to_db
 from utils.skills import initialize_skills, update_shop_level
+from utils.game_history import GameHistory
+from utils.challenge_pool import challenge_pool
 
 # Import components
 from components.navigation import (
@@ -30,18 +31,6 @@ from games.breadcrumb import show_game_breadcrumb
 import games
 from games import get_game_function, get_all_games
 
-# Helper: Load translations from file
-TRANSLATION_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'i18n', 'app_translations.json')
-def get_translations():
-    with open(TRANSLATION_PATH, encoding='utf-8') as f:
-        return json.load(f)
-
-translations = get_translations()
-
-def get_lang_code():
-    lang = st.session_state.get("language", "English")
-    return "id" if lang == "Bahasa Indonesia" else "en"
-
 # Initialize app
 def init_app():
     """Initialize the application."""
@@ -58,16 +47,19 @@ def init_app():
     if os.path.exists(assets_path):
         inject_custom_css()
     
-    # Initialize product database if needed
+    # Seed the product database (only does work on the first run in this process)
     initialize_product_database()
     
+    # Pre-generate game challenges in the background (starts once per process)
+    challenge_pool.start()
+    
     # Initialize session state variables if needed
     if 'initialized' not in st.session_state:
         st.session_state.initialized = True
         st.session_state.player_name = ""
         st.session_state.total_score = 0
         st.session_state.current_game = None
-        st.session_state.game_history = []
+        st.session_state.game_history = GameHistory()
         st.session_state.achievements = []
         st.session_state.shop_level = 1
         
@@ -107,6 +99,38 @@ def render_sidebar_language_selector():
         st.session_state["language"] = lang
         st.experimental_rerun()
 
+def _run_game_body(game_id, game_function):
+    try:
+        if game_id == "inventory_game" and "inventory_game" not in st.session_state:
+            from games.inventory_game import initialize_game_state
+            initialize_game_state(1)
+        elif game_id == "change_making" and "change_making" not in st.session_state:
+            from games.change_making import initialize_transaction
+            initialize_transaction(1)
+        elif game_id == "margin_calculator" and "margin_calculator" not in st.session_state:
+            from games.margin_calculator import initialize_margin_challenge
+            initialize_margin_challenge(1)
+        game_function()
+    except Exception as e:
+        st.error(f"Error running game: {e}")
+        import traceback
+        st.code(traceback.format_exc())
+
+def run_game(game_id, game_function):
+    """Run a game, as a fragment if game fragments are enabled.
+    
+    Inside a fragment, widget interactions rerun only the game body, not
+    the whole app (setup, sidebar, saving). Scoring a round goes through
+    utils.skills.score_round, which scores it once and reruns the whole app
+    so the dashboard and the session save pick it up. Leaving the game
+    calls st.rerun(), which also reruns the whole app.
+    """
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if fragment and get_config("gameplay.game_fragments"):
+        fragment(_run_game_body)(game_id, game_function)
+    else:
+        _run_game_body(game_id, game_function)
+
 # Main app flow
 def main():
     """Main application entry point."""
@@ -127,13 +151,6 @@ def main():
     # Only show sidebar language selector for logged-in, entered users
     render_sidebar_language_selector()
 
-    # Inject inventory game CSS after page config
-    import os
-    css_path = os.path.join('assets', 'styles', 'components', 'inventory_game.css')
-    if os.path.exists(css_path):
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
     # Handle header click to return to main menu
     if st.session_state.get('return_to_main_menu', False):
         # Clear any current game state
@@ -157,9 +174,6 @@ def main():
     
     # The hamburger menu is loaded via set_page_config() but hidden during onboarding using CSS
     
-    # --- DEBUG: Show current navigation state ---
-    st.write("DEBUG: current_game =", st.session_state.get("current_game"))
-
     # --- Main navigation logic ---
     if st.session_state.get("current_game") is None:
         # Show main menu
@@ -167,13 +181,10 @@ def main():
         show_main_menu_tabs()
         st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
         from components.progress_dashboard import (
-            display_progress_indicator, 
-            display_shop_growth_visualization,
+            display_progress_dashboard,
             show_save_progress_button
         )
-        display_progress_indicator()
-        st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
-        display_shop_growth_visualization()
+        display_progress_dashboard()
         st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
         show_save_progress_button()
     else:
@@ -182,22 +193,7 @@ def main():
         st.markdown("---")
         game_function = get_game_function(st.session_state.current_game)
         if game_function:
-            try:
-                game_id = st.session_state.current_game
-                if game_id == "inventory_game" and "inventory_game" not in st.session_state:
-                    from games.inventory_game import initialize_game_state
-                    initialize_game_state(1)
-                elif game_id == "change_making" and "change_making" not in st.session_state:
-                    from games.change_making import initialize_transaction
-                    initialize_transaction(1)
-                elif game_id == "margin_calculator" and "margin_calculator" not in st.session_state:
-                    from games.margin_calculator import initialize_margin_challenge
-                    initialize_margin_challenge(1)
-                game_function()
-            except Exception as e:
-                st.error(f"Error running game: {e}")
-                import traceback
-                st.code(traceback.format_exc())
+            run_game(st.session_state.current_game, game_function)
         else:
             st.error(f"Game '{st.session_state.current_game}' not found!")
             st.session_state.current_game = None
@@ -1,32 +1,30 @@
 """
 Learning path components for Toko Pintar application.
+
+Submodules are imported when one of their names is first used, so importing
+this package does not load the large content modules.
 """
-from .learning_paths import (
-    show_learning_paths, 
-    get_available_paths, 
-    get_path_progress, 
-    show_learning_module
-)
-from .certificates import (
-    generate_certificate, 
-    display_certificate_preview, 
-    get_earned_certificates
-)
-from .real_world_tips import (
-    get_tips_for_skill,
-    get_real_world_applications,
-    display_pro_tip
-)
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'show_learning_paths': '.learning_paths',
+    'get_available_paths': '.learning_paths',
+    'get_path_progress': '.learning_paths',
+    'show_learning_module': '.learning_paths',
+    'generate_certificate': '.certificates',
+    'display_certificate_preview': '.certificates',
+    'get_earned_certificates': '.certificates',
+    'get_tips_for_skill': '.real_world_tips',
+    'get_real_world_applications': '.real_world_tips',
+    'display_pro_tip': '.real_world_tips'
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'show_learning_paths',
-    'get_available_paths',
-    'get_path_progress',
-    'show_learning_module',
-    'generate_certificate',
-    'display_certificate_preview',
-    'get_earned_certificates',
-    'get_tips_for_skill',
-    'get_real_world_applications',
-    'display_pro_tip'
-]
\ No newline at end of file
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
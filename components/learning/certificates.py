@@ -18,13 +18,14 @@ def generate_certificate(path_id, milestone_level):
     Returns:
         dict: Certificate data or None if not eligible
     """
-    from components.learning.learning_paths import LEARNING_PATHS, get_path_progress
+    from components.learning.learning_paths import get_available_paths, get_path_progress
     
     # Check if path and milestone exist
-    if path_id not in LEARNING_PATHS:
+    learning_paths = get_available_paths()
+    if path_id not in learning_paths:
         return None
     
-    path = LEARNING_PATHS[path_id]
+    path = learning_paths[path_id]
     
     if milestone_level >= len(path["milestones"]):
         return None
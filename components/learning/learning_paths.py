@@ -5,205 +5,17 @@ Organizes game-based learning into structured paths for skill development.
 import streamlit as st
 from datetime import datetime
 from utils.config import get_config
+from utils.content_store import get_content_store
 from utils.skills import get_skill_name, get_skill_icon, get_skill_description
-from components.learning.real_world_tips import get_tips_for_skill, get_real_world_applications, display_pro_tip
 from utils.i18n import tr
 
-# Define learning paths with their milestones and games
-LEARNING_PATHS = {
-    "inventory": {
-        "name": {
-            "en": "Inventory Management",
-            "id": "Manajemen Inventaris"
-        },
-        "description": {
-            "en": "Learn to track and manage your shop's products efficiently",
-            "id": "Pelajari cara melacak dan mengelola produk toko Anda secara efisien"
-        },
-        "icon": "📦",
-        "skill_key": "inventory_management",
-        "milestones": [
-            {
-                "level": 1,
-                "name": {
-                    "en": "Basics of Counting",
-                    "id": "Dasar-dasar Penghitungan"
-                },
-                "games": ["inventory_game"],
-                "min_score": 10
-            },
-            {
-                "level": 2,
-                "name": {
-                    "en": "Stock Tracking",
-                    "id": "Pelacakan Stok"
-                },
-                "games": ["inventory_game"],
-                "min_score": 20
-            },
-            {
-                "level": 3,
-                "name": {
-                    "en": "Inventory Optimization",
-                    "id": "Optimasi Inventaris"
-                },
-                "games": ["inventory_game"],
-                "min_score": 30
-            },
-            {
-                "level": 4,
-                "name": {
-                    "en": "Inventory Planning",
-                    "id": "Perencanaan Inventaris"
-                },
-                "info": {
-                    "en": "Learn to predict stock needs based on sales patterns",
-                    "id": "Pelajari cara memprediksi kebutuhan stok berdasarkan pola penjualan"
-                },
-                "games": ["inventory_game"],
-                "min_score": 40
-            },
-            {
-                "level": 5,
-                "name": {
-                    "en": "Advanced Inventory Management",
-                    "id": "Manajemen Inventaris Lanjutan"
-                },
-                "certificate": True,
-                "games": ["inventory_game"],
-                "min_score": 50
-            }
-        ]
-    },
-    "cash": {
-        "name": {
-            "en": "Cash Handling",
-            "id": "Penanganan Uang Tunai"
-        },
-        "description": {
-            "en": "Master managing money transactions accurately and quickly",
-            "id": "Kuasai pengelolaan transaksi uang secara akurat dan cepat"
-        },
-        "icon": "💰",
-        "skill_key": "cash_handling",
-        "milestones": [
-            {
-                "level": 1,
-                "name": {
-                    "en": "Basic Change Making",
-                    "id": "Dasar-dasar Memberikan Kembalian"
-                },
-                "games": ["change_making"],
-                "min_score": 10
-            },
-            {
-                "level": 2,
-                "name": {
-                    "en": "Quick Calculations",
-                    "id": "Perhitungan Cepat"
-                },
-                "games": ["change_making"],
-                "min_score": 20
-            },
-            {
-                "level": 3,
-                "name": {
-                    "en": "Daily Cash Management",
-                    "id": "Pengelolaan Kas Harian"
-                },
-                "games": ["change_making"],
-                "min_score": 30
-            },
-            {
-                "level": 4,
-                "name": {
-                    "en": "Cash Security",
-                    "id": "Keamanan Kas"
-                },
-                "games": ["change_making"],
-                "min_score": 40
-            },
-            {
-                "level": 5,
-                "name": {
-                    "en": "Advanced Cash Operations",
-                    "id": "Operasi Kas Lanjutan"
-                },
-                "certificate": True,
-                "games": ["change_making"],
-                "min_score": 50
-            }
-        ]
-    },
-    "pricing": {
-        "name": {
-            "en": "Pricing Strategy",
-            "id": "Strategi Penetapan Harga"
-        },
-        "description": {
-            "en": "Learn to set prices for optimal profit and competitiveness",
-            "id": "Pelajari cara menetapkan harga untuk keuntungan dan daya saing yang optimal"
-        },
-        "icon": "🏷️",
-        "skill_key": "pricing_strategy",
-        "milestones": [
-            {
-                "level": 1,
-                "name": {
-                    "en": "Basic Margin Calculation",
-                    "id": "Perhitungan Margin Dasar"
-                },
-                "games": ["margin_calculator"],
-                "min_score": 10
-            },
-            {
-                "level": 2,
-                "name": {
-                    "en": "Profit Optimization",
-                    "id": "Optimasi Keuntungan"
-                },
-                "games": ["margin_calculator"],
-                "min_score": 20
-            },
-            {
-                "level": 3,
-                "name": {
-                    "en": "Competitive Pricing",
-                    "id": "Penetapan Harga Kompetitif"
-                },
-                "games": ["margin_calculator"],
-                "min_score": 30
-            },
-            {
-                "level": 4,
-                "name": {
-                    "en": "Seasonal Pricing",
-                    "id": "Penetapan Harga Musiman"
-                },
-                "games": ["margin_calculator"],
-                "min_score": 40
-            },
-            {
-                "level": 5,
-                "name": {
-                    "en": "Strategic Pricing Master",
-                    "id": "Ahli Strategi Penetapan Harga"
-                },
-                "certificate": True,
-                "games": ["margin_calculator"],
-                "min_score": 50
-            }
-        ]
-    }
-}
-
 def get_available_paths():
     """Get all available learning paths.
     
     Returns:
-        dict: All learning paths
+        dict: All learning paths, path_id -> path
     """
-    return LEARNING_PATHS
+    return get_content_store().get_learning_paths()
 
 def get_path_progress(path_id):
     """Get progress on a specific learning path.
@@ -214,10 +26,11 @@ def get_path_progress(path_id):
     Returns:
         dict: Progress information
     """
-    if path_id not in LEARNING_PATHS:
+    learning_paths = get_available_paths()
+    if path_id not in learning_paths:
         return None
     
-    path = LEARNING_PATHS[path_id]
+    path = learning_paths[path_id]
     skill_key = path["skill_key"]
     
     # Get current skill level
@@ -241,12 +54,16 @@ def get_path_progress(path_id):
     # Check if all games for current milestone have been completed
     games_completed = True
     if hasattr(st.session_state, 'game_history'):
+        game_stats = st.session_state.get('game_stats') or {}
         for game_id in current_milestone["games"]:
             # Get highest score for this game
-            highest_score = 0
-            for game in st.session_state.game_history:
-                if game["game_id"] == game_id and game["score"] > highest_score:
-                    highest_score = game["score"]
+            if game_id in game_stats:
+                highest_score = game_stats[game_id]["best_score"]
+            else:
+                highest_score = max(
+                    (game["score"] for game in st.session_state.game_history if game["game_id"] == game_id),
+                    default=0
+                )
             
             if highest_score < current_milestone.get("min_score", 0):
                 games_completed = False
@@ -278,12 +95,13 @@ def show_learning_module(path_id, milestone_level=None):
         path_id (str): Identifier for the learning path
         milestone_level (int, optional): Level of milestone to show, defaults to current
     """
-    if path_id not in LEARNING_PATHS:
+    learning_paths = get_available_paths()
+    if path_id not in learning_paths:
         st.error(tr("learning_path_not_found"))
         return
     
     # Get path info and progress
-    path = LEARNING_PATHS[path_id]
+    path = learning_paths[path_id]
     progress = get_path_progress(path_id)
     
     lang = get_config("app.default_language") or "en"
@@ -328,6 +146,12 @@ def show_learning_module(path_id, milestone_level=None):
         tr("interactive_practice_tab")
     ])
     
+    # pandas is only needed for the sample tables, so it is imported when a
+    # learning module is opened. The tips are loaded from assets/content by
+    # utils.content_store on first use.
+    import pandas as pd
+    from components.learning.real_world_tips import get_tips_for_skill, get_real_world_applications, display_pro_tip
+    
     with ed_tabs[0]:  # Concepts tab
         # Show info if available, otherwise show skill description
         if "info" in milestone and lang in milestone["info"]:
@@ -350,9 +174,6 @@ def show_learning_module(path_id, milestone_level=None):
             st.markdown("#### Sample Inventory Tracking Sheet")
             
             # Display a sample inventory tracking template
-            import pandas as pd
-            import numpy as np
-            
             # Create sample data
             data = {
                 'Product': ['Rice 1kg', 'Cooking Oil 1L', 'Sugar 500g', 'Instant Noodles', 'Soap Bar'],
@@ -3,54 +3,15 @@ Navigation components for Toko Pintar application.
 """
 import streamlit as st
 import time
+from itertools import islice
 from utils.config import get_config, set_config, get_translation, generate_widget_key
 from components.progress_dashboard import show_progress_dashboard
 from components.transitions import slide_transition, section_transition
-from utils.i18n import tr
+from utils.i18n import get_translator, tr
+from utils.game_history import GameHistory, get_game_history
 
-def inject_custom_css():
-    """Inject custom CSS into the Streamlit app."""
-    import os
-    import glob
-    
-    # Get base directory
-    base_dir = os.path.dirname(os.path.dirname(__file__))
-    css_files = []
-    
-    # ORDER MATTERS HERE:
-    # 1. Theme variables (must be first so other CSS can use the variables)
-    # 2. Component CSS files
-    # 3. Main CSS (for overrides and global styles)
-    
-    # 1. Add theme.css first - CRITICAL for CSS variables
-    theme_css_path = os.path.join(base_dir, 'assets', 'styles', 'theme.css')
-    if os.path.exists(theme_css_path):
-        with open(theme_css_path) as f:
-            theme_css = f.read()
-            # Inject theme variables immediately to ensure they're available
-            st.markdown(f'<style>{theme_css}</style>', unsafe_allow_html=True)
-    
-    # 2. Add all component CSS files
-    component_css_path = os.path.join(base_dir, 'assets', 'styles', 'components', '*.css')
-    component_files = sorted(glob.glob(component_css_path))
-    
-    # 3. Add main.css last for overrides
-    main_css_path = os.path.join(base_dir, 'assets', 'styles', 'main.css')
-    if os.path.exists(main_css_path):
-        component_files.append(main_css_path)
-    
-    # Read and combine all component CSS files and main.css
-    combined_css = ""
-    for css_file in component_files:
-        try:
-            with open(css_file) as f:
-                combined_css += f.read() + "\n\n"
-        except Exception as e:
-            st.warning(f"Error loading CSS file {css_file}: {e}")
-    
-    # Add JavaScript to completely remove all toolbar elements
-    # This is the most aggressive approach but should solve the issue
-    toolbar_js = """
+# JavaScript to completely remove all toolbar elements
+TOOLBAR_JS = """
     <script>
     // Run immediately and after a delay to ensure it catches dynamically added elements
     function removeToolbars() {
@@ -90,13 +51,10 @@ def inject_custom_css():
     // Start observing
     observer.observe(document.body, { childList: true, subtree: true });
     </script>
-    """
-    
-    # Add the JavaScript
-    st.markdown(toolbar_js, unsafe_allow_html=True)
-    
-    # Add responsive styles to hide header and step progress on mobile
-    mobile_css = """
+"""
+
+# Responsive styles to hide header and step progress on mobile
+MOBILE_CSS = """
     /* Mobile-specific styles - more aggressive approach */
     @media (max-width: 768px) {
         /* Hide main header and subtitle on mobile */
@@ -248,14 +206,20 @@ def inject_custom_css():
             padding: 0 !important;
         }
     }
-    """
+"""
+
+def inject_custom_css():
+    """Inject custom CSS into the Streamlit app.
     
-    # Combine all CSS
-    combined_css += mobile_css
+    All stylesheets are sent as one minified bundle that is built once per
+    process (see utils.assets). With debug mode on, edited CSS files are
+    picked up without a restart.
+    """
+    from utils.assets import get_css_bundle
     
-    # Inject the combined CSS
-    if combined_css:
-        st.markdown(f'<style>{combined_css}</style>', unsafe_allow_html=True)
+    bundle = get_css_bundle(extra_css=MOBILE_CSS, watch=bool(get_config("debug.enabled")))
+    if bundle.css:
+        st.markdown(bundle.style_tag + TOOLBAR_JS, unsafe_allow_html=True)
     else:
         st.warning("Could not load component CSS files")
 
@@ -855,6 +819,7 @@ def show_main_menu_tabs():
     Returns:
         str: Selected tab
     """
+    t = get_translator()
     lang = get_config("app.default_language") or "en"
     
     # Show breadcrumbs for navigation - but avoid circular imports
@@ -918,16 +883,24 @@ def show_main_menu_tabs():
     """, unsafe_allow_html=True)
     
     tabs = {
-        "games": tr('games'),
-        "learning": tr('learning_paths'),
-        "shop": tr('my_shop'),
-        "skills": tr('skills'),
-        "achievements": tr('achievements')
+        "games": t('games'),
+        "learning": t('learning_paths'),
+        "shop": t('my_shop'),
+        "skills": t('skills'),
+        "achievements": t('achievements')
+    }
+    tab_functions = {
+        "games": show_games_tab,
+        "learning": show_learning_paths_tab,
+        "shop": show_shop_tab,
+        "skills": show_skills_tab,
+        "achievements": show_achievements_tab
     }
     
-    # Create tabs with language-specific labels
-    tab_values = list(tabs.values())
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(tab_values)
+    # Only the selected tab runs; the active tab ID is kept in session state
+    # so it survives language changes
+    active_tab = st.session_state.get('active_main_tab', "games")
+    tab_containers = create_lazy_tabs(list(tabs.values()), key="main_menu_tab", default=tabs.get(active_tab))
     
     # Track current section in session state for breadcrumb navigation
     if 'current_section' not in st.session_state:
@@ -937,96 +910,93 @@ def show_main_menu_tabs():
     # Get previous section for animation direction
     prev_section = st.session_state.get('current_section', None)
     
-    with tab1:
-        new_section = list(tabs.values())[0]
-        st.session_state.current_section = new_section
-        # Determine animation direction
-        direction = section_transition(prev_section, new_section)
-        # Wrap content in slide transition
-        slide_transition(direction, show_games_tab)
-    
-    with tab2:
-        new_section = list(tabs.values())[1]
-        st.session_state.current_section = new_section
-        # Determine animation direction
-        direction = section_transition(prev_section, new_section)
-        # Wrap content in slide transition
-        slide_transition(direction, show_learning_paths_tab)
-    
-    with tab3:
-        new_section = list(tabs.values())[2]
-        st.session_state.current_section = new_section
-        # Determine animation direction
-        direction = section_transition(prev_section, new_section)
-        # Wrap content in slide transition
-        slide_transition(direction, show_shop_tab)
-    
-    with tab4:
-        new_section = list(tabs.values())[3]
-        st.session_state.current_section = new_section
-        # Determine animation direction
-        direction = section_transition(prev_section, new_section)
-        # Wrap content in slide transition
-        slide_transition(direction, show_skills_tab)
-    
-    with tab5:
-        new_section = list(tabs.values())[4]
-        st.session_state.current_section = new_section
-        # Determine animation direction
-        direction = section_transition(prev_section, new_section)
-        # Wrap content in slide transition
-        slide_transition(direction, show_achievements_tab)
+    for (tab_id, new_section), container in zip(tabs.items(), tab_containers):
+        # .open is None when the tabs don't track state; then every tab runs
+        is_open = getattr(container, "open", None)
+        if is_open is False:
+            continue
+        
+        with container:
+            st.session_state.current_section = new_section
+            if is_open:
+                st.session_state.active_main_tab = tab_id
+            # Determine animation direction
+            direction = section_transition(prev_section, new_section)
+            # Wrap content in slide transition
+            slide_transition(direction, tab_functions[tab_id])
+
+def create_lazy_tabs(labels, key, default=None):
+    """Create tabs where only the selected tab's content needs to run.
+    
+    Switching tabs reruns the app, and each container's `open` attribute
+    tells whether it is the selected tab. Streamlit versions without tab
+    state tracking get regular tabs, whose `open` is None.
+    
+    Args:
+        labels (list): Tab labels
+        key (str): Widget key; st.session_state[key] holds the selected label
+        default (str, optional): Label selected initially
+    
+    Returns:
+        list: Tab containers
+    """
+    try:
+        return st.tabs(labels, key=key, default=default, on_change="rerun")
+    except TypeError:
+        return st.tabs(labels)
 
 def show_games_tab():
     """Display the games tab content."""
-    st.markdown(f"### {tr('available_games')}")
-    st.write(tr('choose_game'))
+    t = get_translator()
+    st.markdown(f"### {t('available_games')}")
+    st.write(t('choose_game'))
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         show_game_card(
-            tr('inventory_counting'),
-            tr('inventory_counting_desc'),
-            tr('play_inventory_game'),
+            t('inventory_counting'),
+            t('inventory_counting_desc'),
+            t('play_inventory_game'),
             "inventory_game",
             "inventory_management"
         )
     
     with col2:
         show_game_card(
-            tr('change_making'),
-            tr('change_making_desc'),
-            tr('play_change_making'),
+            t('change_making'),
+            t('change_making_desc'),
+            t('play_change_making'),
             "change_making",
             "cash_handling"
         )
     
     with col3:
         show_game_card(
-            tr('margin_calculator'),
-            tr('margin_calculator_desc'),
-            tr('play_margin_calculator'),
+            t('margin_calculator'),
+            t('margin_calculator_desc'),
+            t('play_margin_calculator'),
             "margin_calculator",
             "pricing_strategy"
         )
     
     with col4:
         show_game_card(
-            tr('simple_calculator'),
-            tr('simple_calculator_desc'),
-            tr('play_simple_calculator'),
+            t('simple_calculator'),
+            t('simple_calculator_desc'),
+            t('play_simple_calculator'),
             "simple_calculator",
             "pricing_strategy"
         )
 
 def show_shop_tab():
     """Display the shop tab content."""
+    t = get_translator()
     if 'shop_level' not in st.session_state:
         st.session_state.shop_level = 1
     
     # Shop level display
-    st.markdown(f'<p class="shop-level">{tr("shop_level")} {st.session_state.shop_level}</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="shop-level">{t("shop_level")} {st.session_state.shop_level}</p>', unsafe_allow_html=True)
     
     # Show shop image based on level
     import os
@@ -1058,7 +1028,7 @@ def show_shop_tab():
             except:
                 font = ImageFont.load_default()
                 
-            level_text = f"{tr('shop_level')} {level}"
+            level_text = f"{t('shop_level')} {level}"
             # Different PIL versions have different methods
             try:
                 text_width = draw.textlength(level_text, font=font)
@@ -1076,9 +1046,9 @@ def show_shop_tab():
     
     # Modified approach to use in-memory generated image
     captions = {
-        1: tr('shop_level_1_caption'),
-        2: tr('shop_level_2_caption'),
-        3: tr('shop_level_3_caption')
+        1: t('shop_level_1_caption'),
+        2: t('shop_level_2_caption'),
+        3: t('shop_level_3_caption')
     }
     
     # Generate image in memory to avoid file path issues
@@ -1099,7 +1069,7 @@ def show_shop_tab():
     except:
         font = ImageFont.load_default()
     
-    level_text = f"{tr('shop_level')} {level}"
+    level_text = f"{t('shop_level')} {level}"
     # Different PIL versions have different methods
     try:
         text_width = draw.textlength(level_text, font=font)
@@ -1126,40 +1096,48 @@ def show_shop_tab():
     with col1:
         st.markdown("### {tr('shop_statistics')}")
         
-        total_games = len(st.session_state.game_history) if hasattr(st.session_state, 'game_history') else 0
-        avg_score = sum(g["score"] for g in st.session_state.game_history) / max(1, total_games) if hasattr(st.session_state, 'game_history') else 0
+        # Totals cover every game played, not just the recent ones in memory
+        game_history = get_game_history()
+        total_games = game_history.total_count
+        avg_score = game_history.average_score
         total_score = st.session_state.total_score if hasattr(st.session_state, 'total_score') else 0
         
         st.markdown(f"""
         <div class="shop-stats">
-            <p><strong>{tr('total_score')}:</strong> {total_score}</p>
-            <p><strong>{tr('games_played')}:</strong> {total_games}</p>
-            <p><strong>{tr('average_score')}:</strong> {avg_score:.1f}</p>
+            <p><strong>{t('total_score')}:</strong> {total_score}</p>
+            <p><strong>{t('games_played')}:</strong> {total_games}</p>
+            <p><strong>{t('average_score')}:</strong> {avg_score:.1f}</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        if hasattr(st.session_state, 'game_history') and st.session_state.game_history:
+        # Latest games first; older ones are paged from the database on request
+        shown = st.session_state.get('recent_activity_shown', 5)
+        games = list(islice(get_game_history().iter_all(), shown + 1))
+        if games:
             st.markdown("### {tr('recent_activity')}")
             
             # Get game name mapping
             game_name_map = {
-                "inventory_game": tr('inventory_counting'),
-                "change_making": tr('change_making'),
-                "margin_calculator": tr('margin_calculator'),
-                "customer_service": tr('customer_service'),
-                "cash_reconciliation": tr('cash_reconciliation'),
-                "simple_accounting": tr('simple_accounting')
+                "inventory_game": t('inventory_counting'),
+                "change_making": t('change_making'),
+                "margin_calculator": t('margin_calculator'),
+                "customer_service": t('customer_service'),
+                "cash_reconciliation": t('cash_reconciliation'),
+                "simple_accounting": t('simple_accounting')
             }
             
-            # Show latest games
-            for game in list(reversed(st.session_state.game_history))[:5]:
+            for game in games[:shown]:
                 st.markdown(f"""
                 <div style="padding: 5px; margin-bottom: 5px; border-bottom: 1px solid #eee;">
                     <strong>{game_name_map.get(game['game_id'], game['game_id'])}</strong>: 
                     Score {game['score']} | {game['timestamp']}
                 </div>
                 """, unsafe_allow_html=True)
+            
+            if len(games) > shown and st.button(t('show_older_games'), key=generate_widget_key("button", "show_older_games", stable=True)):
+                st.session_state.recent_activity_shown = shown + 10
+                st.rerun()
 
 def show_skills_tab():
     """Display the skills tab content."""
@@ -1250,16 +1228,10 @@ def show_achievements_tab():
     lang = get_config("app.default_language") or "en"
     
     # Get all achievements from the achievements system
-    from utils.achievements import ACHIEVEMENTS
+    from utils.achievements import get_localized_achievements, get_earned_achievement_ids
     
     # Get earned achievement IDs
-    earned_ids = set()
-    if hasattr(st.session_state, 'achievements') and st.session_state.achievements:
-        for achievement in st.session_state.achievements:
-            if "id" in achievement:
-                earned_ids.add(achievement["id"])
-            elif "achievement_type" in achievement:
-                earned_ids.add(achievement["achievement_type"])
+    earned_ids = get_earned_achievement_ids()
     
     # If no achievements yet, show a message
     if not earned_ids:
@@ -1285,16 +1257,10 @@ def show_achievements_tab():
     # Display locked achievements
     with locked_container:
         locked_count = 0
-        for achievement in ACHIEVEMENTS:
+        for achievement in get_localized_achievements(lang):
             if achievement["id"] not in earned_ids:
                 locked_count += 1
-                # Create a simplified achievement dict for display
-                achievement_data = {
-                    "id": achievement["id"],
-                    "name": achievement["name"] if lang == "en" else achievement["name_id"],
-                    "description": achievement["description"] if lang == "en" else achievement["description_id"]
-                }
-                show_locked_achievement(achievement_data)
+                show_locked_achievement(achievement)
         
         if locked_count == 0:
             st.success(tr('all_achievements_unlocked'))
@@ -1393,7 +1359,7 @@ def show_welcome_screen():
                         "bookkeeping": 0
                     }
                     st.session_state.achievements = []
-                    st.session_state.game_history = []
+                    st.session_state.game_history = GameHistory()
                     st.session_state.shop_level = 1
                     
                     st.success(f"{tr('welcome_success')} {st.session_state.player_name}!")
@@ -1,18 +1,25 @@
 """
 Onboarding components for Toko Pintar application.
+
+The onboarding journey is imported when one of its names is first used,
+so returning players never load it.
 """
-from .onboarding_journey import (
-    show_onboarding_journey,
-    show_onboarding_welcome,
-    show_onboarding_skills_intro,
-    show_onboarding_games_intro,
-    show_onboarding_complete
-)
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'show_onboarding_journey': '.onboarding_journey',
+    'show_onboarding_welcome': '.onboarding_journey',
+    'show_onboarding_skills_intro': '.onboarding_journey',
+    'show_onboarding_games_intro': '.onboarding_journey',
+    'show_onboarding_complete': '.onboarding_journey'
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'show_onboarding_journey',
-    'show_onboarding_welcome',
-    'show_onboarding_skills_intro',
-    'show_onboarding_games_intro',
-    'show_onboarding_complete'
-]
\ No newline at end of file
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@ import uuid
 from utils.config import get_config, get_translation
 from datetime import datetime
 from utils.i18n import tr
+from utils.game_history import GameHistory
 
 def show_onboarding_journey():
     """
@@ -260,6 +261,8 @@ def show_onboarding_journey():
         # Onboarding complete, reset state and redirect to main menu
         st.session_state.onboarding_completed = True
         st.session_state.onboarding_step = 0
+        from utils.achievements import record_event, EVENT_ONBOARDING_COMPLETED
+        record_event(EVENT_ONBOARDING_COMPLETED)
         st.rerun()
     
     # Display progress indicator (current_step already defined above)
@@ -890,7 +893,7 @@ def show_onboarding_complete():
                 "bookkeeping": 0
             }
             st.session_state.achievements = []
-            st.session_state.game_history = []
+            st.session_state.game_history = GameHistory()
             st.session_state.shop_level = 1
             
             # Mark onboarding as completed
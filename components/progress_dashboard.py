@@ -3,6 +3,7 @@ Progress dashboard component for Toko Pintar application.
 Provides a persistent progress indicator showing completion status across all sections.
 """
 import streamlit as st
+from functools import lru_cache
 from utils.skills import SKILL_DEFINITIONS, get_skill_name, get_skill_icon
 from utils.config import get_config
 
@@ -24,183 +25,157 @@ def display_breadcrumb_navigation(items):
     breadcrumb_html += '</ol></nav>'
     st.markdown(breadcrumb_html, unsafe_allow_html=True)
 
-def display_progress_indicator():
-    """Display a persistent progress indicator showing skills and completion status."""
-    # Ensure skills are initialized
-    if 'skill_levels' not in st.session_state:
-        from utils.skills import initialize_skills
-        initialize_skills()
-    
-    # Get language
-    lang = get_config("app.default_language") or "en"
-    
-    # Progress dashboard title based on language
-    progress_title = "My Shop Progress" if lang == "en" else "Kemajuan Toko Saya"
+# Dashboard HTML templates, bound once. Each widget is rendered as one
+# fragment and sent with a single st.markdown call.
+_PANEL_TEMPLATE = (
+    '<div class="progress-dashboard">'
+    '<div class="progress-dashboard-title"><span class="icon">{icon}</span> {title}</div>'
+    '{body}'
+    '</div>'
+).format
+
+_PROGRESS_ROW_TEMPLATE = (
+    '<div class="progress-category {css_class}">'
+    '<div class="progress-category-header">'
+    '<div class="progress-category-name"><span class="icon">{icon}</span> {name} {badge}</div>'
+    '<div class="progress-category-value">{percentage}%</div>'
+    '</div>'
+    '<div class="progress-bar-container">'
+    '<div class="progress-bar" style="width: {percentage}%;"></div>'
+    '</div>'
+    '</div>'
+).format
+
+_SHOP_LEVEL_TEMPLATE = (
+    '<div class="shop-level-indicator" style="text-align:center; padding:10px;">'
+    '<div class="shop-level-icon" style="font-size:2.5rem; margin-bottom:8px; transform:{transform}; transition:transform 0.3s ease;">{icon}</div>'
+    '<div class="shop-level-name" style="font-weight:600; color:{text_color}; margin-bottom:5px;">Level {level}</div>'
+    '<div class="shop-level-bar" style="height:4px; background-color:{color}; width:70%; margin:8px auto;"></div>'
+    '<div class="shop-level-label" style="font-size:0.9rem; color:{text_color};">{name}</div>'
+    '</div>'
+).format
+
+_SPACER_HTML = "<div style='height: 20px;'></div>"
+
+# Shop level icons and names, by language
+SHOP_LEVEL_ICONS = ["🏪", "🏬", "🏢", "🏙️", "🌆"]
+SHOP_LEVEL_NAMES = {
+    "en": ["Small Shop", "Growing Shop", "Established", "Thriving", "Successful"],
+    "id": ["Toko Kecil", "Toko Berkembang", "Mapan", "Berkembang Pesat", "Sukses"]
+}
+
+@lru_cache(maxsize=256)
+def render_progress_indicator(skill_levels, lang, max_level):
+    """Build the skills progress panel as one HTML fragment.
     
-    # Start the dashboard
-    st.markdown(f"""
-    <div class="progress-dashboard">
-        <div class="progress-dashboard-title">
-            <span class="icon">📊</span> {progress_title}
-        </div>
-    """, unsafe_allow_html=True)
+    Args:
+        skill_levels (tuple): (skill_id, level) pairs
+        lang (str): Language code
+        max_level (int): Maximum skill level
     
-    # Calculate total progress
-    max_level = get_config("gameplay.max_skill_level") or 5
+    Returns:
+        str: HTML
+    """
+    levels = dict(skill_levels)
     total_possible = len(SKILL_DEFINITIONS) * max_level
-    current_total = sum(st.session_state.skill_levels.values())
-    overall_progress = int((current_total / total_possible) * 100)
+    overall_progress = int((sum(levels.values()) / total_possible) * 100)
     
-    # Display overall progress
-    overall_label = "Overall Progress" if lang == "en" else "Kemajuan Keseluruhan"
-    st.markdown(f"""
-        <div class="progress-category">
-            <div class="progress-category-header">
-                <div class="progress-category-name">
-                    <span class="icon">🏆</span> {overall_label}
-                </div>
-                <div class="progress-category-value">{overall_progress}%</div>
-            </div>
-            <div class="progress-bar-container">
-                <div class="progress-bar" style="width: {overall_progress}%;"></div>
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+    rows = [_PROGRESS_ROW_TEMPLATE(
+        css_class="",
+        icon="🏆",
+        name="Overall Progress" if lang == "en" else "Kemajuan Keseluruhan",
+        badge="",
+        percentage=overall_progress
+    )]
+    for skill_id in SKILL_DEFINITIONS:
+        skill_level = levels.get(skill_id, 0)
+        rows.append(_PROGRESS_ROW_TEMPLATE(
+            # Color coding uses the first part of the skill ID
+            css_class=f"progress-{skill_id.split('_')[0]}",
+            icon=get_skill_icon(skill_id),
+            name=get_skill_name(skill_id, lang),
+            # Badge from level 3 up
+            badge='<span class="achievement-indicator">✓</span>' if skill_level >= 3 else "",
+            percentage=int((skill_level / max_level) * 100)
+        ))
     
-    # Display each skill category
-    for skill_id, skill_info in SKILL_DEFINITIONS.items():
-        # Get skill level
-        skill_level = st.session_state.skill_levels.get(skill_id, 0)
-        
-        # Calculate percentage
-        percentage = int((skill_level / max_level) * 100)
-        
-        # Get skill name in proper language
-        skill_name = get_skill_name(skill_id, lang)
-        
-        # Get skill icon
-        skill_icon = get_skill_icon(skill_id)
-        
-        # Determine CSS class for color coding
-        css_class = f"progress-{skill_id.split('_')[0]}"  # Use the first part of the skill ID
-        
-        # Achievement badges
-        achievement_badge = ""
-        if skill_level >= 3:  # Example threshold for showing a badge
-            achievement_badge = '<span class="achievement-indicator">✓</span>'
-        
-        # Output HTML for the skill progress
-        st.markdown(f"""
-            <div class="progress-category {css_class}">
-                <div class="progress-category-header">
-                    <div class="progress-category-name">
-                        <span class="icon">{skill_icon}</span> {skill_name} {achievement_badge}
-                    </div>
-                    <div class="progress-category-value">{percentage}%</div>
-                </div>
-                <div class="progress-bar-container">
-                    <div class="progress-bar" style="width: {percentage}%;"></div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    # Close the dashboard
-    st.markdown("</div>", unsafe_allow_html=True)
+    return _PANEL_TEMPLATE(
+        icon="📊",
+        title="My Shop Progress" if lang == "en" else "Kemajuan Toko Saya",
+        body="".join(rows)
+    )
 
-def display_shop_growth_visualization():
-    """Display a visual representation of shop growth levels."""
-    # Get current shop level
-    current_level = st.session_state.shop_level if 'shop_level' in st.session_state else 1
-    
-    # Get language
-    lang = get_config("app.default_language") or "en"
-    
-    # Header text based on language
-    growth_title = "Shop Growth Journey" if lang == "en" else "Perjalanan Pertumbuhan Toko"
-    
-    # Start the visualization with just the title
-    st.markdown(f"""
-    <div class="progress-dashboard">
-        <div class="progress-dashboard-title">
-            <span class="icon">🏪</span> {growth_title}
-        </div>
-    """, unsafe_allow_html=True)
+@lru_cache(maxsize=32)
+def render_shop_growth(shop_level, lang):
+    """Build the shop growth panel as one HTML fragment.
     
-    # Shop level icons
-    icons = ["🏪", "🏬", "🏢", "🏙️", "🌆"]
-    level_names = [
-        "Small Shop" if lang == "en" else "Toko Kecil", 
-        "Growing Shop" if lang == "en" else "Toko Berkembang", 
-        "Established" if lang == "en" else "Mapan",
-        "Thriving" if lang == "en" else "Berkembang Pesat", 
-        "Successful" if lang == "en" else "Sukses"
-    ]
-    
-    # Use Streamlit's columns to ensure horizontal layout
-    cols = st.columns(5)
-    
-    # Add class for mobile responsiveness
-    st.markdown("""
-    <style>
-    /* Mobile responsiveness for shop growth visualization */
-    @media (max-width: 768px) {
-        .shop-level-indicator {
-            padding: 5px !important;
-        }
-        
-        .shop-level-icon {
-            font-size: 1.8rem !important;
-            margin-bottom: 4px !important;
-        }
-        
-        .shop-level-name {
-            font-size: 0.7rem !important;
-            margin-bottom: 2px !important;
-        }
-        
-        .shop-level-bar {
-            height: 3px !important;
-            margin: 4px auto !important;
-        }
-        
-        .shop-level-label {
-            font-size: 0.7rem !important;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    Args:
+        shop_level (int): Current shop level
+        lang (str): Language code
     
-    # Display each level in its own column
-    for i in range(5):
+    Returns:
+        str: HTML
+    """
+    names = SHOP_LEVEL_NAMES.get(lang, SHOP_LEVEL_NAMES["en"])
+    indicators = []
+    for i, (icon, name) in enumerate(zip(SHOP_LEVEL_ICONS, names)):
         level_num = i + 1
-        level_class = ""
-        
-        if level_num < current_level:
-            color = "#4CAF50"  # Completed (green)
-            text_color = "#4CAF50"
+        if level_num < shop_level:
+            color = text_color = "#4CAF50"  # Completed (green)
             transform = "scale(1.0)"
-        elif level_num == current_level:
-            color = "#FF7043"  # Active (orange)
-            text_color = "#FF7043"
+        elif level_num == shop_level:
+            color = text_color = "#FF7043"  # Active (orange)
             transform = "scale(1.2)"
         else:
-            color = "#E0E0E0"  # Upcoming (gray)
-            text_color = "#9E9E9E"
+            color, text_color = "#E0E0E0", "#9E9E9E"  # Upcoming (gray)
             transform = "scale(1.0)"
-        
-        # Create the level indicator in a column
-        with cols[i]:
-            st.markdown(f"""
-                <div class="shop-level-indicator" style="text-align:center; padding:10px;">
-                    <div class="shop-level-icon" style="font-size:2.5rem; margin-bottom:8px; transform:{transform}; transition:transform 0.3s ease;">{icons[i]}</div>
-                    <div class="shop-level-name" style="font-weight:600; color:{text_color}; margin-bottom:5px;">Level {level_num}</div>
-                    <div class="shop-level-bar" style="height:4px; background-color:{color}; width:70%; margin:8px auto;"></div>
-                    <div class="shop-level-label" style="font-size:0.9rem; color:{text_color};">{level_names[i]}</div>
-                </div>
-            """, unsafe_allow_html=True)
+        indicators.append(_SHOP_LEVEL_TEMPLATE(
+            transform=transform, icon=icon, text_color=text_color,
+            level=level_num, color=color, name=name
+        ))
     
-    # Close the visualization container
-    st.markdown("</div>", unsafe_allow_html=True)
+    return _PANEL_TEMPLATE(
+        icon="🏪",
+        title="Shop Growth Journey" if lang == "en" else "Perjalanan Pertumbuhan Toko",
+        body=f'<div class="shop-level-row">{"".join(indicators)}</div>'
+    )
+
+def _get_dashboard_state():
+    """Get the (skill_levels, lang, max_level, shop_level) the dashboard depends on."""
+    if 'skill_levels' not in st.session_state:
+        from utils.skills import initialize_skills
+        initialize_skills()
+    
+    return (
+        tuple(sorted(st.session_state.skill_levels.items())),
+        get_config("app.default_language") or "en",
+        get_config("gameplay.max_skill_level") or 5,
+        st.session_state.shop_level if 'shop_level' in st.session_state else 1
+    )
+
+def display_progress_indicator():
+    """Display a persistent progress indicator showing skills and completion status."""
+    skill_levels, lang, max_level, _ = _get_dashboard_state()
+    st.markdown(render_progress_indicator(skill_levels, lang, max_level), unsafe_allow_html=True)
+
+def display_shop_growth_visualization():
+    """Display a visual representation of shop growth levels."""
+    _, lang, _, shop_level = _get_dashboard_state()
+    st.markdown(render_shop_growth(shop_level, lang), unsafe_allow_html=True)
+
+def display_progress_dashboard():
+    """Display the skills progress and shop growth panels as a single element.
+    
+    The HTML is only rebuilt when the skill levels, language or shop level
+    change; otherwise the cached fragment is sent as is.
+    """
+    skill_levels, lang, max_level, shop_level = _get_dashboard_state()
+    st.markdown(
+        render_progress_indicator(skill_levels, lang, max_level)
+        + _SPACER_HTML
+        + render_shop_growth(shop_level, lang),
+        unsafe_allow_html=True
+    )
 
 def show_breadcrumb_navigation():
     """Display just the breadcrumb navigation."""
@@ -266,10 +241,11 @@ def show_save_progress_button():
         if st.button(save_text, key="save_progress_button"):
             # Save progress to database
             from utils.db import save_session_state_to_db
-            save_session_state_to_db()
-            
-            # Show confirmation
-            st.success("Progress saved successfully!")
+            if save_session_state_to_db(force=True):
+                # Show confirmation
+                st.success("Progress saved successfully!")
+            else:
+                st.error("Could not save progress right now. It will be saved automatically later.")
 
 def show_progress_dashboard():
     """Display the complete progress dashboard including breadcrumbs, progress indicators, and shop growth."""
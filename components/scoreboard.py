@@ -2,9 +2,8 @@
 Scoreboard and progress display components for Toko Pintar application.
 """
 import streamlit as st
-import pandas as pd
 from utils.config import get_config
-from utils.i18n import tr
+from utils.i18n import get_translator, tr
 
 def display_score_sidebar():
     """Display the player's score and stats in the sidebar."""
@@ -44,14 +43,15 @@ def display_game_results(results):
     Args:
         results (dict): Game results including score, skill updates, etc.
     """
-    st.markdown(f"### {tr('game_results')}")
+    t = get_translator()
+    st.markdown(f"### {t('game_results')}")
     
     # Show score
-    st.markdown(f'<p class="score-text">{tr("score")}: {results["score"]} {tr("points")}</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="score-text">{t("score")}: {results["score"]} {t("points")}</p>', unsafe_allow_html=True)
     
     # Show skill improvements
     if "updated_skills" in results and results["updated_skills"]:
-        st.markdown(f"#### {tr('skill_improvements')}")
+        st.markdown(f"#### {t('skill_improvements')}")
         
         from utils.skills import get_skill_name, get_skill_icon
         lang = get_config("app.default_language") or "en"
@@ -64,7 +64,7 @@ def display_game_results(results):
     
     # Show new achievements
     if "new_achievements" in results and results["new_achievements"]:
-        st.markdown(f"#### {tr('new_achievements')}")
+        st.markdown(f"#### {t('new_achievements')}")
         st.balloons()
         
         for achievement in results["new_achievements"]:
@@ -76,11 +76,11 @@ def display_game_results(results):
             """, unsafe_allow_html=True)
     
     # Show total score
-    st.markdown(f"**{tr('total_score')}: {results['total_score']:,}")
+    st.markdown(f"**{t('total_score')}: {results['total_score']:,}")
     
     # Shop level update
     if "old_shop_level" in results and results["old_shop_level"] != results["shop_level"]:
-        st.success(tr('shop_upgraded', shop_level=results['shop_level']))
+        st.success(t('shop_upgraded', shop_level=results['shop_level']))
 
 def display_game_history_table():
     """Display game history in a table format."""
@@ -112,6 +112,7 @@ def display_game_history_table():
         })
     
     # Create and display the table
+    import pandas as pd
     df = pd.DataFrame(display_data)
     st.table(df)
 
@@ -162,6 +163,7 @@ def display_educational_tip(category):
     Args:
         category (str): Tip category (inventory, cash, pricing, etc.)
     """
+    t = get_translator()
     # Use the more comprehensive tips from the learning module if possible
     from components.learning.real_world_tips import get_tips_for_skill, display_pro_tip
     
@@ -193,29 +195,29 @@ def display_educational_tip(category):
     # Fallback to simple tips if no advanced tips available
     simple_tips = {
         "inventory": [
-            tr('inventory_tip1'),
-            tr('inventory_tip2'),
-            tr('inventory_tip3')
+            t('inventory_tip1'),
+            t('inventory_tip2'),
+            t('inventory_tip3')
         ],
         "cash": [
-            tr('cash_tip1'),
-            tr('cash_tip2'),
-            tr('cash_tip3')
+            t('cash_tip1'),
+            t('cash_tip2'),
+            t('cash_tip3')
         ],
         "pricing": [
-            tr('pricing_tip1'),
-            tr('pricing_tip2'),
-            tr('pricing_tip3')
+            t('pricing_tip1'),
+            t('pricing_tip2'),
+            t('pricing_tip3')
         ],
         "customer": [
-            tr('customer_tip1'),
-            tr('customer_tip2'),
-            tr('customer_tip3')
+            t('customer_tip1'),
+            t('customer_tip2'),
+            t('customer_tip3')
         ],
         "bookkeeping": [
-            tr('bookkeeping_tip1'),
-            tr('bookkeeping_tip2'),
-            tr('bookkeeping_tip3')
+            t('bookkeeping_tip1'),
+            t('bookkeeping_tip2'),
+            t('bookkeeping_tip3')
         ]
     }
     
@@ -226,7 +228,7 @@ def display_educational_tip(category):
         st.markdown(f"""
         <div style="background-color: #E3F2FD; border-left: 4px solid #42A5F5; 
              padding: 15px; margin: 15px 0; border-radius: 4px;">
-            <strong>{tr('tip')}:</strong> {tip_content}
+            <strong>{t('tip')}:</strong> {tip_content}
         </div>
         """, unsafe_allow_html=True)
         
@@ -46,18 +46,3 @@ def show_user_login():
             st.success(tr("success_welcome", player_name=name))
             st.rerun()
 
-# ---
-# You will need to add the following method to your DatabaseManager class in utils/db.py:
-#
-# def get_user_by_name_and_shop(self, name, shop_name):
-#     conn = self.get_connection()
-#     cursor = conn.cursor()
-#     try:
-#         cursor.execute(
-#             "SELECT * FROM users WHERE name = ? AND (metadata LIKE ? OR metadata LIKE ?)",
-#             (name, f'%\"shop_name\": \"{shop_name}\"%', f'%\"shop_name\": \"{shop_name}\"%')
-#         )
-#         row = cursor.fetchone()
-#         return dict(row) if row else None
-#     finally:
-#         self.close_connection()
@@ -2,19 +2,18 @@
 Change Making mini-game for Toko Pintar application.
 """
 import streamlit as st
-import random
 import time
-import pandas as pd
 from utils.config import get_config, get_product_emoji
-from utils.skills import update_skills
+from utils.skills import score_round
 from components.scoreboard import display_educational_tip
-from utils.db import db
 from utils.tooltips import show_mechanics_tooltip_button, add_tooltips_to_page
 from utils.game_levels import display_level_selection, display_level_header, display_timer, display_score_breakdown
 from utils.game_ui import display_product_card, display_result_container, display_accuracy_gauge
 from utils.educational_content import display_learning_insight, display_formula_explanation
 from games.breadcrumb import show_game_breadcrumb
-from utils.i18n import tr
+from utils.i18n import get_translator, tr
+from utils.change_solver import DEFAULT_MAX_AMOUNT, RUPIAH_DENOMINATIONS, get_solver, greedy_change, solve_change
+from utils.challenge_pool import challenge_pool
 
 def get_level_description(level):
     """Get description text for each level.
@@ -25,26 +24,27 @@ def get_level_description(level):
     Returns:
         dict: Descriptions in English and Indonesian
     """
+    t = get_translator()
     descriptions = {
         1: {
-            "en": tr('level_1_description'),
-            "id": tr('level_1_description_id')
+            "en": t('level_1_description'),
+            "id": t('level_1_description_id')
         },
         2: {
-            "en": tr('level_2_description'),
-            "id": tr('level_2_description_id')
+            "en": t('level_2_description'),
+            "id": t('level_2_description_id')
         },
         3: {
-            "en": tr('level_3_description'),
-            "id": tr('level_3_description_id')
+            "en": t('level_3_description'),
+            "id": t('level_3_description_id')
         },
         4: {
-            "en": tr('level_4_description'),
-            "id": tr('level_4_description_id')
+            "en": t('level_4_description'),
+            "id": t('level_4_description_id')
         },
         5: {
-            "en": tr('level_5_description'),
-            "id": tr('level_5_description_id')
+            "en": t('level_5_description'),
+            "id": t('level_5_description_id')
         }
     }
     
@@ -59,26 +59,27 @@ def get_level_tips(level):
     Returns:
         dict: Tips in English and Indonesian
     """
+    t = get_translator()
     tips = {
         1: {
-            "en": tr('level_1_tip'),
-            "id": tr('level_1_tip_id')
+            "en": t('level_1_tip'),
+            "id": t('level_1_tip_id')
         },
         2: {
-            "en": tr('level_2_tip'),
-            "id": tr('level_2_tip_id')
+            "en": t('level_2_tip'),
+            "id": t('level_2_tip_id')
         },
         3: {
-            "en": tr('level_3_tip'),
-            "id": tr('level_3_tip_id')
+            "en": t('level_3_tip'),
+            "id": t('level_3_tip_id')
         },
         4: {
-            "en": tr('level_4_tip'),
-            "id": tr('level_4_tip_id')
+            "en": t('level_4_tip'),
+            "id": t('level_4_tip_id')
         },
         5: {
-            "en": tr('level_5_tip'),
-            "id": tr('level_5_tip_id')
+            "en": t('level_5_tip'),
+            "id": t('level_5_tip_id')
         }
     }
     
@@ -90,89 +91,8 @@ def initialize_transaction(level=1):
     Args:
         level (int): Game difficulty level
     """
-    # Get products from database
-    all_products = db.get_products()
-    if not all_products:
-        # Fall back to sample products if database is empty
-        from utils.config import SAMPLE_PRODUCTS
-        all_products = SAMPLE_PRODUCTS
-    
-    # Determine number of items based on level
-    if level == 1:
-        num_items = 1  # Single item for beginners
-    elif level == 2:
-        num_items = 2  # Two items for level 2
-    elif level == 3:
-        num_items = 3  # Three items for level 3
-    else:
-        num_items = random.randint(3, 5)  # Multiple items for advanced levels
-    
-    # Generate a random purchase
-    items_bought = random.sample(all_products, min(num_items, len(all_products)))
-    
-    # Calculate total price based on level
-    if level == 1:
-        # Level 1: Use actual price, do not round
-        total_price = sum(item["sell_price"] for item in items_bought)
-    elif level == 2:
-        # Level 2: Round to nearest 500 for slightly more complex calculation
-        total_price = round(sum(item["sell_price"] for item in items_bought) / 500) * 500
-    else:
-        # Higher levels: Use exact prices
-        total_price = sum(item["sell_price"] for item in items_bought)
-    
-    # Indonesian Rupiah denominations
-    denominations = [100000, 50000, 20000, 10000, 5000, 2000, 1000, 500, 200, 100]
-    
-    # Generate payment amount (ensure it's larger than total price)
-    payment_amount = 0
-    
-    if level == 1:
-        # Level 1: Payment is a single large bill for easier calculation
-        for denom in denominations:
-            if denom > total_price and denom <= 50000:  # Limit to 50k for beginners
-                payment_amount = denom
-                break
-        
-        # If no suitable denomination found, use 50000
-        if payment_amount == 0:
-            payment_amount = 50000
-    
-    elif level == 2:
-        # Level 2: Payment is 1-2 notes with simpler change calculation
-        # Use top 4 denominations for level 2
-        payment_options = denominations[:4]  
-        payment_amount = payment_options[random.randint(0, len(payment_options) - 1)]
-        
-        while payment_amount <= total_price:
-            payment_amount += payment_options[random.randint(0, len(payment_options) - 1)]
-    
-    elif level == 3:
-        # Level 3: More complex payment with multiple denominations
-        num_notes = random.randint(1, 2)
-        for _ in range(num_notes):
-            payment_amount += denominations[random.randint(0, 6)]  # Use first 7 denominations
-        
-        while payment_amount <= total_price:
-            payment_amount += denominations[random.randint(0, 6)]
-    
-    elif level == 4:
-        # Level 4: Complex payment with time pressure
-        num_notes = random.randint(2, 3)
-        for _ in range(num_notes):
-            payment_amount += denominations[random.randint(0, 7)]  # Use first 8 denominations
-        
-        while payment_amount <= total_price:
-            payment_amount += denominations[random.randint(0, 7)]
-    
-    else:
-        # Level 5: Maximum complexity
-        num_notes = random.randint(2, 4)
-        for _ in range(num_notes):
-            payment_amount += denominations[random.randint(0, 9)]  # Use all denominations
-        
-        while payment_amount <= total_price:
-            payment_amount += denominations[random.randint(0, 9)]
+    # Pre-generated, validated transaction from the challenge pool
+    challenge = challenge_pool.take("change_making", level)
     
     # Set time limit based on level
     time_limits = {
@@ -186,10 +106,11 @@ def initialize_transaction(level=1):
     # Store transaction details
     st.session_state.change_making = {
         "level": level,
-        "items": items_bought,
-        "total_price": total_price,
-        "payment": payment_amount,
-        "correct_change": payment_amount - total_price,
+        "seed": challenge["seed"],
+        "items": challenge["items"],
+        "total_price": challenge["total_price"],
+        "payment": challenge["payment"],
+        "correct_change": challenge["correct_change"],
         "user_change": 0,
         "start_time": time.time(),
         "time_limit": time_limits.get(level),
@@ -199,6 +120,7 @@ def initialize_transaction(level=1):
 
 def change_making_game():
     """Change making mini-game implementation (UI Overhaul)."""
+    t = get_translator()
     lang = get_config("app.default_language") or "en"
     
     # --- HEADER ---
@@ -209,7 +131,7 @@ def change_making_game():
             </span>
         </div>
     """, unsafe_allow_html=True)
-    st.markdown(f"<div style='text-align:center;color:#444;margin-bottom:20px;'>{tr('change_making_instructions')}</div>", unsafe_allow_html=True)
+    st.markdown(f"<div style='text-align:center;color:#444;margin-bottom:20px;'>{t('change_making_instructions')}</div>", unsafe_allow_html=True)
     
     display_educational_tip("cash")
     col1, col2 = st.columns([3, 1])
@@ -228,7 +150,7 @@ def change_making_game():
     if game.get("time_limit"):
         remaining_time = display_timer(game["start_time"], game["time_limit"])
         if remaining_time <= 0 and not game.get("submitted"):
-            st.warning((tr('time_up')) + " Your answer has been submitted.")
+            st.warning((t('time_up')) + " Your answer has been submitted.")
             game["submitted"] = True
             st.rerun()
     
@@ -257,25 +179,25 @@ def change_making_game():
         <div style='background:#e8f5e9;padding:15px 15px 8px 15px;border-radius:10px;box-shadow:0 2px 8px #eee;margin-bottom:18px;'>
             <span style='font-size:1.1rem;font-weight:bold;'>💰 {tr('customer_pays_with')}</span>
     """, unsafe_allow_html=True)
-    denominations = [100000, 50000, 20000, 10000, 5000, 2000, 1000, 500, 200, 100]
+    denominations = list(RUPIAH_DENOMINATIONS)
     payment_left = payment
     for denom in denominations:
         count = payment_left // denom
         if count > 0:
             st.markdown(f"<div style='display:inline-block;background:#5DADE2;color:white;width:68px;height:38px;margin:3px 3px 8px 0;text-align:center;border-radius:5px;line-height:38px;font-weight:bold;'>Rp {denom:,}</div>", unsafe_allow_html=True)
             payment_left %= denom
-    st.markdown(f"<div style='margin-top:6px;font-weight:bold;'>{tr('total_payment')}: <span class='cash-amount'>Rp {payment:,}</span></div>", unsafe_allow_html=True)
+    st.markdown(f"<div style='margin-top:6px;font-weight:bold;'>{t('total_payment')}: <span class='cash-amount'>Rp {payment:,}</span></div>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
     
     # --- CHANGE INPUT AREA ---
-    change_label = tr('change_label')
+    change_label = t('change_label')
     
     if level >= 4 and not game.get("submitted"):
         # Denomination selection UI
         if "selected_denominations" not in game:
             game["selected_denominations"] = {denom: 0 for denom in denominations}
-        st.markdown(f"<div style='margin-bottom:10px;'><b>{tr('select_bills_coins')}</b></div>", unsafe_allow_html=True)
+        st.markdown(f"<div style='margin-bottom:10px;'><b>{t('select_bills_coins')}</b></div>", unsafe_allow_html=True)
         denom_cols = st.columns(len(denominations))
         for i, denom in enumerate(denominations):
             with denom_cols[i]:
@@ -291,10 +213,10 @@ def change_making_game():
                         game["selected_denominations"][denom] += 1
         selected_total = sum(denom * count for denom, count in game["selected_denominations"].items())
         game["user_change"] = selected_total
-        st.markdown(f"<div style='margin-top:10px;font-weight:bold;'>{tr('your_selected_change')}: <span class='cash-amount'>Rp {selected_total:,}</span></div>", unsafe_allow_html=True)
+        st.markdown(f"<div style='margin-top:10px;font-weight:bold;'>{t('your_selected_change')}: <span class='cash-amount'>Rp {selected_total:,}</span></div>", unsafe_allow_html=True)
         if any(count > 0 for count in game["selected_denominations"].values()):
             selected_notes = [f"{count} x Rp {denom:,}" for denom, count in game["selected_denominations"].items() if count > 0]
-            st.markdown(f"<div style='margin-bottom:8px;'>{tr('you_are_giving')}: {', '.join(selected_notes)}</div>", unsafe_allow_html=True)
+            st.markdown(f"<div style='margin-bottom:8px;'>{t('you_are_giving')}: {', '.join(selected_notes)}</div>", unsafe_allow_html=True)
     elif level < 4 and not game.get("submitted"):
         st.markdown(f"<h3 style='margin-bottom:12px;'>{change_label}</h3>", unsafe_allow_html=True)
         # Only allow answer selection from provided options, not free number input
@@ -312,7 +234,7 @@ def change_making_game():
             st.markdown(f"<div style='background:white;padding:12px 0 8px 0;border-radius:7px;border:1px solid #b3c7e6;margin:10px 0 0 0;text-align:right;'><span style='font-size:1.4rem;font-family:monospace;color:#2E7D32;'>Rp {game['user_change']:,}</span></div>", unsafe_allow_html=True)
     
     # --- SUBMIT BUTTON ---
-    check_text = tr('check_my_answer')
+    check_text = t('check_my_answer')
     if st.button(check_text) or game.get("submitted"):
         game["submitted"] = True
         user_change = game["user_change"]
@@ -323,19 +245,18 @@ def change_making_game():
         else:
             display_result_container(False, game["correct_change"], user_change, "currency", lang)
         # Score, feedback, and progress update
-        results = update_skills("change_making", base_score)
-        st.write("DEBUG: Skill levels after update", st.session_state.skill_levels)
+        results = score_round(game, "change_making", base_score, {"level": level, "seed": game.get("seed")})
         # Show educational summary and next steps
         display_educational_tip("cash")
         col1, col2 = st.columns(2)
         with col1:
-            path_text = tr('go_to_learning_path')
+            path_text = t('go_to_learning_path')
             if st.button(path_text, key="go_to_cash_learning_path"):
                 st.session_state.current_game = None
                 st.session_state.selected_learning_path = "cash"
                 st.rerun()
         with col2:
-            continue_text = tr('continue_to_main_menu')
+            continue_text = t('continue_to_main_menu')
             if st.button(continue_text, key="continue_cash_main_menu"):
                 if "change_making" in st.session_state:
                     del st.session_state.change_making
@@ -352,42 +273,37 @@ def is_optimal_change(selected_denominations, amount):
     Returns:
         bool: True if the solution is optimal (minimum number of bills/coins)
     """
-    # Get the optimal solution
-    optimal = get_optimal_denominations(amount)
-    
     # Count total pieces in selected solution
     selected_count = sum(selected_denominations.values())
     
-    # Count total pieces in optimal solution
-    optimal_count = sum(optimal.values())
+    # Fewest pieces possible, straight from the solver table
+    optimal_count = -1
+    if 0 <= amount <= DEFAULT_MAX_AMOUNT:
+        optimal_count = get_solver().min_pieces(amount)
+    if optimal_count < 0:
+        # Outside the table or not payable exactly: count greedily
+        optimal_count = sum(greedy_change(amount).values())
     
     # Selected is optimal if it uses the same or fewer pieces
     return selected_count <= optimal_count + 1  # Allow 1 extra piece for flexibility
 
-def get_optimal_denominations(amount):
+def get_optimal_denominations(amount, denominations=RUPIAH_DENOMINATIONS):
     """Get the optimal denomination combination for a given amount.
     
     Args:
         amount (int): The amount to make change for
+        denominations (iterable, optional): Available denominations.
+            Defaults to Indonesian Rupiah.
     
     Returns:
-        dict: Dict of denomination: count pairs
+        dict: Dict of denomination: count pairs. Amounts outside the solver
+            table, or that cannot be paid exactly, get the greedy solution.
     """
-    # Indonesian Rupiah denominations
-    denominations = [100000, 50000, 20000, 10000, 5000, 2000, 1000, 500, 200, 100]
-    
-    # Initialize result
-    result = {denom: 0 for denom in denominations}
-    
-    # Greedy algorithm for change-making
-    remaining = amount
-    for denom in denominations:
-        if remaining >= denom:
-            count = remaining // denom
-            result[denom] = count
-            remaining -= count * denom
-    
-    return result
+    if 0 <= amount <= DEFAULT_MAX_AMOUNT:
+        optimal = solve_change(amount, denominations)
+        if optimal is not None:
+            return optimal
+    return greedy_change(amount, denominations)
 
 # Helper function to provide game information
 def get_game_info():
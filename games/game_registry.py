@@ -1,41 +1,91 @@
-import streamlit as st
+"""
+Game registry for Toko Pintar application.
 
-# Game registry with lazy imports to avoid circular dependencies
+Games are declared in games/manifest.json with only what is needed to
+load them lazily: id, module and game function. Everything else about a
+game (names, skills, levels) comes from its module's get_game_info(). The
+manifest is read once per process; a game's module is only imported when
+its function or info is first needed, and info dicts are built once per
+language.
+"""
+import os
+import json
+import importlib
+import threading
+from functools import lru_cache
+from utils.i18n import get_lang_code
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), 'manifest.json')
+
+_manifest = None
+_manifest_lock = threading.Lock()
+
+def load_manifest():
+    """Get the game manifest, reading it on first use.
+    
+    Returns:
+        dict: game_id -> manifest entry, in manifest order
+    """
+    global _manifest
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)["games"]
+                _manifest = {entry["id"]: entry for entry in entries}
+    return _manifest
+
+def get_game_manifest(game_id):
+    """Get a game's manifest entry without importing the game.
+    
+    Returns:
+        dict: id, module and function, or None if the game is not registered
+    """
+    return load_manifest().get(game_id)
+
+@lru_cache(maxsize=None)
+def _import_game(game_id):
+    return importlib.import_module(load_manifest()[game_id]["module"])
 
 def get_game_function(game_id):
-    if game_id == "inventory_game":
-        from games.inventory_game import inventory_game
-        return inventory_game
-    elif game_id == "change_making":
-        from games.change_making import change_making_game
-        return change_making_game
-    elif game_id == "margin_calculator":
-        from games.margin_calculator import margin_calculator_game
-        return margin_calculator_game
-    elif game_id == "simple_calculator":
-        from games.simple_calculator import simple_calculator_game
-        return simple_calculator_game
-    return None
+    """Get the game function for a given game ID.
+    
+    Args:
+        game_id (str): The game identifier
+        
+    Returns:
+        function: The game function, or None if not found
+    """
+    entry = get_game_manifest(game_id)
+    if entry is None:
+        return None
+    return getattr(_import_game(game_id), entry["function"])
+
+@lru_cache(maxsize=64)
+def _get_game_info(game_id, lang_code):
+    # The games' get_game_info() translate with the session language, which
+    # is part of the cache key
+    return _import_game(game_id).get_game_info()
 
 def get_game_info(game_id):
-    if game_id == "inventory_game":
-        from games.inventory_game import get_game_info as info
-        return info()
-    elif game_id == "change_making":
-        from games.change_making import get_game_info as info
-        return info()
-    elif game_id == "margin_calculator":
-        from games.margin_calculator import get_game_info as info
-        return info()
-    elif game_id == "simple_calculator":
-        from games.simple_calculator import get_game_info as info
-        return info()
-    return None
+    """Get information about a game.
+    
+    The dict is shared between callers and must not be modified.
+    
+    Args:
+        game_id (str): The game identifier
+        
+    Returns:
+        dict: Game information, or None if not found
+    """
+    if get_game_manifest(game_id) is None:
+        return None
+    return _get_game_info(game_id, get_lang_code())
 
 def get_all_games():
-    return {
-        "inventory_game": get_game_info("inventory_game"),
-        "change_making": get_game_info("change_making"),
-        "margin_calculator": get_game_info("margin_calculator"),
-        "simple_calculator": get_game_info("simple_calculator"),
-    }
+    """Get all registered games.
+    
+    Returns:
+        dict: Dict of game_id -> game_info pairs
+    """
+    return {game_id: get_game_info(game_id) for game_id in load_manifest()}
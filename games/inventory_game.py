@@ -2,169 +2,29 @@
 Inventory Counting mini-game for Toko Pintar application.
 """
 import streamlit as st
-import random
 import time
-from utils.config import get_config, SAMPLE_PRODUCTS
-from utils.skills import update_skills
+from utils.config import get_config
+from utils.skills import score_round
 from components.scoreboard import display_educational_tip
-from utils.db import db
 from utils.tooltips import show_mechanics_tooltip_button, add_tooltips_to_page
 import os
 from games.breadcrumb import show_game_breadcrumb
-from utils.i18n import tr
+from utils.i18n import get_translator, tr
+from utils.challenge_pool import challenge_pool
+from utils.visualization import render_inventory_card
 
 def generate_widget_key(*args):
     """Generate a unique widget key by joining all arguments with underscores."""
     return "_".join(str(arg) for arg in args)
 
-def get_game_products(level=1):
-    """Get products for the game based on level.
-    
-    Args:
-        level (int): Game difficulty level
-    
-    Returns:
-        list: List of product dictionaries
-    """
-    # Get products from database
-    all_products = db.get_products()
-    if not all_products:
-        # Fall back to sample products if database is empty
-        all_products = SAMPLE_PRODUCTS
-    
-    # Select products based on level
-    if level == 1:
-        # Level 1: 3 simple products (no similar items)
-        # Group products by category to avoid similar items
-        products_by_category = {}
-        for product in all_products:
-            category = product.get('category', 'Uncategorized')
-            if category not in products_by_category:
-                products_by_category[category] = []
-            products_by_category[category].append(product)
-        
-        # Select one product from each of the three most distinct categories
-        selected_products = []
-        for category in list(products_by_category.keys())[:3]:
-            if products_by_category[category]:
-                selected_products.append(random.choice(products_by_category[category]))
-        
-        # If we have fewer than 3 categories, fill with random products
-        while len(selected_products) < 3 and all_products:
-            product = random.choice(all_products)
-            if product not in selected_products:
-                selected_products.append(product)
-                
-        return selected_products
-    
-    elif level == 2:
-        # Level 2: 5 products including similar items that must be correctly categorized
-        # Ensure some similar products are included
-        categories = set(p.get('category', 'Uncategorized') for p in all_products)
-        selected_products = []
-        
-        # Choose 2-3 categories
-        selected_categories = random.sample(list(categories), min(3, len(categories)))
-        
-        # For each selected category, add 1-2 products
-        for category in selected_categories:
-            category_products = [p for p in all_products if p.get('category', 'Uncategorized') == category]
-            num_to_select = min(2, len(category_products))
-            selected_products.extend(random.sample(category_products, num_to_select))
-        
-        # If we still need more products, add random ones
-        while len(selected_products) < 5 and len(selected_products) < len(all_products):
-            product = random.choice(all_products)
-            if product not in selected_products:
-                selected_products.append(product)
-                
-        return selected_products[:5]  # Ensure we return exactly 5 products
-    
-    elif level == 3:
-        # Level 3: 7 random products with time pressure
-        return random.sample(all_products, min(7, len(all_products)))
-    
-    elif level == 4:
-        # Level 4: 9 products with some "damaged" or "misplaced" items
-        products = random.sample(all_products, min(9, len(all_products)))
-        
-        # Mark some products as "damaged" or "misplaced"
-        # This will be used to display them differently and provide educational content
-        for i in range(min(3, len(products))):
-            issue_type = random.choice(["damaged", "misplaced"])
-            products[i]["issue"] = issue_type
-            
-        return products
-    
-    else:
-        # Level 5: Many products across multiple categories
-        num_products = min(12, len(all_products))
-        return random.sample(all_products, num_products)
-
 def initialize_game_state(level=1):
     """Initialize the inventory game state.
     
     Args:
         level (int): Game difficulty level
     """
-    # Select products for this game
-    products = get_game_products(level)
-    
-    # Set actual counts (with randomization based on level)
-    game_items = []
-    for item in products:
-        stock = item.get("stock", random.randint(5, 25))
-        
-        # Variation complexity increases with level
-        if level == 1:
-            # Level 1: Very small variations for beginners
-            variation = random.randint(-1, 1)
-        elif level == 2:
-            # Level 2: Slightly more variation
-            variation = random.randint(-2, 2)
-        elif level == 3:
-            # Level 3: Moderate variation with time pressure
-            variation = random.randint(-3, 3)
-        elif level == 4:
-            # Level 4: Higher variation and potential issues
-            variation = random.randint(-4, 4)
-            
-            # Apply additional adjustments for damaged/misplaced items
-            if "issue" in item:
-                if item["issue"] == "damaged":
-                    # Damaged items might need to be excluded from count
-                    damage_amount = random.randint(1, max(1, int(stock * 0.2)))  # Up to 20% damaged
-                    stock -= damage_amount
-                    item["damage_amount"] = damage_amount
-                elif item["issue"] == "misplaced":
-                    # Misplaced items might be in wrong category
-                    item["original_category"] = item.get("category", "Uncategorized")
-                    item["current_category"] = random.choice(["Shelf A", "Shelf B", "Back Room", "Display"])
-        else:
-            # Level 5: Maximum complexity
-            variation = random.randint(-5, 5)
-        
-        actual_count = max(0, stock + variation)
-        
-        game_item = {
-            "id": item.get("product_id", str(random.randint(1000, 9999))),
-            "name": item["name"],
-            "name_id": item.get("name_id", item["name"]),
-            "stock": stock,
-            "actual_count": actual_count,
-            "user_count": 0
-        }
-        
-        # Copy any issue-related fields
-        if "issue" in item:
-            game_item["issue"] = item["issue"]
-        if "damage_amount" in item:
-            game_item["damage_amount"] = item["damage_amount"]
-        if "original_category" in item:
-            game_item["original_category"] = item["original_category"]
-            game_item["current_category"] = item["current_category"]
-        
-        game_items.append(game_item)
+    # Pre-generated, validated round from the challenge pool
+    challenge = challenge_pool.take("inventory_game", level)
     
     # Set time limit based on level
     time_limits = {
@@ -178,7 +38,8 @@ def initialize_game_state(level=1):
     # Store in session state
     st.session_state.inventory_game = {
         "level": level,
-        "items": game_items,
+        "seed": challenge["seed"],
+        "items": challenge["items"],
         "start_time": time.time(),
         "time_limit": time_limits.get(level),
         "level_description": get_level_description(level),
@@ -194,26 +55,27 @@ def get_level_description(level):
     Returns:
         dict: Descriptions in English and Indonesian
     """
+    t = get_translator()
     descriptions = {
         1: {
-            "en": tr('level_1_description'),
-            "id": tr('level_1_description_id')
+            "en": t('level_1_description'),
+            "id": t('level_1_description_id')
         },
         2: {
-            "en": tr('level_2_description'),
-            "id": tr('level_2_description_id')
+            "en": t('level_2_description'),
+            "id": t('level_2_description_id')
         },
         3: {
-            "en": tr('level_3_description'),
-            "id": tr('level_3_description_id')
+            "en": t('level_3_description'),
+            "id": t('level_3_description_id')
         },
         4: {
-            "en": tr('level_4_description'),
-            "id": tr('level_4_description_id')
+            "en": t('level_4_description'),
+            "id": t('level_4_description_id')
         },
         5: {
-            "en": tr('level_5_description'),
-            "id": tr('level_5_description_id')
+            "en": t('level_5_description'),
+            "id": t('level_5_description_id')
         }
     }
     
@@ -228,26 +90,27 @@ def get_level_tips(level):
     Returns:
         dict: Tips in English and Indonesian
     """
+    t = get_translator()
     tips = {
         1: {
-            "en": tr('level_1_tip'),
-            "id": tr('level_1_tip_id')
+            "en": t('level_1_tip'),
+            "id": t('level_1_tip_id')
         },
         2: {
-            "en": tr('level_2_tip'),
-            "id": tr('level_2_tip_id')
+            "en": t('level_2_tip'),
+            "id": t('level_2_tip_id')
         },
         3: {
-            "en": tr('level_3_tip'),
-            "id": tr('level_3_tip_id')
+            "en": t('level_3_tip'),
+            "id": t('level_3_tip_id')
         },
         4: {
-            "en": tr('level_4_tip'),
-            "id": tr('level_4_tip_id')
+            "en": t('level_4_tip'),
+            "id": t('level_4_tip_id')
         },
         5: {
-            "en": tr('level_5_tip'),
-            "id": tr('level_5_tip_id')
+            "en": t('level_5_tip'),
+            "id": t('level_5_tip_id')
         }
     }
     
@@ -258,24 +121,19 @@ def generate_visual_inventory(product, actual_count, level=1):
     from utils.config import get_product_emoji
     product_emoji = get_product_emoji(product)
     product_name = product.get("name_id") or product.get("name", "")
-    html = "<div class='inventory-card'>"
-    html += "<div class='inventory-card-emoji-row'>"
-    for _ in range(actual_count):
-        html += f"<span class='inventory-card-emoji'>{product_emoji}</span>"
-    html += "</div>"
-    html += f"<div class='inventory-card-name'>{product_name}</div>"
-    html += "</div>"
-    return html
+    compact = bool(get_config("gameplay.compact_inventory_visuals"))
+    return render_inventory_card(product_emoji, actual_count, product_name, compact)
 
 def inventory_game():
     """Inventory counting mini-game implementation."""
+    t = get_translator()
     # Get language preference
     lang = get_config("app.default_language") or "en"
     
     # Force initialization at the start of the game function
     # This must happen before any other code that uses the session state
     if "inventory_game" not in st.session_state:
-        st.info(tr('initializing_inventory_game'))
+        st.info(t('initializing_inventory_game'))
         initialize_game_state(1)
         st.rerun()
         return
@@ -321,8 +179,8 @@ def inventory_game():
     """, unsafe_allow_html=True)
     
     # Game title
-    st.markdown(f'<p class="game-title">{tr("inventory_game_title")}</p>', unsafe_allow_html=True)
-    st.write(tr('inventory_instructions'))
+    st.markdown(f'<p class="game-title">{t("inventory_game_title")}</p>', unsafe_allow_html=True)
+    st.write(t('inventory_instructions'))
     
     # Display educational tip
     display_educational_tip("inventory")
@@ -342,7 +200,7 @@ def inventory_game():
         max_available_level = min(5, max(1, int(skill_level) + 1))
         
         # Display level selection UI
-        st.markdown("### " + tr('select_difficulty_level'))
+        st.markdown("### " + t('select_difficulty_level'))
         
         # Create level selection cards
         cols = st.columns(5)
@@ -364,12 +222,12 @@ def inventory_game():
                     <div style="padding: 10px; border-radius: 8px; border: 2px solid #4CAF50; text-align: center; margin-bottom: 10px; cursor: pointer; height: 120px;">
                         <h4 style="margin: 0;">{level_title}</h4>
                         <p style="font-size: 0.8em; margin: 5px 0; height: 40px;">{level_desc}</p>
-                        <div style="margin-top: 5px; color: #4CAF50;">{tr('unlocked')}</div>
+                        <div style="margin-top: 5px; color: #4CAF50;">{t('unlocked')}</div>
                     </div>
                     """, unsafe_allow_html=True)
                     
                     # Button to select this level
-                    if st.button(f"{tr('select_level')} {level_num}", key=generate_widget_key("button", f"select_level_{level_num}")):
+                    if st.button(f"{t('select_level')} {level_num}", key=generate_widget_key("button", f"select_level_{level_num}")):
                         level_selected = level_num
                 else:
                     # Locked level
@@ -377,7 +235,7 @@ def inventory_game():
                     <div style="padding: 10px; border-radius: 8px; border: 2px solid #ccc; text-align: center; margin-bottom: 10px; opacity: 0.7; height: 120px;">
                         <h4 style="margin: 0;">{level_title}</h4>
                         <p style="font-size: 0.8em; margin: 5px 0; height: 40px;">{level_desc}</p>
-                        <div style="margin-top: 5px; color: #888;">{tr('locked')}</div>
+                        <div style="margin-top: 5px; color: #888;">{t('locked')}</div>
                     </div>
                     """, unsafe_allow_html=True)
         
@@ -397,11 +255,11 @@ def inventory_game():
         
         # Display timer
         st.progress(remaining_time / game["time_limit"])
-        st.write(f"{tr('time_remaining')}: {int(remaining_time)} {tr('seconds')}")
+        st.write(f"{t('time_remaining')}: {int(remaining_time)} {t('seconds')}")
         
         # Auto-submit if time is up
         if remaining_time <= 0 and not game.get("submitted"):
-            st.warning(tr('time_up'))
+            st.warning(t('time_up'))
             game["submitted"] = True
             st.rerun()
     
@@ -433,7 +291,7 @@ def inventory_game():
     """, unsafe_allow_html=True)
     
     # Display tips in an info box
-    st.info(f"💡 **{tr('tip')}**: {level_tips}")
+    st.info(f"💡 **{t('tip')}**: {level_tips}")
     
     # Display each product with visual counting area and input field
     for i, item in enumerate(items):
@@ -443,12 +301,14 @@ def inventory_game():
         # Create a container for this product
         st.markdown(f"<div class='inventory-item'><strong>{display_name}</strong></div>", unsafe_allow_html=True)
         
-        # Generate and display the visual inventory to count
-        visual_inventory = generate_visual_inventory(item, item["actual_count"], level)
-        st.markdown(visual_inventory, unsafe_allow_html=True)
+        # The visual inventory is built once per round and kept with the item,
+        # so reruns while the player types counts don't rebuild it
+        if "visual_html" not in item:
+            item["visual_html"] = generate_visual_inventory(item, item["actual_count"], level)
+        st.markdown(item["visual_html"], unsafe_allow_html=True)
         
         # Input field for user's count
-        count_label = tr('your_count')
+        count_label = t('your_count')
         user_count = st.number_input(
             count_label, 
             min_value=0,
@@ -462,7 +322,7 @@ def inventory_game():
         st.markdown("---")
     
     # Submit button
-    submit_text = tr('submit_inventory_count')
+    submit_text = t('submit_inventory_count')
     if st.button(submit_text, key=generate_widget_key("button", "submit_inventory")) or game.get("submitted"):
         game["submitted"] = True
         
@@ -476,12 +336,12 @@ def inventory_game():
             
             if is_correct:
                 score += 10
-                correct_text = tr('correct')
-                you_counted = tr('you_counted')
+                correct_text = t('correct')
+                you_counted = t('you_counted')
                 results.append(f"✅ **{display_name}**: {correct_text}! {you_counted} {item['user_count']}")
             else:
-                you_counted = tr('you_counted')
-                actual_count = tr('actual_count_was')
+                you_counted = t('you_counted')
+                actual_count = t('actual_count_was')
                 results.append(f"❌ **{display_name}**: {you_counted} {item['user_count']}, {actual_count} {item['actual_count']}")
         
         # Calculate bonuses based on level
@@ -516,7 +376,7 @@ def inventory_game():
             total_bonus += accuracy_bonus
         
         # Display results
-        results_text = tr('results')
+        results_text = t('results')
         st.markdown(f"### {results_text}:")
         
         # Group results by category (correct/incorrect) for better readability
@@ -531,39 +391,39 @@ def inventory_game():
         
         # Show results in expandable sections
         if correct_results:
-            correct_text = tr('correct_items')
+            correct_text = t('correct_items')
             with st.expander(f"{correct_text} ({len(correct_results)}/{len(items)})", expanded=True):
                 for result in correct_results:
                     st.markdown(result)
         
         if incorrect_results:
-            incorrect_text = tr('incorrect_items')
+            incorrect_text = t('incorrect_items')
             with st.expander(f"{incorrect_text} ({len(incorrect_results)}/{len(items)})", expanded=True):
                 for result in incorrect_results:
                     st.markdown(result)
         
         # Show detailed score breakdown
-        st.markdown("### " + tr('score_breakdown'))
+        st.markdown("### " + t('score_breakdown'))
         
         # Base score
-        base_score_text = tr('base_score')
-        st.markdown(f"**{base_score_text}:** {10 * correct_count} points ({correct_count} {tr('correct_items')} × 10)")
+        base_score_text = t('base_score')
+        st.markdown(f"**{base_score_text}:** {10 * correct_count} points ({correct_count} {t('correct_items')} × 10)")
         
         # Bonuses
         if time_bonus > 0:
-            time_bonus_text = tr('time_bonus')
+            time_bonus_text = t('time_bonus')
             st.markdown(f"**{time_bonus_text}:** +{time_bonus} points")
         
         if level_bonus > 0:
-            level_bonus_text = tr('level_bonus')
+            level_bonus_text = t('level_bonus')
             st.markdown(f"**{level_bonus_text}:** +{level_bonus} points")
         
         if accuracy_bonus > 0:
-            accuracy_bonus_text = tr('perfect_accuracy_bonus')
+            accuracy_bonus_text = t('perfect_accuracy_bonus')
             st.markdown(f"**{accuracy_bonus_text}:** +{accuracy_bonus} points")
         
         # Total score with animation for emphasis
-        score_text = tr('total_score')
+        score_text = t('total_score')
         
         st.markdown(f"""
         <div style="margin: 15px 0; padding: 10px; background-color: #E8F5E9; border-radius: 8px; border-left: 4px solid #4CAF50;">
@@ -578,23 +438,23 @@ def inventory_game():
                 # Special celebration for perfect score at high levels
                 st.markdown(f"""
                 <div style="padding: 20px; text-align: center; background-color: #FFF9C4; border-radius: 10px; margin: 20px 0;">
-                    <h2 style="color: #FF9800; margin-bottom: 10px;">🏆 {level_text} {tr('master')}! 🏆</h2>
-                    <p style="font-size: 1.2em;">{tr('perfect_score_at_high_level')}</p>
+                    <h2 style="color: #FF9800; margin-bottom: 10px;">🏆 {level_text} {t('master')}! 🏆</h2>
+                    <p style="font-size: 1.2em;">{t('perfect_score_at_high_level')}</p>
                 </div>
                 """, unsafe_allow_html=True)
             else:
-                perfect_score = tr('perfect_score')
-                skills_excellent = tr('your_inventory_management_skills_are_excellent')
+                perfect_score = t('perfect_score')
+                skills_excellent = t('your_inventory_management_skills_are_excellent')
                 st.success(f"{perfect_score}! {skills_excellent}")
         elif accuracy >= 80:
-            good_job = tr('good_job')
-            st.success(f"{good_job}! {int(accuracy)}% {tr('accuracy_is_very_good')}")
+            good_job = t('good_job')
+            st.success(f"{good_job}! {int(accuracy)}% {t('accuracy_is_very_good')}")
         
         # Update player progress
-        results = update_skills("inventory_game", score)
+        results = score_round(game, "inventory_game", score, {"level": level, "seed": game.get("seed")})
         
         # Show detailed feedback based on performance
-        st.markdown("### " + tr('learning_insights'))
+        st.markdown("### " + t('learning_insights'))
         
         # Calculate accuracy percentage
         correct_count = sum(1 for item in items if item["user_count"] == item["actual_count"])
@@ -603,7 +463,7 @@ def inventory_game():
         # Display accuracy gauge
         st.markdown(f"""
         <div style="margin: 20px 0;">
-            <p style="margin-bottom: 5px;">{tr('accuracy')}</p>
+            <p style="margin-bottom: 5px;">{t('accuracy')}</p>
             <div style="height: 10px; background-color: #EEEEEE; border-radius: 5px;">
                 <div style="height: 100%; width: {accuracy}%; background-color: {'#4CAF50' if accuracy >= 70 else '#FFC107' if accuracy >= 40 else '#F44336'}; border-radius: 5px;"></div>
             </div>
@@ -617,14 +477,14 @@ def inventory_game():
         
         # Personalized feedback based on performance
         if accuracy == 100:
-            st.success(tr('excellent_work'))
+            st.success(t('excellent_work'))
             
             # Suggest moving to a harder level
             if level < 5:
-                next_level_text = tr('try_the_next_level')
-                st.info(f"{next_level_text} {tr('for_a_greater_challenge')}")
+                next_level_text = t('try_the_next_level')
+                st.info(f"{next_level_text} {t('for_a_greater_challenge')}")
         elif accuracy >= 80:
-            st.success(tr('great_job'))
+            st.success(t('great_job'))
             
             # Provide a specific tip for improvement
             if level >= 3:
@@ -634,7 +494,7 @@ def inventory_game():
                 </div>
                 """, unsafe_allow_html=True)
         elif accuracy >= 50:
-            st.warning(tr('not_bad_but_room_for_improvement'))
+            st.warning(t('not_bad_but_room_for_improvement'))
             
             # Specific advice based on level
             if level <= 2:
@@ -650,7 +510,7 @@ def inventory_game():
                 </div>
                 """, unsafe_allow_html=True)
         else:
-            st.error(tr('your_accuracy_needs_improvement'))
+            st.error(t('your_accuracy_needs_improvement'))
             
             # Basic advice for struggling players
             st.markdown("""
@@ -663,7 +523,7 @@ def inventory_game():
         from components.learning.real_world_tips import get_real_world_applications
         applications = get_real_world_applications("inventory_management", 1)
         if applications and lang in applications:
-            with st.expander(tr('see_real_world_examples')):
+            with st.expander(t('see_real_world_examples')):
                 st.markdown(applications[lang])
         
         # Learning path suggestion
@@ -675,14 +535,14 @@ def inventory_game():
         """, unsafe_allow_html=True)
         
         # Learning path button
-        path_text = tr('go_to_learning_path')
+        path_text = t('go_to_learning_path')
         if st.button(path_text, key=generate_widget_key("button", "go_to_learning_path")):
             st.session_state.current_game = None
             st.session_state.selected_learning_path = "inventory"
             st.rerun()
         
         # Continue button
-        continue_text = tr('continue_to_main_menu')
+        continue_text = t('continue_to_main_menu')
         if st.button(continue_text, key=generate_widget_key("button", "continue_main_menu")):
             # Clean up game state
             if "inventory_game" in st.session_state:
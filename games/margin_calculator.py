@@ -2,13 +2,13 @@
 Margin Calculator mini-game for Toko Pintar application.
 """
 import streamlit as st
-import random
 import time
 from utils.config import get_config
-from utils.skills import update_skills
+from utils.skills import score_round
 from components.scoreboard import display_educational_tip
-from utils.db import db
-from utils.i18n import tr
+from utils.i18n import get_translator
+from utils.challenge_pool import challenge_pool
+from utils.challenges import ANSWER_TOLERANCES, MARGIN_BASE_SCORES, is_answer_correct
 
 def initialize_margin_challenge(level=1):
     """Initialize a margin calculation challenge based on level.
@@ -16,105 +16,9 @@ def initialize_margin_challenge(level=1):
     Args:
         level (int): Game difficulty level
     """
-    # Get products from database
-    all_products = db.get_products()
-    if not all_products:
-        # Fall back to sample products if database is empty
-        from utils.config import SAMPLE_PRODUCTS
-        all_products = SAMPLE_PRODUCTS
-    
-    # Select a random product
-    product = random.choice(all_products)
-    
-    # Choose challenge type based on level
-    if level == 1:
-        # Level 1: Find selling price given buy price and margin (simple)
-        challenge_type = "find_sell_price"
-        target_margin = random.randint(20, 40)  # Simple margins
-        # Round to nearest 100
-        correct_sell_price = round(product["buy_price"] * (1 + target_margin/100), -2)
-        
-        challenge = {
-            "level": level,
-            "product": product,
-            "type": challenge_type,
-            "target_margin": target_margin,
-            "correct_answer": correct_sell_price,
-            "user_answer": 0
-        }
-    
-    elif level == 2:
-        # Level 2: Find margin percentage given buy and sell price
-        challenge_type = "find_margin_percent"
-        # Calculate the correct margin
-        correct_margin = round(((product["sell_price"] - product["buy_price"]) / product["buy_price"]) * 100)
-        
-        challenge = {
-            "level": level,
-            "product": product,
-            "type": challenge_type,
-            "correct_answer": correct_margin,
-            "user_answer": 0
-        }
-    
-    elif level == 3:
-        # Level 3: Find profit given buy price, sell price, and quantity
-        challenge_type = "find_profit"
-        quantity = random.randint(5, 15)
-        correct_profit = (product["sell_price"] - product["buy_price"]) * quantity
-        
-        challenge = {
-            "level": level,
-            "product": product,
-            "type": challenge_type,
-            "quantity": quantity,
-            "correct_answer": correct_profit,
-            "user_answer": 0
-        }
-    
-    elif level == 4:
-        # Level 4: Find break-even point given fixed costs and margins
-        challenge_type = "find_breakeven"
-        fixed_cost = random.randint(1, 5) * 100000  # Between 100K and 500K
-        margin_per_unit = product["sell_price"] - product["buy_price"]
-        correct_units = round(fixed_cost / margin_per_unit)
-        
-        challenge = {
-            "level": level,
-            "product": product,
-            "type": challenge_type,
-            "fixed_cost": fixed_cost,
-            "correct_answer": correct_units,
-            "user_answer": 0
-        }
-    
-    else:
-        # Level 5: Find optimal price given elasticity
-        challenge_type = "find_optimal_price"
-        current_price = product["sell_price"]
-        current_demand = random.randint(50, 200)
-        elasticity = round(random.uniform(0.8, 2.0), 1)  # Price elasticity of demand
-        
-        # Current revenue
-        current_revenue = current_price * current_demand
-        
-        # Optimal price given elasticity
-        if elasticity != 1:
-            optimal_markup = 1 / (elasticity - 1)
-            optimal_price = round(product["buy_price"] * (1 + optimal_markup), -2)
-        else:
-            # Special case for unit elasticity
-            optimal_price = current_price
-        
-        challenge = {
-            "level": level,
-            "product": product,
-            "type": challenge_type,
-            "current_demand": current_demand,
-            "elasticity": elasticity,
-            "correct_answer": optimal_price,
-            "user_answer": 0
-        }
+    # Pre-generated, validated challenge from the challenge pool
+    challenge = challenge_pool.take("margin_calculator", level)
+    challenge["user_answer"] = 0
     
     # Set time limit based on level
     time_limits = {
@@ -195,8 +99,8 @@ def get_level_tips(level):
             "id": "Titik impas = Biaya Tetap ÷ (Harga Jual - Harga Beli)"
         },
         5: {
-            "en": "When elasticity > 1, demand is elastic. When elasticity < 1, demand is inelastic. This affects optimal pricing.",
-            "id": "Ketika elastisitas > 1, permintaan bersifat elastis. Ketika elastisitas < 1, permintaan bersifat inelastis. Ini memengaruhi penetapan harga optimal."
+            "en": "Elasticity here is between 1 and 2, so demand is elastic. The closer it is to 1, the higher the optimal markup: Markup = 1 ÷ (Elasticity - 1).",
+            "id": "Elastisitas di sini antara 1 dan 2, jadi permintaan bersifat elastis. Semakin dekat ke 1, semakin tinggi markup optimal: Markup = 1 ÷ (Elastisitas - 1)."
         }
     }
     
@@ -204,13 +108,14 @@ def get_level_tips(level):
 
 def margin_calculator_game():
     """Margin calculator mini-game implementation."""
+    t = get_translator()
     # Get language preference
     lang = get_config("app.default_language") or "en"
     
     # Force initialization at the start of the game function
     # This must happen before any other code that uses the session state
     if "margin_calculator" not in st.session_state:
-        st.info(tr('margin_game_initializing'))
+        st.info(t('margin_game_initializing'))
         initialize_margin_challenge(1)
         st.rerun()
         return
@@ -256,8 +161,8 @@ def margin_calculator_game():
     """, unsafe_allow_html=True)
     
     # Game title
-    st.markdown(f'<p class="game-title">{tr("margin_calculator_title")}</p>', unsafe_allow_html=True)
-    st.write(tr("margin_calculator_description"))
+    st.markdown(f'<p class="game-title">{t("margin_calculator_title")}</p>', unsafe_allow_html=True)
+    st.write(t("margin_calculator_description"))
     
     # Display educational tip
     display_educational_tip("pricing")
@@ -282,7 +187,7 @@ def margin_calculator_game():
         max_available_level = min(5, max(1, int(skill_level) + 1))
         
         # Display level selection UI
-        st.markdown(f"### {tr('select_difficulty_level')}")
+        st.markdown(f"### {t('select_difficulty_level')}")
         
         # Create level selection cards
         cols = st.columns(5)
@@ -377,12 +282,12 @@ def margin_calculator_game():
     st.markdown(f"""
     <div style='display: flex; align-items: center; margin-bottom: 15px;'>
         <div style='background-color: {level_color}; color: white; padding: 5px 10px; border-radius: 15px; font-weight: bold; margin-right: 10px;'>
-            {tr('level')} {level}
+            {t('level')} {level}
         </div>
         <div style='font-size: 1.1em;'>{level_desc}</div>
     </div>
     """, unsafe_allow_html=True)
-    st.info(f"💡 **{tr('tip')}:** {level_tips}")
+    st.info(f"💡 **{t('tip')}:** {level_tips}")
     
     # Display the challenge in a more visual way
     from utils.config import get_product_emoji
@@ -409,8 +314,8 @@ def margin_calculator_game():
         if get_config("debug.enabled"):
             st.write(f"Debug - Buy price: {buy_price}, Margin: {target_margin}%, Expected: {expected_answer}, Rounded: {rounded_answer}")
         
-        buy_price_text = tr('buy_price')
-        target_margin_text = tr('target_margin')
+        buy_price_text = t('buy_price')
+        target_margin_text = t('target_margin')
         
         # Display product info in product card
         st.markdown(f"""
@@ -426,7 +331,7 @@ def margin_calculator_game():
         """, unsafe_allow_html=True)
         
         # Challenge description
-        task_text = tr('set_selling_price_task')
+        task_text = t('set_selling_price_task')
         
         # Show formula guidance for lower levels
         if level <= 2:
@@ -453,7 +358,7 @@ def margin_calculator_game():
         # Visual calculator-style input
         st.markdown("<div style='background-color: #f1f8e9; padding: 15px; border-radius: 10px; margin-bottom: 20px;'>", unsafe_allow_html=True)
         
-        input_label = tr('selling_price_input_label')
+        input_label = t('selling_price_input_label')
         st.markdown(f"<h4>{input_label}</h4>", unsafe_allow_html=True)
         
         # --- Quick Calculator: placed directly below the input label ---
@@ -498,8 +403,8 @@ def margin_calculator_game():
         if get_config("debug.enabled"):
             st.write(f"Debug - Buy: {buy_price}, Sell: {sell_price}, Diff: {diff}, Margin: {expected_margin}%, Rounded: {rounded_margin}%")
         
-        buy_price_text = tr('buy_price')
-        sell_price_text = tr('sell_price')
+        buy_price_text = t('buy_price')
+        sell_price_text = t('sell_price')
         
         # Display product info in product card
         st.markdown(f"""
@@ -514,7 +419,7 @@ def margin_calculator_game():
         </div>
         """, unsafe_allow_html=True)
         
-        task_text = tr('margin_percent_task')
+        task_text = t('margin_percent_task')
         
         # Show formula guidance for lower levels
         if level <= 2:
@@ -544,7 +449,7 @@ def margin_calculator_game():
         # Visual percentage slider
         st.markdown("<div style='background-color: #f1f8e9; padding: 15px; border-radius: 10px; margin-bottom: 20px;'>", unsafe_allow_html=True)
         
-        input_label = tr('margin_percent_input_label')
+        input_label = t('margin_percent_input_label')
         st.markdown(f"<h4>{input_label}</h4>", unsafe_allow_html=True)
         
         # Use slider for more intuitive percentage selection
@@ -583,9 +488,9 @@ def margin_calculator_game():
         if get_config("debug.enabled"):
             st.write(f"Debug - Buy: {buy_price}, Sell: {sell_price}, Profit per item: {profit_per_item}, Quantity: {quantity}, Total profit: {expected_profit}")
         
-        buy_price_text = tr('buy_price')
-        sell_price_text = tr('sell_price')
-        quantity_text = tr('quantity_sold')
+        buy_price_text = t('buy_price')
+        sell_price_text = t('sell_price')
+        quantity_text = t('quantity_sold')
         
         # Display product info in product card with quantity visualization
         st.markdown(f"""
@@ -626,7 +531,7 @@ def margin_calculator_game():
         st.markdown(item_html, unsafe_allow_html=True)
         st.markdown("</div>", unsafe_allow_html=True)
         
-        task_text = tr('profit_task')
+        task_text = t('profit_task')
         
         # Show formula guidance for lower levels
         if level <= 2:
@@ -653,7 +558,7 @@ def margin_calculator_game():
         # Visual calculator-style input
         st.markdown("<div style='background-color: #f1f8e9; padding: 15px; border-radius: 10px; margin-bottom: 20px;'>", unsafe_allow_html=True)
         
-        input_label = tr('profit_input_label')
+        input_label = t('profit_input_label')
         st.markdown(f"<h4>{input_label}</h4>", unsafe_allow_html=True)
         
         # Calculator input with Rp prefix
@@ -678,20 +583,20 @@ def margin_calculator_game():
     elif challenge_type == "find_breakeven":
         fixed_cost = challenge["fixed_cost"]
         
-        buy_price_text = tr('buy_price')
-        sell_price_text = tr('sell_price')
-        fixed_cost_text = tr('fixed_cost')
+        buy_price_text = t('buy_price')
+        sell_price_text = t('sell_price')
+        fixed_cost_text = t('fixed_cost')
         
         st.write(f"**{buy_price_text}:** Rp {product['buy_price']:,}")
         st.write(f"**{sell_price_text}:** Rp {product['sell_price']:,}")
         st.write(f"**{fixed_cost_text}:** Rp {fixed_cost:,}")
         
-        task_text = tr('breakeven_task')
+        task_text = t('breakeven_task')
         
         st.warning(task_text)
         
         # Input for break-even units
-        input_label = tr('breakeven_input_label')
+        input_label = t('breakeven_input_label')
         answer = st.number_input(
             input_label,
             min_value=0,
@@ -705,10 +610,10 @@ def margin_calculator_game():
         current_demand = challenge["current_demand"]
         elasticity = challenge["elasticity"]
         
-        buy_price_text = tr('buy_price')
-        current_price_text = tr('current_price')
-        current_demand_text = tr('current_monthly_demand')
-        elasticity_text = tr('price_elasticity')
+        buy_price_text = t('buy_price')
+        current_price_text = t('current_price')
+        current_demand_text = t('current_monthly_demand')
+        elasticity_text = t('price_elasticity')
         
         st.write(f"**{buy_price_text}:** Rp {product['buy_price']:,}")
         st.write(f"**{current_price_text}:** Rp {product['sell_price']:,}")
@@ -719,27 +624,28 @@ def margin_calculator_game():
         elasticity_explanation = """
         *Price elasticity measures how demand changes when price changes:*
         - *Elasticity > 1: Demand is elastic, price increases reduce total revenue*
-        - *Elasticity < 1: Demand is inelastic, price increases raise total revenue*
+        - *The closer elasticity is to 1, the higher the optimal markup over the buy price*
+        - *Elasticity = 1: Total revenue stays the same at any price*
         """
         st.info(elasticity_explanation)
         
-        task_text = tr('optimal_price_task')
+        task_text = t('optimal_price_task')
         
         st.warning(task_text)
         
         # Input for optimal price
-        input_label = tr('optimal_price_input_label')
+        input_label = t('optimal_price_input_label')
         answer = st.number_input(
             input_label,
             min_value=product["buy_price"],
-            max_value=product["buy_price"] * 5,
+            max_value=1000000,
             value=int(challenge["user_answer"] or product["sell_price"]),
             step=100
         )
         challenge["user_answer"] = answer
     
     # Submit button with enhanced styling
-    submit_text = tr('submit_button')
+    submit_text = t('submit_button')
     check_button_clicked = st.button(
         submit_text,
         key="check_margin_answer",
@@ -753,19 +659,8 @@ def margin_calculator_game():
         user_answer = challenge["user_answer"]
         
         # Allow for some margin of error based on challenge type
-        tolerance = 0
-        if challenge_type == "find_sell_price":
-            tolerance = 100  # 100 Rp difference allowed
-        elif challenge_type == "find_margin_percent":
-            tolerance = 1    # 1% difference allowed
-        elif challenge_type == "find_profit":
-            tolerance = 1000  # 1000 Rp difference allowed
-        elif challenge_type == "find_breakeven":
-            tolerance = 1    # 1 unit difference allowed
-        elif challenge_type == "find_optimal_price":
-            tolerance = 500  # 500 Rp difference allowed
-        
-        is_correct = abs(user_answer - correct_answer) <= tolerance
+        tolerance = ANSWER_TOLERANCES.get(challenge_type, 0)
+        is_correct = is_answer_correct(challenge_type, user_answer, correct_answer)
         
         # Calculate end time and elapsed time
         end_time = time.time()
@@ -773,15 +668,7 @@ def margin_calculator_game():
         
         # Calculate score components
         # Base scores increase with level difficulty
-        base_scores = {
-            1: 10,  # Level 1: Basic score
-            2: 15,  # Level 2: Slightly higher
-            3: 20,  # Level 3: Moderate
-            4: 25,  # Level 4: Challenging
-            5: 30   # Level 5: Expert
-        }
-        
-        base_score = base_scores.get(level, 15)
+        base_score = MARGIN_BASE_SCORES.get(level, 15)
         level_bonus = level * 2  # 2 points per level
         time_bonus = 0
         accuracy_bonus = 0
@@ -817,7 +704,7 @@ def margin_calculator_game():
         # Display different results based on correctness
         if is_correct:
             # Celebration for correct answer
-            correct_text = tr('correct_feedback')
+            correct_text = t('correct_feedback')
             answer_text = "The correct answer is" if lang == "en" else "Jawaban yang benar adalah"
             
             # Format answer based on challenge type
@@ -888,6 +775,7 @@ def margin_calculator_game():
             
             # Add visual celebration for perfect score
             if accuracy_bonus > 0 and level >= 4:
+                level_text = f"Level {level}"
                 st.balloons()
                 st.markdown(f"""
                 <div style="padding: 20px; text-align: center; background-color: #FFF9C4; border-radius: 10px; margin: 20px 0;">
@@ -897,7 +785,7 @@ def margin_calculator_game():
                 """, unsafe_allow_html=True)
         else:
             # Display incorrect answer message
-            incorrect_text = tr('incorrect_feedback')
+            incorrect_text = t('incorrect_feedback')
             correct_text = "The correct answer is" if lang == "en" else "Jawaban yang benar adalah"
             
             # Format answers based on challenge type
@@ -1135,30 +1023,30 @@ def margin_calculator_game():
                         "en": """
                         **Elasticity Pricing Strategy**
                         
-                        A clothing store found that their basic t-shirts had high elasticity (1.8) while their premium jeans had low elasticity (0.6).
+                        A clothing store found that their basic t-shirts had high elasticity (1.8) while their premium jeans had low elasticity (1.25).
                         
                         For the t-shirts (elastic demand):
                         - When they raised prices by 10%, sales dropped by 18%
                         - They calculated the optimal markup as 1/(1.8-1) = 1.25, setting prices 125% above cost
                         
-                        For the jeans (inelastic demand):
-                        - When they raised prices by 10%, sales only dropped by 6%
-                        - They calculated the optimal markup as 1/(0.6-1) = -2.5, which being negative meant they should maximize markup
+                        For the jeans (demand closer to unit elastic):
+                        - When they raised prices by 10%, sales only dropped by 12.5%
+                        - They calculated the optimal markup as 1/(1.25-1) = 4.0, setting prices 400% above cost
                         
                         This data-driven approach allowed them to optimize each product category's pricing independently.
                         """,
                         "id": """
                         **Strategi Penetapan Harga Elastisitas**
                         
-                        Sebuah toko pakaian menemukan bahwa kaos polos mereka memiliki elastisitas tinggi (1,8) sementara jeans premium mereka memiliki elastisitas rendah (0,6).
+                        Sebuah toko pakaian menemukan bahwa kaos polos mereka memiliki elastisitas tinggi (1,8) sementara jeans premium mereka memiliki elastisitas rendah (1,25).
                         
                         Untuk kaos (permintaan elastis):
                         - Ketika mereka menaikkan harga sebesar 10%, penjualan turun sebesar 18%
                         - Mereka menghitung markup optimal sebagai 1/(1,8-1) = 1,25, menetapkan harga 125% di atas biaya
                         
-                        Untuk jeans (permintaan inelastis):
-                        - Ketika mereka menaikkan harga sebesar 10%, penjualan hanya turun sebesar 6%
-                        - Mereka menghitung markup optimal sebagai 1/(0,6-1) = -2,5, yang karena negatif berarti mereka harus memaksimalkan markup
+                        Untuk jeans (permintaan mendekati elastis uniter):
+                        - Ketika mereka menaikkan harga sebesar 10%, penjualan hanya turun sebesar 12,5%
+                        - Mereka menghitung markup optimal sebagai 1/(1,25-1) = 4,0, menetapkan harga 400% di atas biaya
                         
                         Pendekatan berbasis data ini memungkinkan mereka untuk mengoptimalkan penetapan harga setiap kategori produk secara independen.
                         """
@@ -1187,8 +1075,7 @@ def margin_calculator_game():
             st.markdown(f"📝 **{practice_text}** - {review_text}.")
         
         # Update player progress
-        results = update_skills("margin_calculator", score)
-        print("DEBUG: Current skill levels after margin_calculator:", st.session_state.get("skills", {}))
+        results = score_round(challenge, "margin_calculator", score, {"level": level, "seed": challenge.get("seed")})
         
         # Continue or try again buttons
         col1, col2 = st.columns(2)
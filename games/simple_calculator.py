@@ -4,7 +4,7 @@ Modern, user-friendly UI for basic arithmetic operations.
 """
 import streamlit as st
 from urllib.parse import parse_qs
-from utils.i18n import tr
+from utils.i18n import get_translator, tr
 
 
 def get_game_info():
@@ -26,6 +26,8 @@ def get_game_info():
 
 
 def simple_calculator_game():
+    t = get_translator()
+    
     # --- Calculator Session State ---
     if "calc_display" not in st.session_state:
         st.session_state["calc_display"] = ""
@@ -84,8 +86,8 @@ def simple_calculator_game():
         })
         st.rerun()
 
-    st.markdown(f"### {tr('simple_calculator_title')}")
-    st.info(tr('simple_calculator_instructions'))
+    st.markdown(f"### {t('simple_calculator_title')}")
+    st.info(t('simple_calculator_instructions'))
     st.markdown("<hr style='margin:0 0 20px 0;'>", unsafe_allow_html=True)
 
     # --- Display ---
@@ -104,11 +106,11 @@ def simple_calculator_game():
 
     # --- Calculator Buttons Layout as HTML/CSS Grid ---
     button_grid = [
-        ["7", "8", "9", tr('divide')],
-        ["4", "5", "6", tr('multiply')],
-        ["1", "2", "3", tr('subtract')],
-        ["0", ".", tr('clear'), tr('add')],
-        [tr('negate'), tr('equals'), None, None],
+        ["7", "8", "9", t('divide')],
+        ["4", "5", "6", t('multiply')],
+        ["1", "2", "3", t('subtract')],
+        ["0", ".", t('clear'), t('add')],
+        [t('negate'), t('equals'), None, None],
     ]
     html = """
     <form id='calc-form' autocomplete='off'>
@@ -218,6 +220,7 @@ def simple_calculator_game():
 
 
 def handle_calculator_input(label):
+    t = get_translator()
     display = st.session_state["calc_display"]
     last = st.session_state["calc_last"]
     operator = st.session_state["calc_operator"]
@@ -245,34 +248,34 @@ def handle_calculator_input(label):
         elif "." not in display:
             display += "."
         formula += "." if not show_result else "."
-    elif label in [tr('add'), tr('subtract'), tr('multiply'), tr('divide')]:
+    elif label in [t('add'), t('subtract'), t('multiply'), t('divide')]:
         if display:
             st.session_state["calc_last"] = display
             st.session_state["calc_operator"] = label
             st.session_state["calc_reset"] = True
-            if not formula.endswith(tuple([tr('add'), tr('subtract'), tr('multiply'), tr('divide')])):
+            if not formula.endswith(tuple([t('add'), t('subtract'), t('multiply'), t('divide')])):
                 formula += f" {label} "
             else:
                 formula = formula[:-3] + f" {label} "
         st.session_state["calc_show_result"] = False
-    elif label == tr('equals'):
+    elif label == t('equals'):
         if operator and last and display:
             try:
                 n1 = float(last)
                 n2 = float(display)
-                if operator == tr('add'):
+                if operator == t('add'):
                     result = n1 + n2
-                elif operator == tr('subtract'):
+                elif operator == t('subtract'):
                     result = n1 - n2
-                elif operator == tr('multiply'):
+                elif operator == t('multiply'):
                     result = n1 * n2
-                elif operator == tr('divide'):
+                elif operator == t('divide'):
                     if n2 == 0:
-                        display = tr('error')
+                        display = t('error')
                         st.session_state["calc_reset"] = True
                     else:
                         result = n1 / n2
-                if display != tr('error'):
+                if display != t('error'):
                     display = str(result).rstrip("0").rstrip(".") if "." in str(result) else str(result)
                     st.session_state["calc_reset"] = True
                 st.session_state["calc_operator"] = ""
@@ -280,19 +283,19 @@ def handle_calculator_input(label):
                 st.session_state["calc_show_result"] = True
                 formula = ""
             except Exception:
-                display = tr('error')
+                display = t('error')
                 st.session_state["calc_reset"] = True
                 st.session_state["calc_show_result"] = True
                 formula = ""
-    elif label == tr('clear'):
+    elif label == t('clear'):
         display = ""
         st.session_state["calc_last"] = ""
         st.session_state["calc_operator"] = ""
         st.session_state["calc_reset"] = False
         formula = ""
         st.session_state["calc_show_result"] = False
-    elif label == tr('negate'):
-        if display and display != "0" and display != tr('error'):
+    elif label == t('negate'):
+        if display and display != "0" and display != t('error'):
             if display.startswith("-"):
                 display = display[1:]
             else:
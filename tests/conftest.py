@@ -0,0 +1,50 @@
+"""
+Shared fixtures for the Toko Pintar tests.
+
+The tests never touch the bundled data/user_data.db: before anything
+imports utils.db, TOKO_PINTAR_DB_PATH is pointed at a copy of it in a
+temporary directory.
+"""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.config import DB_PATH_ENV, DEFAULT_DB_PATH
+
+def copy_database(source, target):
+    """Copy a SQLite database, including changes still in its WAL file."""
+    source_conn = sqlite3.connect(f"file:{source}?mode=ro", uri=True)
+    target_conn = sqlite3.connect(target)
+    try:
+        source_conn.backup(target_conn)
+    finally:
+        source_conn.close()
+        target_conn.close()
+
+_session_dir = tempfile.mkdtemp(prefix="toko-pintar-tests-")
+os.environ[DB_PATH_ENV] = os.path.join(_session_dir, "user_data.db")
+copy_database(DEFAULT_DB_PATH, os.environ[DB_PATH_ENV])
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_session_dir, ignore_errors=True)
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point the shared DatabaseManager at a fresh copy of the test database."""
+    from utils.db import db, ConnectionPool
+    
+    path = str(tmp_path / "user_data.db")
+    copy_database(db.db_path, path)
+    pool = ConnectionPool(path, pragmas=db.pool.pragmas)
+    monkeypatch.setattr(db, "db_path", path)
+    monkeypatch.setattr(db, "pool", pool)
+    yield db
+    pool.close_all()
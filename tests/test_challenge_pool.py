@@ -0,0 +1,31 @@
+"""
+Reproducible challenge sequences from a seeded ChallengePool.
+"""
+from utils.challenge_pool import ChallengePool
+from utils.config import SAMPLE_PRODUCTS
+
+def _sequence(pool, game_id, level, count):
+    return [pool.take(game_id, level)["seed"] for _ in range(count)]
+
+def test_seeded_pools_serve_the_same_sequence_per_game_and_level():
+    products = [dict(product) for product in SAMPLE_PRODUCTS]
+    
+    # Served straight from the seed streams, one (game, level) at a time
+    inline = ChallengePool(pool_size=0, seed=7, products=products)
+    expected = _sequence(inline, "margin_calculator", 5, 6)
+    other = _sequence(inline, "change_making", 3, 6)
+    
+    # Pre-filled in the background and interleaved with another (game, level)
+    filled = ChallengePool(pool_size=4, seed=7, products=products)
+    filled._refill(("change_making", 3))
+    filled._refill(("margin_calculator", 5))
+    served = {"margin_calculator": [], "change_making": []}
+    for _ in range(6):
+        served["change_making"].append(filled.take("change_making", 3)["seed"])
+        served["margin_calculator"].append(filled.take("margin_calculator", 5)["seed"])
+    
+    assert served == {"margin_calculator": expected, "change_making": other}
+    assert expected != other
+    
+    challenge = filled.take("inventory_game", 2)
+    assert filled.replay("inventory_game", 2, challenge["seed"]) == challenge
@@ -0,0 +1,32 @@
+"""
+Tests for the optimal change solver.
+"""
+import numpy as np
+
+from utils.change_solver import ChangeSolver
+
+def test_solve_many_handles_counts_above_int16():
+    solver = ChangeSolver([1, 2], max_amount=200000)
+    
+    counts = solver.solve_many([100000, 199999])
+    
+    # Denominations are ordered largest first: (2, 1)
+    np.testing.assert_array_equal(counts, [[50000, 0], [99999, 1]])
+    assert solver.min_pieces(199999) == 100000
+    
+    single_coin = ChangeSolver([1], max_amount=70000)
+    assert single_coin.solve_many([70000])[0, 0] == 70000
+    assert single_coin.solve(70000) == {1: 70000}
+
+def test_change_making_falls_back_to_greedy_outside_the_table():
+    from games.change_making import get_optimal_denominations, is_optimal_change
+    
+    assert get_optimal_denominations(1_500_000)[100000] == 15
+    assert get_optimal_denominations(-500) == dict.fromkeys(get_optimal_denominations(0), 0)
+    # Not payable exactly: the greedy count, as before the solver
+    assert sum(get_optimal_denominations(650).values()) == 2
+    
+    assert is_optimal_change({100000: 15}, 1_500_000)
+    assert not is_optimal_change({50000: 30}, 1_500_000)
+    assert is_optimal_change({}, -100)
+    assert is_optimal_change({500: 1, 100: 1}, 650)
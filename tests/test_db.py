@@ -0,0 +1,132 @@
+"""
+DatabaseManager transactions and schema migrations.
+"""
+import sqlite3
+
+import pytest
+
+from utils.db import DatabaseManager, MIGRATIONS
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "user_data.db"))
+    yield manager
+    manager.pool.close_all()
+
+def test_load_player_profile_joins_an_open_transaction(manager):
+    user_id = manager.create_user("Profile Tester")
+    
+    with manager.session() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("UPDATE users SET total_score = 42 WHERE user_id = ?", (user_id,))
+        
+        profile = manager.load_player_profile(user_id)
+        assert profile.total_score == 42
+        
+        # The caller's write is still pending and can be committed
+        assert conn.in_transaction
+        conn.commit()
+    
+    assert manager.get_user(user_id)["total_score"] == 42
+
+def _indexes(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA index_list({table})")}
+
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+def test_migrations_on_an_empty_database(manager):
+    assert manager.get_schema_version() == MIGRATIONS[-1][0]
+    
+    with manager.session() as conn:
+        versions = [row[0] for row in conn.execute("SELECT version FROM schema_version ORDER BY version")]
+        assert versions == [version for version, _, _ in MIGRATIONS]
+        assert {"metadata", "shop_name"} <= _columns(conn, "users")
+        assert {"idx_game_history_user_id", "idx_game_history_user_time"} <= _indexes(conn, "game_history")
+    
+    # Opening the database again applies nothing
+    assert manager.apply_migrations() == 0
+
+def test_migrations_upgrade_an_old_schema(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+    CREATE TABLE users (
+        user_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        total_score INTEGER DEFAULT 0,
+        shop_level INTEGER DEFAULT 1,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE game_history (
+        history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        game_id TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        details TEXT
+    );
+    CREATE TABLE achievements (
+        achievement_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id TEXT NOT NULL,
+        achievement_type TEXT NOT NULL,
+        earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        shown BOOLEAN DEFAULT 0
+    );
+    CREATE TABLE products (
+        product_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        name_id TEXT,
+        buy_price INTEGER NOT NULL,
+        sell_price INTEGER NOT NULL,
+        category TEXT NOT NULL,
+        image_path TEXT
+    );
+    INSERT INTO users (user_id, name) VALUES ('old-user', 'Old Player');
+    INSERT INTO game_history (user_id, game_id, score) VALUES
+        ('old-user', 'margin_calculator', 10),
+        ('old-user', 'margin_calculator', 30);
+    INSERT INTO achievements (user_id, achievement_type) VALUES
+        ('old-user', 'first_game'),
+        ('old-user', 'first_game');
+    ''')
+    conn.commit()
+    conn.close()
+    
+    manager = DatabaseManager(path)
+    try:
+        assert manager.get_schema_version() == MIGRATIONS[-1][0]
+        with manager.session() as conn:
+            assert {"metadata", "shop_name"} <= _columns(conn, "users")
+            assert "stock" in _columns(conn, "products")
+            assert "idx_achievements_user_type" in _indexes(conn, "achievements")
+        
+        # Existing rows are kept, duplicates removed and statistics backfilled
+        assert manager.get_user("old-user")["name"] == "Old Player"
+        assert [a["achievement_type"] for a in manager.get_achievements("old-user")] == ["first_game"]
+        stats = manager.get_game_stats("old-user", "margin_calculator")
+        assert (stats["play_count"], stats["best_score"], stats["last_score"]) == (2, 30, 30)
+    finally:
+        manager.pool.close_all()
+
+def test_write_batch_rolls_back_on_error(manager):
+    user_id = manager.create_user("Batch Tester")
+    
+    with pytest.raises(sqlite3.Error):
+        with manager.batch() as batch:
+            batch.update_total_score(user_id, 99)
+            receipt = batch.add_game_history(user_id, "margin_calculator", 20)
+            batch.add("UPDATE no_such_table SET x = 1")
+    
+    assert manager.get_user(user_id)["total_score"] == 0
+    assert manager.get_game_history(user_id) == []
+    assert "history_id" not in receipt
+    
+    # Nothing is written when the block itself raises
+    with pytest.raises(RuntimeError):
+        with manager.batch() as batch:
+            batch.update_total_score(user_id, 99)
+            raise RuntimeError("round abandoned")
+    
+    assert manager.get_user(user_id)["total_score"] == 0
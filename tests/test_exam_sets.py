@@ -0,0 +1,60 @@
+"""
+Grading exam answer sheets the way the games score a round.
+"""
+import os
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from conftest import PROJECT_ROOT
+from games.margin_calculator import get_level_description, get_level_tips
+from utils.challenge_pool import ChallengePool
+from utils.challenges import ANSWER_TOLERANCES
+from utils.config import SAMPLE_PRODUCTS
+from utils.exam_sets import generate_exam_set, grade_answers
+
+APP_PATH = os.path.join(PROJECT_ROOT, "app.py")
+
+def _round_state(challenge, answer):
+    """Session state for a submitted round without a time limit (no time bonus on paper)."""
+    level = challenge["level"]
+    return dict(
+        challenge,
+        user_answer=answer,
+        start_time=0,
+        time_limit=None,
+        level_description=get_level_description(level),
+        level_tips=get_level_tips(level),
+        submitted=True
+    )
+
+def test_grade_answers_matches_the_game_scores(temp_db):
+    products = [dict(product, product_id=number) for number, product in enumerate(SAMPLE_PRODUCTS, 1)]
+    pool = ChallengePool(products=products)
+    key = generate_exam_set("margin_calculator", 2, seed=11, products=products)
+    user_id = temp_db.create_user("Exam Tester", {"shop_name": "Test Shop"})
+    
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state["user_id"] = user_id
+    at.run()
+    at.session_state["player_name"] = "Exam Tester"
+    at.session_state["current_game"] = "margin_calculator"
+    
+    answers, game_scores = [], []
+    for row in key.itertuples():
+        challenge = pool.generate("margin_calculator", row.level, row.seed)
+        tolerance = ANSWER_TOLERANCES[row.type]
+        # Exact, within the tolerance, and wrong
+        for offset in (0, tolerance, 2 * tolerance + 1000):
+            at.session_state["margin_calculator"] = _round_state(challenge, row.correct_answer + offset)
+            at.run()
+            assert not at.exception and not at.error
+            
+            # The number input may round the answer; grade the one the game used
+            answer = at.session_state["margin_calculator"]["user_answer"]
+            answers.append({"challenge_id": row.challenge_id, "answer": answer})
+            game_scores.append(temp_db.get_game_history(user_id, limit=1)[0]["score"])
+    
+    graded = grade_answers(key, pd.DataFrame(answers))
+    assert graded["score"].tolist() == game_scores
+    assert graded["is_correct"].any() and not graded["is_correct"].all()
@@ -0,0 +1,60 @@
+"""
+Scoring a round from inside a game fragment.
+"""
+import os
+
+from streamlit.testing.v1 import AppTest
+
+from conftest import PROJECT_ROOT
+import utils.skills as skills
+
+APP_PATH = os.path.join(PROJECT_ROOT, "app.py")
+
+def test_score_round_scores_once_and_reruns_the_app(monkeypatch):
+    scored, reruns = [], []
+    monkeypatch.setattr(skills, "update_skills", lambda *args: scored.append(args) or {"score": 10})
+    monkeypatch.setattr(skills.st, "rerun", lambda **kwargs: reruns.append(kwargs))
+    
+    round_state = {}
+    assert skills.score_round(round_state, "margin_calculator", 10, {"level": 1}) is None
+    assert scored == [("margin_calculator", 10, {"level": 1})]
+    assert reruns == [{"scope": "app"}]
+    assert round_state == {"results": {"score": 10}, "scored": True}
+    
+    # Redrawing the result screen returns the stored results
+    assert skills.score_round(round_state, "margin_calculator", 10, {"level": 1}) == {"score": 10}
+    assert len(scored) == 1
+    assert len(reruns) == 1
+
+def test_submitting_a_round_scores_it_once(temp_db):
+    user_id = temp_db.create_user("Fragment Tester", {"shop_name": "Test Shop"})
+    
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state["user_id"] = user_id
+    at.run()  # init_app sets up a new session
+    at.session_state["player_name"] = "Fragment Tester"
+    at.session_state["current_game"] = "margin_calculator"
+    at.run()
+    assert not at.exception
+    assert at.session_state["total_score"] == 0
+    
+    # Answer the level 1 round correctly and submit it
+    challenge = at.session_state["margin_calculator"]
+    at.number_input[0].set_value(int(challenge["correct_answer"]))
+    at.button(key="check_margin_answer").click().run()
+    assert not at.exception
+    
+    total_score = at.session_state["total_score"]
+    assert total_score > 0
+    assert at.session_state["margin_calculator"]["scored"]
+    
+    # The round's writes are committed together
+    assert temp_db.get_user(user_id)["total_score"] == total_score
+    history = temp_db.get_game_history(user_id)
+    assert [(game["game_id"], game["score"]) for game in history] == [("margin_calculator", total_score)]
+    assert at.session_state["game_history"][-1]["history_id"] == history[0]["history_id"]
+    
+    # Redrawing the result screen must not score the round again
+    at.run()
+    assert at.session_state["total_score"] == total_score
+    assert len(temp_db.get_game_history(user_id)) == 1
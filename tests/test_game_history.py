@@ -0,0 +1,30 @@
+"""
+Bounded in-session game history and paging of older games.
+"""
+from utils.game_history import GameHistory
+
+def _add_games(db, user_id, count):
+    return [db.add_game_history(user_id, "margin_calculator", score) for score in range(count)]
+
+def test_iter_older_pages_below_the_games_in_memory(temp_db):
+    user_id = temp_db.create_user("History Tester")
+    ids = _add_games(temp_db, user_id, 5)
+    
+    rows, _ = temp_db.get_game_history_page(user_id, limit=2)
+    history = GameHistory.from_rows(rows, capacity=3, user_id=user_id)
+    # A round whose write failed has no history_id
+    history.append({"game_id": "change_making", "score": 7, "timestamp": "2026-01-01 10:00:00"})
+    
+    assert [row["history_id"] for row in history.iter_older(page_size=2)] == ids[2::-1]
+    assert [game.get("history_id") for game in history.iter_all(page_size=2)] == [None] + ids[::-1]
+
+def test_iter_older_without_stored_games_in_memory(temp_db):
+    user_id = temp_db.create_user("History Tester")
+    ids = _add_games(temp_db, user_id, 3)
+    
+    history = GameHistory(user_id=user_id)
+    history.append({"game_id": "change_making", "score": 7, "timestamp": "2026-01-01 10:00:00"})
+    assert [row["history_id"] for row in history.iter_older()] == ids[::-1]
+    
+    # Anonymous play has nothing stored
+    assert list(GameHistory().iter_older()) == []
@@ -0,0 +1,26 @@
+"""
+The lazy game registry and its manifest.
+"""
+import importlib
+import json
+
+from games.game_registry import MANIFEST_PATH, get_all_games, get_game_function
+
+def test_manifest_only_holds_what_lazy_loading_needs():
+    with open(MANIFEST_PATH, encoding="utf-8") as f:
+        entries = json.load(f)["games"]
+    
+    for entry in entries:
+        # Names, skills and levels live in the game's get_game_info()
+        assert set(entry) == {"id", "module", "function"}
+        module = importlib.import_module(entry["module"])
+        assert callable(getattr(module, entry["function"]))
+        assert module.get_game_info()["id"] == entry["id"]
+
+def test_registry_loads_every_game():
+    games = get_all_games()
+    assert list(games) == ["inventory_game", "change_making", "margin_calculator", "simple_calculator"]
+    for game_id, info in games.items():
+        assert info["id"] == game_id
+        assert callable(get_game_function(game_id))
+    assert get_game_function("unknown_game") is None
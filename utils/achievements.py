@@ -5,7 +5,22 @@ import streamlit as st
 from datetime import datetime
 from utils.db import db
 
-# Achievement definitions
+# Events that can earn achievements
+EVENT_GAME_COMPLETED = "game_completed"
+EVENT_SKILL_CHANGED = "skill_changed"
+EVENT_SHOP_LEVEL_CHANGED = "shop_level_changed"
+EVENT_ONBOARDING_COMPLETED = "onboarding_completed"
+
+# Games that count towards the Math Whiz streak, with their perfect scores
+MATH_GAME_PERFECT_SCORES = {
+    "change_making": 30,
+    "margin_calculator": 30
+}
+
+# Achievement definitions. "events" lists the events after which a rule is
+# evaluated, and "skills"/"games" narrow that down to the skills or games it
+# depends on. "check" receives the incremental counters kept by
+# get_achievement_counters().
 ACHIEVEMENTS = [
     {
         "id": "first_steps",
@@ -13,7 +28,8 @@ ACHIEVEMENTS = [
         "name_id": "Langkah Pertama",
         "description": "Complete the onboarding process",
         "description_id": "Menyelesaikan proses orientasi",
-        "check": lambda: hasattr(st.session_state, 'onboarding_completed') and st.session_state.onboarding_completed
+        "events": [EVENT_ONBOARDING_COMPLETED],
+        "check": lambda counters: hasattr(st.session_state, 'onboarding_completed') and st.session_state.onboarding_completed
     },
     {
         "id": "first_game",
@@ -21,7 +37,8 @@ ACHIEVEMENTS = [
         "name_id": "Pemula Permainan",
         "description": "Play your first mini-game",
         "description_id": "Memainkan permainan mini pertama Anda",
-        "check": lambda: len(st.session_state.game_history) >= 1
+        "events": [EVENT_GAME_COMPLETED],
+        "check": lambda counters: counters["games_played"] >= 1
     },
     {
         "id": "inventory_master",
@@ -29,7 +46,9 @@ ACHIEVEMENTS = [
         "name_id": "Ahli Inventaris",
         "description": "Reach level 3 in inventory management",
         "description_id": "Mencapai level 3 dalam manajemen inventaris",
-        "check": lambda: st.session_state.skill_levels["inventory_management"] >= 3
+        "skills": ["inventory_management"],
+        "events": [EVENT_SKILL_CHANGED],
+        "check": lambda counters: st.session_state.skill_levels["inventory_management"] >= 3
     },
     {
         "id": "math_whiz",
@@ -37,7 +56,9 @@ ACHIEVEMENTS = [
         "name_id": "Ahli Matematika",
         "description": "Score perfectly in 3 math-related games in a row",
         "description_id": "Skor sempurna dalam 3 permainan matematika berturut-turut",
-        "check": lambda: check_math_whiz()
+        "games": list(MATH_GAME_PERFECT_SCORES),
+        "events": [EVENT_GAME_COMPLETED],
+        "check": lambda counters: counters["math_perfect_streak"] >= 3
     },
     {
         "id": "shop_upgrade",
@@ -45,7 +66,8 @@ ACHIEVEMENTS = [
         "name_id": "Peningkatan Toko",
         "description": "Reach shop level 2",
         "description_id": "Mencapai level toko 2",
-        "check": lambda: st.session_state.shop_level >= 2
+        "events": [EVENT_SHOP_LEVEL_CHANGED],
+        "check": lambda counters: st.session_state.shop_level >= 2
     },
     {
         "id": "financial_guru",
@@ -53,7 +75,9 @@ ACHIEVEMENTS = [
         "name_id": "Guru Keuangan",
         "description": "Score over 30 points in margin calculator game",
         "description_id": "Skor lebih dari 30 poin dalam permainan kalkulator margin",
-        "check": lambda: any(g["game_id"] == "margin_calculator" and g["score"] >= 30 for g in st.session_state.game_history)
+        "games": ["margin_calculator"],
+        "events": [EVENT_GAME_COMPLETED],
+        "check": lambda counters: counters["best_scores"].get("margin_calculator", 0) >= 30
     },
     {
         "id": "consistent_player",
@@ -61,7 +85,8 @@ ACHIEVEMENTS = [
         "name_id": "Pemain Konsisten",
         "description": "Play at least 10 games total",
         "description_id": "Mainkan setidaknya 10 permainan total",
-        "check": lambda: len(st.session_state.game_history) >= 10
+        "events": [EVENT_GAME_COMPLETED],
+        "check": lambda counters: counters["games_played"] >= 10
     },
     {
         "id": "cash_expert",
@@ -69,7 +94,9 @@ ACHIEVEMENTS = [
         "name_id": "Ahli Kas",
         "description": "Reach level 3 in cash handling",
         "description_id": "Mencapai level 3 dalam penanganan uang tunai",
-        "check": lambda: st.session_state.skill_levels["cash_handling"] >= 3
+        "skills": ["cash_handling"],
+        "events": [EVENT_SKILL_CHANGED],
+        "check": lambda counters: st.session_state.skill_levels["cash_handling"] >= 3
     },
     {
         "id": "pricing_pro",
@@ -77,77 +104,218 @@ ACHIEVEMENTS = [
         "name_id": "Ahli Penetapan Harga",
         "description": "Reach level 3 in pricing strategy",
         "description_id": "Mencapai level 3 dalam strategi penetapan harga",
-        "check": lambda: st.session_state.skill_levels["pricing_strategy"] >= 3
+        "skills": ["pricing_strategy"],
+        "events": [EVENT_SKILL_CHANGED],
+        "check": lambda counters: st.session_state.skill_levels["pricing_strategy"] >= 3
     }
 ]
 
+# Achievement definitions by ID
+ACHIEVEMENTS_BY_ID = {achievement["id"]: achievement for achievement in ACHIEVEMENTS}
+
+def _build_rule_index(key):
+    """Map each value of a rule's dependency list (events, skills, games) to its rules."""
+    index = {}
+    for achievement in ACHIEVEMENTS:
+        for value in achievement.get(key, []):
+            index.setdefault(value, []).append(achievement)
+    return index
+
+# Reverse indexes from events, skills and games to the rules that depend on them
+RULES_BY_EVENT = _build_rule_index("events")
+RULES_BY_SKILL = _build_rule_index("skills")
+RULES_BY_GAME = _build_rule_index("games")
+
+# Localized name/description views per language, in catalog order
+LOCALIZED_ACHIEVEMENTS = {
+    lang: tuple(
+        {
+            "id": achievement["id"],
+            "name": achievement["name_id"] if lang == "id" else achievement["name"],
+            "description": achievement["description_id"] if lang == "id" else achievement["description"]
+        }
+        for achievement in ACHIEVEMENTS
+    )
+    for lang in ("en", "id")
+}
+LOCALIZED_ACHIEVEMENTS_BY_ID = {
+    lang: {view["id"]: view for view in views}
+    for lang, views in LOCALIZED_ACHIEVEMENTS.items()
+}
+
+def get_localized_achievements(language="en"):
+    """Get name/description views of all achievements for a language.
+    
+    The views are shared; copy one before changing it.
+    """
+    return LOCALIZED_ACHIEVEMENTS.get(language, LOCALIZED_ACHIEVEMENTS["en"])
+
+def get_localized_achievement(achievement_id, language="en"):
+    """Get the name/description view of one achievement, or None if unknown."""
+    return LOCALIZED_ACHIEVEMENTS_BY_ID.get(language, LOCALIZED_ACHIEVEMENTS_BY_ID["en"]).get(achievement_id)
+
+def _rule_applies(achievement, event, payload):
+    """Check whether an event's skill or game concerns a rule."""
+    if event == EVENT_GAME_COMPLETED and "games" in achievement:
+        return achievement in RULES_BY_GAME.get(payload.get("game_id"), [])
+    if event == EVENT_SKILL_CHANGED and "skills" in achievement:
+        skills = payload.get("skills")
+        if skills is None:
+            return True
+        return any(achievement in RULES_BY_SKILL.get(skill, []) for skill in skills)
+    return True
+
+def _count_game(counters, game_id, score):
+    """Fold one completed game into the counters."""
+    counters["games_played"] += 1
+    best_scores = counters["best_scores"]
+    if game_id not in best_scores or score > best_scores[game_id]:
+        best_scores[game_id] = score
+    
+    perfect_score = MATH_GAME_PERFECT_SCORES.get(game_id)
+    if perfect_score is not None and score >= perfect_score:
+        counters["math_perfect_streak"] += 1
+    else:
+        counters["math_perfect_streak"] = 0
+
+def get_achievement_counters():
+    """Get the incremental counters that achievement rules are checked against.
+    
+    The counters are built the first time they are needed and updated per
+    event after that. Totals and best scores come from the session's game
+    statistics when they were loaded; the math streak comes from the recent
+    game history.
+    
+    Returns:
+        dict: games_played, best_scores (per game) and math_perfect_streak
+    """
+    counters = st.session_state.get('achievement_counters')
+    if counters is None:
+        counters = {"games_played": 0, "best_scores": {}, "math_perfect_streak": 0}
+        history = st.session_state.get('game_history') or []
+        for game in sorted(history, key=lambda g: (g.get("timestamp") or "", g.get("history_id", 0))):
+            _count_game(counters, game["game_id"], game["score"])
+        
+        game_stats = st.session_state.get('game_stats')
+        if game_stats:
+            counters["games_played"] = sum(stats["play_count"] for stats in game_stats.values())
+            counters["best_scores"] = {
+                game_id: stats["best_score"] for game_id, stats in game_stats.items()
+            }
+        st.session_state.achievement_counters = counters
+    return counters
+
+def reset_achievement_counters():
+    """Forget the counters, e.g. after the game history was reloaded."""
+    st.session_state.pop('achievement_counters', None)
+
+def get_earned_achievement_ids():
+    """Get the IDs of achievements already in the session."""
+    achieved_ids = set()
+    for achievement in st.session_state.get('achievements') or []:
+        # The session state uses "id" while the database uses "achievement_type"
+        if "id" in achievement:
+            achieved_ids.add(achievement["id"])
+        elif "achievement_type" in achievement:
+            achieved_ids.add(achievement["achievement_type"])
+    return achieved_ids
+
 def check_math_whiz():
     """Helper function to check the Math Whiz achievement."""
-    if len(st.session_state.game_history) < 3:
-        return False
+    return get_achievement_counters()["math_perfect_streak"] >= 3
+
+def _award(rules, batch=None):
+    """Add achievements to the session and persist them in one write.
+    
+    With a batch the write is queued on it instead, and the achievements are
+    not added to the session; call add_session_achievements() once the
+    batch has committed.
+    """
+    earned_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    new_achievements = [
+        {
+            "id": achievement["id"],
+            "name": achievement["name"],
+            "description": achievement["description"],
+            "earned_at": earned_at
+        }
+        for achievement in rules
+    ]
+    if not new_achievements:
+        return new_achievements
     
-    # Get the last 3 games
-    last_3_games = st.session_state.game_history[-3:]
+    # Add to database
+    if hasattr(st.session_state, 'user_id'):
+        achievement_ids = [a["id"] for a in new_achievements]
+        if batch is not None:
+            batch.add_achievements(st.session_state.user_id, achievement_ids)
+        else:
+            db.add_achievements(st.session_state.user_id, achievement_ids)
+    
+    if batch is None:
+        add_session_achievements(new_achievements)
+    return new_achievements
+
+def add_session_achievements(new_achievements):
+    """Add awarded achievements to the session state for immediate display."""
+    if not hasattr(st.session_state, 'achievements'):
+        st.session_state.achievements = []
+    st.session_state.achievements.extend(new_achievements)
+
+def record_events(events, batch=None):
+    """Process several events and award the achievements they unlock.
     
-    # Check if they are all math games with perfect scores
-    math_games = ["change_making", "margin_calculator"]
-    all_math_games = all(g["game_id"] in math_games for g in last_3_games)
+    Args:
+        events (list): (event, payload) pairs. game_completed payloads need
+            "game_id" and "score"; skill_changed payloads may list "skills".
+        batch (WriteBatch, optional): Queue the achievement write on this
+            batch instead of writing it immediately. The achievements are
+            then only added to the session by add_session_achievements().
     
-    # Define perfect scores for each game
-    perfect_scores = {
-        "change_making": 30,
-        "margin_calculator": 30
-    }
+    Returns:
+        list: Newly earned achievements
+    """
+    counters = get_achievement_counters()
+    
+    rules = []
+    for event, payload in events:
+        if event == EVENT_GAME_COMPLETED:
+            _count_game(counters, payload["game_id"], payload["score"])
+        for achievement in RULES_BY_EVENT.get(event, []):
+            if achievement not in rules and _rule_applies(achievement, event, payload):
+                rules.append(achievement)
     
-    all_perfect = all(g["score"] >= perfect_scores.get(g["game_id"], 0) for g in last_3_games)
+    if not rules:
+        return []
     
-    return all_math_games and all_perfect
+    achieved_ids = get_earned_achievement_ids()
+    return _award([
+        achievement for achievement in rules
+        if achievement["id"] not in achieved_ids and achievement["check"](counters)
+    ], batch)
 
-def check_achievements():
-    """Check for and award any earned achievements.
+def record_event(event, **payload):
+    """Process one event and award the achievements it unlocks.
     
     Returns:
         list: Newly earned achievements
     """
-    new_achievements = []
+    return record_events([(event, payload)])
+
+def check_achievements():
+    """Check every rule and award any earned achievements.
     
-    # Check achievements in session state
-    achieved_ids = set()
-    if hasattr(st.session_state, 'achievements'):
-        for achievement in st.session_state.achievements:
-            # The session state uses "id" while the database uses "achievement_type"
-            if "id" in achievement:
-                achieved_ids.add(achievement["id"])
-            elif "achievement_type" in achievement:
-                achieved_ids.add(achievement["achievement_type"])
-    
-    # Check each achievement
-    for achievement in ACHIEVEMENTS:
-        # Skip already earned achievements
-        if achievement["id"] in achieved_ids:
-            continue
-        
-        # Check if achievement should be earned
-        if achievement["check"]():
-            # Add to database
-            if hasattr(st.session_state, 'user_id'):
-                db.add_achievement(st.session_state.user_id, achievement["id"])
-            
-            # Add to session state for immediate display
-            new_achievement = {
-                "id": achievement["id"],
-                "name": achievement["name"],
-                "description": achievement["description"],
-                "earned_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            if not hasattr(st.session_state, 'achievements'):
-                st.session_state.achievements = []
-                
-            st.session_state.achievements.append(new_achievement)
-            new_achievements.append(new_achievement)
+    Prefer record_event(), which only evaluates the rules an event affects.
     
-    return new_achievements
+    Returns:
+        list: Newly earned achievements
+    """
+    counters = get_achievement_counters()
+    achieved_ids = get_earned_achievement_ids()
+    return _award([
+        achievement for achievement in ACHIEVEMENTS
+        if achievement["id"] not in achieved_ids and achievement["check"](counters)
+    ])
 
 def display_achievement(achievement):
     """Display an achievement notification."""
@@ -157,10 +325,7 @@ def display_achievement(achievement):
 
 def get_achievement_details(achievement_id):
     """Get the details of an achievement by ID."""
-    for achievement in ACHIEVEMENTS:
-        if achievement["id"] == achievement_id:
-            return achievement
-    return None
+    return ACHIEVEMENTS_BY_ID.get(achievement_id)
 
 def add_achievement(achievement_id, custom_description=None):
     """Manually add an achievement to the user's profile.
@@ -178,15 +343,7 @@ def add_achievement(achievement_id, custom_description=None):
         return None
     
     # Check if already earned
-    achieved_ids = set()
-    if hasattr(st.session_state, 'achievements'):
-        for achievement in st.session_state.achievements:
-            if "id" in achievement:
-                achieved_ids.add(achievement["id"])
-            elif "achievement_type" in achievement:
-                achieved_ids.add(achievement["achievement_type"])
-    
-    if achievement_id in achieved_ids:
+    if achievement_id in get_earned_achievement_ids():
         return None  # Already earned
     
     # Add to database
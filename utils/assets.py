@@ -0,0 +1,153 @@
+"""
+Static asset pipeline for Toko Pintar application.
+
+Stylesheets are combined into one minified, content-hashed bundle that is
+built once per process and kept in memory. In watch mode the source file
+modification times are checked on every request and the bundle is rebuilt
+when a file changes.
+
+Inspect the bundle, or write it out for static hosting, with:
+    python -m utils.assets --output bundle.min.css
+"""
+import os
+import re
+import glob
+import hashlib
+import threading
+from dataclasses import dataclass
+
+STYLE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'styles')
+
+_bundle_cache = {}  # extra_css -> CssBundle
+_bundle_lock = threading.Lock()
+
+@dataclass
+class CssBundle:
+    """A minified stylesheet bundle."""
+    css: str
+    content_hash: str
+    sources: tuple  # (path, mtime_ns, size) for each source file
+    source_bytes: int
+    style_tag: str  # the bundle wrapped in a <style> element, ready for st.markdown
+
+def get_css_sources():
+    """List stylesheet paths in load order.
+    
+    ORDER MATTERS HERE:
+    1. Theme variables (must be first so other CSS can use the variables)
+    2. Component CSS files
+    3. Main CSS (for overrides and global styles)
+    """
+    sources = []
+    theme_css_path = os.path.join(STYLE_DIR, 'theme.css')
+    if os.path.exists(theme_css_path):
+        sources.append(theme_css_path)
+    
+    sources.extend(sorted(glob.glob(os.path.join(STYLE_DIR, 'components', '*.css'))))
+    
+    main_css_path = os.path.join(STYLE_DIR, 'main.css')
+    if os.path.exists(main_css_path):
+        sources.append(main_css_path)
+    return sources
+
+def _source_signature(paths):
+    """Get (path, mtime_ns, size) for each source file."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*')
+
+def minify_css(css):
+    """Remove comments and redundant whitespace from CSS.
+    
+    Whitespace around ":" is kept because it is significant in selectors
+    such as "div :first-child".
+    """
+    css = _COMMENT_RE.sub('', css)
+    css = _WHITESPACE_RE.sub(' ', css)
+    css = _PUNCTUATION_RE.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+def build_css_bundle(extra_css=""):
+    """Read, combine and minify all stylesheets.
+    
+    Args:
+        extra_css (str, optional): Inline CSS appended after main.css
+    
+    Returns:
+        CssBundle: The built bundle
+    """
+    paths = get_css_sources()
+    signature = _source_signature(paths)
+    
+    parts = []
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                parts.append(f.read())
+        except OSError as e:
+            print(f"Error loading CSS file {path}: {e}")
+    if extra_css:
+        parts.append(extra_css)
+    
+    combined = "\n\n".join(parts)
+    css = minify_css(combined)
+    content_hash = hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]
+    return CssBundle(
+        css=css,
+        content_hash=content_hash,
+        sources=signature,
+        source_bytes=len(combined.encode('utf-8')),
+        style_tag=f'<style data-bundle="{content_hash}">{css}</style>'
+    )
+
+def get_css_bundle(extra_css="", watch=False):
+    """Get the cached CSS bundle, building it on first use.
+    
+    Args:
+        extra_css (str, optional): Inline CSS appended after main.css
+        watch (bool, optional): Rebuild when a source file has changed (dev mode)
+    
+    Returns:
+        CssBundle: The bundle
+    """
+    bundle = _bundle_cache.get(extra_css)
+    if bundle is not None:
+        if not watch or _source_signature(get_css_sources()) == bundle.sources:
+            return bundle
+    
+    with _bundle_lock:
+        bundle = _bundle_cache.get(extra_css)
+        if bundle is None or (watch and _source_signature(get_css_sources()) != bundle.sources):
+            bundle = build_css_bundle(extra_css)
+            _bundle_cache[extra_css] = bundle
+    return bundle
+
+def clear_asset_cache():
+    """Drop all cached bundles so the next request rebuilds them."""
+    with _bundle_lock:
+        _bundle_cache.clear()
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Build the Toko Pintar CSS bundle")
+    parser.add_argument("--output", help="Write the minified bundle to this file")
+    args = parser.parse_args()
+    
+    bundle = build_css_bundle()
+    print(f"Bundled {len(bundle.sources)} stylesheets: "
+          f"{bundle.source_bytes} bytes -> {len(bundle.css.encode('utf-8'))} bytes "
+          f"(hash {bundle.content_hash})")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(bundle.css)
+        print(f"Wrote {args.output}")
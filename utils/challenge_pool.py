@@ -0,0 +1,220 @@
+"""
+Pre-generated challenge pools for Toko Pintar mini-games.
+
+A background thread keeps a pool of validated challenges per (game, level)
+topped up, so starting a round is a deque pop no matter how much work the
+generator does. Every challenge carries the seed it was generated from;
+replay() regenerates it exactly for grading disputes, as long as the
+product catalog is unchanged.
+
+Each (game, level) draws its seeds from its own stream, derived from the
+master seed, and serves them in stream order. With a master seed set, the
+sequence of challenges for a (game, level) is therefore the same on every
+run, however the background thread happens to fill the pools.
+
+    challenge = challenge_pool.take("change_making", level=3)
+    challenge_pool.replay("change_making", 3, challenge["seed"]) == challenge
+"""
+import random
+import threading
+from collections import OrderedDict
+from utils.challenges import CHALLENGE_GENERATORS
+
+DEFAULT_CHALLENGE_POOL_SIZE = 20
+CHALLENGE_LEVELS = (1, 2, 3, 4, 5)
+
+# Seeds tried before a (game, level) is reported as unable to generate
+MAX_GENERATION_ATTEMPTS = 50
+
+class ChallengePool:
+    """Background-filled pools of challenges, one per (game_id, level)."""
+    
+    def __init__(self, pool_size=DEFAULT_CHALLENGE_POOL_SIZE, seed=None, products=None):
+        """
+        Args:
+            pool_size (int, optional): Challenges kept ready per (game_id, level)
+            seed (int, optional): Master seed. Each (game_id, level) gets a
+                stream of challenge seeds derived from (seed, game_id, level).
+            products (list, optional): Fixed product catalog. Defaults to the
+                database products, reloaded whenever they change.
+        """
+        self.pool_size = pool_size
+        self.seed = seed
+        self._seed_streams = {}  # (game_id, level) -> Random drawing challenge seeds
+        self._products = products
+        self._catalog = None  # (version, products)
+        self._pools = {}  # (game_id, level) -> OrderedDict of seed -> challenge (None while generating)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self.stats = {"served": 0, "misses": 0, "generated": 0, "rejected": 0}
+    
+    def _catalog_version(self):
+        if self._products is not None:
+            return 0
+        from utils.db import db
+        return db.product_data_version
+    
+    def _load_products(self):
+        """Get the product catalog in a stable order."""
+        if self._products is not None:
+            return list(self._products)
+        
+        from utils.db import db
+        from utils.config import SAMPLE_PRODUCTS
+        
+        products = db.get_products() or [dict(product) for product in SAMPLE_PRODUCTS]
+        products.sort(key=lambda p: (p.get("product_id") or 0, p["name"]))
+        return products
+    
+    def _get_catalog(self):
+        """Get (version, products), reloading and emptying the pools if products changed."""
+        version = self._catalog_version()
+        catalog = self._catalog
+        if catalog is not None and catalog[0] == version:
+            return catalog
+        
+        products = self._load_products()
+        with self._lock:
+            if self._catalog is None or self._catalog[0] != version:
+                self._catalog = (version, products)
+                for pool in self._pools.values():
+                    pool.clear()
+            return self._catalog
+    
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+    
+    def _draw_seed(self, key):
+        """Draw the next challenge seed for a (game_id, level). Call with the lock held."""
+        stream = self._seed_streams.get(key)
+        if stream is None:
+            stream = random.Random(None if self.seed is None else f"{self.seed}:{key[0]}:{key[1]}")
+            self._seed_streams[key] = stream
+        return stream.getrandbits(63)
+    
+    def generate(self, game_id, level, seed, products=None):
+        """Generate one validated challenge from a seed.
+        
+        Rejected candidates are regenerated from the same RNG, so the result
+        is still fully determined by the seed.
+        
+        Raises:
+            KeyError: If the game has no generator
+            ValueError: If no valid challenge was found
+        """
+        generator, validator = CHALLENGE_GENERATORS[game_id]
+        if products is None:
+            products = self._get_catalog()[1]
+        
+        rng = random.Random(seed)
+        for _ in range(MAX_GENERATION_ATTEMPTS):
+            challenge = generator(level, products, rng)
+            if validator(challenge):
+                challenge["seed"] = seed
+                self._count("generated")
+                return challenge
+            self._count("rejected")
+        raise ValueError(f"Could not generate a valid {game_id} level {level} challenge (seed {seed})")
+    
+    def replay(self, game_id, level, seed):
+        """Regenerate the challenge that was served with this seed."""
+        return self.generate(game_id, level, seed)
+    
+    def _refill(self, key):
+        """Top up one pool to pool_size."""
+        version, products = self._get_catalog()
+        while True:
+            with self._lock:
+                pool = self._pools.setdefault(key, OrderedDict())
+                if len(pool) >= self.pool_size or self._catalog[0] != version:
+                    return
+                # Reserve the seed's place so rounds are served in seed order
+                seed = self._draw_seed(key)
+                pool[seed] = None
+            challenge = self.generate(*key, seed, products)
+            with self._lock:
+                # Drop challenges built from a catalog that changed meanwhile,
+                # or whose seed was already served while generating
+                if self._catalog[0] == version and seed in pool:
+                    pool[seed] = challenge
+    
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                keys = [key for key, pool in self._pools.items() if len(pool) < self.pool_size]
+            for key in keys:
+                try:
+                    self._refill(key)
+                except Exception as e:
+                    print(f"Error generating {key[0]} level {key[1]} challenges: {e}")
+    
+    def start(self, game_ids=None, levels=CHALLENGE_LEVELS):
+        """Start the background generator and fill the pools.
+        
+        Safe to call on every rerun; only the first call starts the thread.
+        """
+        with self._lock:
+            for game_id in game_ids or CHALLENGE_GENERATORS:
+                for level in levels:
+                    self._pools.setdefault((game_id, level), OrderedDict())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="challenge-pool", daemon=True)
+                self._thread.start()
+        self._wake.set()
+    
+    def take(self, game_id, level):
+        """Get a fresh challenge for a round.
+        
+        Served from the pool; if the next challenge is not ready yet (e.g.
+        right after startup) it is generated inline from the same seed.
+        
+        Returns:
+            dict: The challenge, including the seed it was generated from
+        """
+        # Empties the pools when the product catalog has changed
+        self._get_catalog()
+        
+        key = (game_id, level)
+        with self._lock:
+            pool = self._pools.setdefault(key, OrderedDict())
+            if pool:
+                seed, challenge = pool.popitem(last=False)
+            else:
+                seed, challenge = self._draw_seed(key), None
+            self.stats["served"] += 1
+            refill = len(pool) < self.pool_size // 2
+        if refill:
+            self.start([game_id], [level])
+        
+        if challenge is None:
+            self._count("misses")
+            challenge = self.generate(game_id, level, seed)
+        return challenge
+    
+    def get_stats(self):
+        """Get served/miss/generation counters and the number of ready challenges per pool."""
+        with self._lock:
+            return dict(
+                self.stats,
+                pools={
+                    f"{game_id}:{level}": sum(challenge is not None for challenge in pool.values())
+                    for (game_id, level), pool in self._pools.items()
+                }
+            )
+
+def load_challenge_pool_settings():
+    """Read pool settings from the "gameplay" section of the app config."""
+    from utils.config import load_config
+    
+    gameplay = load_config().get("gameplay") or {}
+    return {
+        "pool_size": gameplay.get("challenge_pool_size", DEFAULT_CHALLENGE_POOL_SIZE),
+        "seed": gameplay.get("challenge_seed")
+    }
+
+# Shared instance, started by the app
+challenge_pool = ChallengePool(**load_challenge_pool_settings())
@@ -0,0 +1,295 @@
+"""
+Challenge generators for Toko Pintar mini-games.
+
+Each generator is a pure function of (level, products, rng): it draws every
+random number from the `random.Random` it is given and does not touch the
+session or the database, so the same seed and product list always give the
+same challenge. Validators reject challenges a player could not solve.
+
+Rounds are normally served from pre-generated pools; see utils.challenge_pool.
+"""
+from utils.change_solver import RUPIAH_DENOMINATIONS, get_solver
+
+# Extra random notes drawn before topping up a payment that is still too small
+MAX_EXTRA_NOTES = 8
+
+def _sample(rng, population, count):
+    return rng.sample(population, max(0, min(count, len(population))))
+
+def _pay_at_least(payment, total, notes, rng):
+    """Add random notes until the payment covers the total.
+    
+    At most MAX_EXTRA_NOTES are drawn; any remaining shortfall is covered
+    with the largest allowed note, so the loop always ends.
+    """
+    for _ in range(MAX_EXTRA_NOTES):
+        if payment > total:
+            return payment
+        payment += rng.choice(notes)
+    if payment <= total:
+        largest = max(notes)
+        payment += ((total - payment) // largest + 1) * largest
+    return payment
+
+def generate_change_transaction(level, products, rng):
+    """Generate a change making transaction.
+    
+    Returns:
+        dict: level, items, total_price, payment and correct_change
+    """
+    # Determine number of items based on level
+    if level == 1:
+        num_items = 1  # Single item for beginners
+    elif level == 2:
+        num_items = 2  # Two items for level 2
+    elif level == 3:
+        num_items = 3  # Three items for level 3
+    else:
+        num_items = rng.randint(3, 5)  # Multiple items for advanced levels
+    
+    items_bought = [dict(item) for item in _sample(rng, products, num_items)]
+    
+    # Level 2 rounds to the nearest 500; other levels use exact prices
+    total_price = sum(item["sell_price"] for item in items_bought)
+    if level == 2:
+        total_price = round(total_price / 500) * 500
+    
+    denominations = list(RUPIAH_DENOMINATIONS)
+    payment_amount = 0
+    
+    if level == 1:
+        # Level 1: Payment is a single large bill for easier calculation
+        for denom in denominations:
+            if denom > total_price and denom <= 50000:  # Limit to 50k for beginners
+                payment_amount = denom
+                break
+        
+        # If no suitable denomination found, use 50000
+        if payment_amount == 0:
+            payment_amount = 50000
+    
+    elif level == 2:
+        # Level 2: Payment in the top 4 denominations
+        notes = denominations[:4]
+        payment_amount = _pay_at_least(rng.choice(notes), total_price, notes, rng)
+    
+    else:
+        # Levels 3-5: More notes from a wider range of denominations
+        note_counts = {3: (1, 2), 4: (2, 3)}.get(level, (2, 4))
+        notes = denominations[:{3: 7, 4: 8}.get(level, 10)]
+        for _ in range(rng.randint(*note_counts)):
+            payment_amount += rng.choice(notes)
+        payment_amount = _pay_at_least(payment_amount, total_price, notes, rng)
+    
+    return {
+        "level": level,
+        "items": items_bought,
+        "total_price": total_price,
+        "payment": payment_amount,
+        "correct_change": payment_amount - total_price
+    }
+
+def validate_change_transaction(challenge):
+    """Check that the change is positive and can be paid in Rupiah notes and coins."""
+    change = challenge["correct_change"]
+    return (
+        bool(challenge["items"])
+        and change > 0
+        and change == challenge["payment"] - challenge["total_price"]
+        and get_solver().min_pieces(change) >= 0
+    )
+
+def generate_margin_challenge(level, products, rng):
+    """Generate a margin calculator challenge.
+    
+    Returns:
+        dict: level, product, type and correct_answer plus the inputs of the
+            challenge type
+    """
+    product = dict(rng.choice(products))
+    
+    if level == 1:
+        # Level 1: Find selling price given buy price and margin (simple)
+        target_margin = rng.randint(20, 40)
+        return {
+            "level": level,
+            "product": product,
+            "type": "find_sell_price",
+            "target_margin": target_margin,
+            # Round to nearest 100
+            "correct_answer": round(product["buy_price"] * (1 + target_margin/100), -2)
+        }
+    
+    if level == 2:
+        # Level 2: Find margin percentage given buy and sell price
+        return {
+            "level": level,
+            "product": product,
+            "type": "find_margin_percent",
+            "correct_answer": round(((product["sell_price"] - product["buy_price"]) / product["buy_price"]) * 100)
+        }
+    
+    if level == 3:
+        # Level 3: Find profit given buy price, sell price, and quantity
+        quantity = rng.randint(5, 15)
+        return {
+            "level": level,
+            "product": product,
+            "type": "find_profit",
+            "quantity": quantity,
+            "correct_answer": (product["sell_price"] - product["buy_price"]) * quantity
+        }
+    
+    if level == 4:
+        # Level 4: Find break-even point given fixed costs and margins
+        fixed_cost = rng.randint(1, 5) * 100000  # Between 100K and 500K
+        margin_per_unit = product["sell_price"] - product["buy_price"]
+        return {
+            "level": level,
+            "product": product,
+            "type": "find_breakeven",
+            "fixed_cost": fixed_cost,
+            "correct_answer": round(fixed_cost / margin_per_unit) if margin_per_unit > 0 else None
+        }
+    
+    # Level 5: Find optimal price given elasticity
+    current_demand = rng.randint(50, 200)
+    # Price elasticity of demand. The markup formula needs elastic demand
+    # (elasticity > 1); inelastic values give no positive optimal price.
+    elasticity = round(rng.uniform(1.0, 2.0), 1)
+    if elasticity != 1:
+        optimal_markup = 1 / (elasticity - 1)
+        optimal_price = round(product["buy_price"] * (1 + optimal_markup), -2)
+    else:
+        # Special case for unit elasticity
+        optimal_price = product["sell_price"]
+    
+    return {
+        "level": level,
+        "product": product,
+        "type": "find_optimal_price",
+        "current_demand": current_demand,
+        "elasticity": elasticity,
+        "correct_answer": optimal_price
+    }
+
+def validate_margin_challenge(challenge):
+    """Check that the product is priced sensibly and the answer is defined."""
+    product = challenge["product"]
+    return (
+        product["buy_price"] > 0
+        and product["sell_price"] > product["buy_price"]
+        and challenge["correct_answer"] is not None
+        and challenge["correct_answer"] > 0
+    )
+
+def _select_inventory_products(level, products, rng):
+    """Pick the products to count for a level."""
+    if level == 1:
+        # Level 1: 3 simple products, one from each of the first three categories
+        products_by_category = {}
+        for product in products:
+            products_by_category.setdefault(product.get('category', 'Uncategorized'), []).append(product)
+        
+        selected = [rng.choice(group) for group in list(products_by_category.values())[:3]]
+        
+        # If we have fewer than 3 categories, fill with random products
+        remaining = [product for product in products if product not in selected]
+        selected.extend(_sample(rng, remaining, 3 - len(selected)))
+        return selected
+    
+    if level == 2:
+        # Level 2: 5 products including similar items from 2-3 categories
+        categories = sorted(set(p.get('category', 'Uncategorized') for p in products))
+        selected = []
+        for category in _sample(rng, categories, 3):
+            category_products = [p for p in products if p.get('category', 'Uncategorized') == category]
+            selected.extend(_sample(rng, category_products, 2))
+        
+        remaining = [product for product in products if product not in selected]
+        selected.extend(_sample(rng, remaining, 5 - len(selected)))
+        return selected[:5]
+    
+    # Levels 3-5: 7, 9 and 12 random products
+    return _sample(rng, products, {3: 7, 4: 9}.get(level, 12))
+
+def generate_inventory_challenge(level, products, rng):
+    """Generate an inventory counting round.
+    
+    Returns:
+        dict: level and items, each with the recorded stock and actual count
+    """
+    selected = [dict(product) for product in _select_inventory_products(level, products, rng)]
+    
+    # Level 4: mark some products as "damaged" or "misplaced"
+    if level == 4:
+        for product in selected[:3]:
+            product["issue"] = rng.choice(["damaged", "misplaced"])
+    
+    # Variation complexity increases with level
+    max_variation = min(level, 5)
+    
+    game_items = []
+    for item in selected:
+        stock = item["stock"] if "stock" in item else rng.randint(5, 25)
+        variation = rng.randint(-max_variation, max_variation)
+        
+        game_item = {
+            "id": item.get("product_id") or str(rng.randint(1000, 9999)),
+            "name": item["name"],
+            "name_id": item.get("name_id", item["name"]),
+            "stock": stock,
+            "actual_count": 0,
+            "user_count": 0
+        }
+        
+        if item.get("issue") == "damaged":
+            # Damaged items are excluded from the count
+            damage_amount = rng.randint(1, max(1, int(stock * 0.2)))  # Up to 20% damaged
+            stock -= damage_amount
+            game_item.update(stock=stock, issue="damaged", damage_amount=damage_amount)
+        elif item.get("issue") == "misplaced":
+            game_item.update(
+                issue="misplaced",
+                original_category=item.get("category", "Uncategorized"),
+                current_category=rng.choice(["Shelf A", "Shelf B", "Back Room", "Display"])
+            )
+        
+        game_item["actual_count"] = max(0, stock + variation)
+        game_items.append(game_item)
+    
+    return {"level": level, "items": game_items}
+
+def validate_inventory_challenge(challenge):
+    """Check that there is something to count."""
+    return bool(challenge["items"])
+
+# game_id -> (generator, validator)
+CHALLENGE_GENERATORS = {
+    "change_making": (generate_change_transaction, validate_change_transaction),
+    "margin_calculator": (generate_margin_challenge, validate_margin_challenge),
+    "inventory_game": (generate_inventory_challenge, validate_inventory_challenge)
+}
+
+# Allowed difference between an answer and the answer key, per challenge type
+ANSWER_TOLERANCES = {
+    "find_sell_price": 100,  # 100 Rp difference allowed
+    "find_margin_percent": 1,  # 1% difference allowed
+    "find_profit": 1000,  # 1000 Rp difference allowed
+    "find_breakeven": 1,  # 1 unit difference allowed
+    "find_optimal_price": 500,  # 500 Rp difference allowed
+    "give_change": 0  # change must be exact
+}
+
+# Margin calculator base score per level, before bonuses
+MARGIN_BASE_SCORES = {
+    1: 10,  # Level 1: Basic score
+    2: 15,  # Level 2: Slightly higher
+    3: 20,  # Level 3: Moderate
+    4: 25,  # Level 4: Challenging
+    5: 30   # Level 5: Expert
+}
+
+def is_answer_correct(challenge_type, user_answer, correct_answer):
+    """Check an answer against the key, allowing the type's tolerance."""
+    return abs(user_answer - correct_answer) <= ANSWER_TOLERANCES.get(challenge_type, 0)
@@ -0,0 +1,229 @@
+"""
+Optimal change solver for Toko Pintar application.
+
+Finds the fewest notes and coins that make up an amount for any set of
+denominations, including sets where the greedy "largest note first" rule
+is not optimal (e.g. 1, 3, 4 for 6 = 3 + 3).
+
+A solver builds a dynamic programming table once, up to a maximum amount,
+and then answers each query with a table lookup:
+
+    solver = get_solver()                      # Rupiah denominations
+    solver.solve(37500)                        # {100000: 0, ..., 500: 1, ...}
+    solver.min_pieces(np.array([100, 7300]))   # vectorized, no Python loop
+
+The table works in units of the denominations' greatest common divisor,
+so the Rupiah table up to Rp 1,000,000 has only 10,001 entries.
+"""
+import math
+import threading
+from functools import lru_cache, reduce
+import numpy as np
+
+# Indonesian Rupiah denominations, largest first
+RUPIAH_DENOMINATIONS = (100000, 50000, 20000, 10000, 5000, 2000, 1000, 500, 200, 100)
+
+DEFAULT_MAX_AMOUNT = 1_000_000
+
+_UNREACHABLE = np.iinfo(np.int32).max
+
+# Coins (in table units) below this are relaxed with a Python loop rather
+# than vectorized blocks
+_MIN_BLOCK = 32
+
+def _int_dtype(max_value):
+    """Smallest signed integer dtype, at least int16, that holds max_value."""
+    for dtype in (np.int16, np.int32):
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+def normalize_denominations(denominations):
+    """Sort denominations largest first and drop duplicates.
+
+    Raises:
+        ValueError: If the set is empty or has a non-positive value
+    """
+    values = tuple(sorted({int(d) for d in denominations}, reverse=True))
+    if not values or values[-1] <= 0:
+        raise ValueError(f"Denominations must be positive integers: {denominations!r}")
+    return values
+
+class ChangeSolver:
+    """Minimum-piece change table for one denomination set."""
+
+    def __init__(self, denominations=RUPIAH_DENOMINATIONS, max_amount=DEFAULT_MAX_AMOUNT):
+        self.denominations = normalize_denominations(denominations)
+        self.max_amount = int(max_amount)
+        self.unit = reduce(math.gcd, self.denominations)
+
+        size = self.max_amount // self.unit + 1
+        scaled = [d // self.unit for d in self.denominations]
+
+        # pieces[a]: fewest pieces for a * unit; last[a]: index of a coin in that solution
+        pieces = np.full(size, _UNREACHABLE, dtype=np.int32)
+        last = np.full(size, -1, dtype=_int_dtype(len(scaled)))
+        pieces[0] = 0
+
+        # Unbounded knapsack, one coin at a time. Within a coin, each block of
+        # `coin` amounts only depends on the block before it, so a block is
+        # relaxed with one vectorized comparison. Small coins would need too
+        # many tiny blocks, so they use a plain loop instead.
+        for index, coin in enumerate(scaled):
+            if coin < _MIN_BLOCK:
+                pieces_list, last_list = pieces.tolist(), last.tolist()
+                for amount in range(coin, size):
+                    candidate = pieces_list[amount - coin] + 1
+                    if candidate < pieces_list[amount]:
+                        pieces_list[amount] = candidate
+                        last_list[amount] = index
+                pieces = np.array(pieces_list, dtype=np.int32)
+                last = np.array(last_list, dtype=last.dtype)
+                continue
+
+            for start in range(coin, size, coin):
+                end = min(start + coin, size)
+                previous = pieces[start - coin:end - coin]
+                candidate = np.where(previous == _UNREACHABLE, _UNREACHABLE, previous + 1)
+                better = candidate < pieces[start:end]
+                if better.any():
+                    pieces[start:end][better] = candidate[better]
+                    last[start:end][better] = index
+
+        self._pieces = pieces
+        self._last = last
+        self._scaled = np.array(scaled, dtype=np.int64)
+        # Most pieces any amount can need: all of it in the smallest coin
+        self._count_dtype = _int_dtype((size - 1) // scaled[-1])
+        self._combinations = None  # built on first use by _get_combinations
+        self._lock = threading.Lock()
+
+    def _to_index(self, amounts):
+        """Convert amounts to table indexes; -1 for amounts that cannot be paid."""
+        amounts = np.asarray(amounts, dtype=np.int64)
+        if (amounts < 0).any() or (amounts > self.max_amount).any():
+            raise ValueError(f"Amounts must be between 0 and {self.max_amount}")
+        return np.where(amounts % self.unit == 0, amounts // self.unit, -1)
+
+    def _get_combinations(self):
+        """Build the (amount, denomination) -> count table.
+
+        Amounts are filled in order of their piece count, so each level is one
+        fancy-indexing step from the level before it.
+        """
+        if self._combinations is None:
+            with self._lock:
+                if self._combinations is None:
+                    combinations = np.zeros((len(self._pieces), len(self.denominations)), dtype=self._count_dtype)
+                    # Amounts sorted by piece count; bounds[level] is where each level starts
+                    order = np.argsort(self._pieces, kind="stable")
+                    reachable = self._pieces[self._pieces != _UNREACHABLE]
+                    top = int(reachable.max()) if len(reachable) else 0
+                    bounds = np.searchsorted(self._pieces[order], np.arange(top + 2))
+                    for level in range(1, top + 1):
+                        index = order[bounds[level]:bounds[level + 1]]
+                        coin = self._last[index]
+                        combinations[index] = combinations[index - self._scaled[coin]]
+                        combinations[index, coin] += 1
+                    self._combinations = combinations
+        return self._combinations
+
+    def min_pieces(self, amounts):
+        """Get the fewest pieces needed for each amount.
+
+        Args:
+            amounts (int or array-like): Amounts of money
+
+        Returns:
+            int or numpy.ndarray: Piece counts, -1 where the amount cannot be made
+        """
+        index = self._to_index(amounts)
+        pieces = np.where(index >= 0, self._pieces[np.maximum(index, 0)], -1)
+        pieces = np.where(pieces == _UNREACHABLE, -1, pieces)
+        return int(pieces) if pieces.ndim == 0 else pieces
+
+    def solve_many(self, amounts):
+        """Get optimal change for many amounts in one vectorized call.
+
+        Args:
+            amounts (array-like): Amounts of money
+
+        Returns:
+            numpy.ndarray: Array of shape (len(amounts), len(denominations))
+                with the count of each denomination, largest first. Rows for
+                amounts that cannot be made are all zeros; check min_pieces().
+        """
+        index = self._to_index(np.atleast_1d(amounts))
+        counts = self._get_combinations()[np.maximum(index, 0)]
+        counts[index < 0] = 0
+        return counts
+
+    def solve(self, amount):
+        """Get the optimal change for one amount.
+
+        Returns:
+            dict: denomination -> count, largest first, or None if the amount
+                cannot be made from these denominations
+        """
+        return solve_change(amount, self.denominations, self.max_amount)
+
+@lru_cache(maxsize=16)
+def _get_solver(denominations, max_amount):
+    return ChangeSolver(denominations, max_amount)
+
+def get_solver(denominations=RUPIAH_DENOMINATIONS, max_amount=DEFAULT_MAX_AMOUNT):
+    """Get the shared solver for a denomination set, building it on first use."""
+    return _get_solver(normalize_denominations(denominations), int(max_amount))
+
+@lru_cache(maxsize=4096)
+def _solve_change(denominations, amount, max_amount):
+    solver = _get_solver(denominations, max_amount)
+    index = int(solver._to_index(amount))
+    if index < 0 or solver._pieces[index] == _UNREACHABLE:
+        return None
+
+    # Walk back through the table one coin at a time
+    counts = [0] * len(denominations)
+    while index > 0:
+        coin = int(solver._last[index])
+        counts[coin] += 1
+        index -= int(solver._scaled[coin])
+    return tuple(counts)
+
+def solve_change(amount, denominations=RUPIAH_DENOMINATIONS, max_amount=DEFAULT_MAX_AMOUNT):
+    """Get the fewest notes and coins that make up an amount.
+
+    Results are cached per (denominations, amount).
+
+    Args:
+        amount (int): Amount of money
+        denominations (iterable, optional): Available denominations
+        max_amount (int, optional): Size of the solver table
+
+    Returns:
+        dict: denomination -> count, largest first, or None if the amount
+            cannot be made from these denominations
+    """
+    denominations = normalize_denominations(denominations)
+    counts = _solve_change(denominations, int(amount), int(max_amount))
+    if counts is None:
+        return None
+    return dict(zip(denominations, counts))
+
+def greedy_change(amount, denominations=RUPIAH_DENOMINATIONS):
+    """Get change by taking the largest denomination first.
+
+    Works for any amount, without a table, but is only optimal for
+    canonical sets such as Rupiah. Whatever cannot be paid exactly is left
+    out.
+
+    Returns:
+        dict: denomination -> count, largest first
+    """
+    result = {}
+    remaining = int(amount)
+    for denomination in normalize_denominations(denominations):
+        count = max(0, remaining // denomination)
+        result[denomination] = count
+        remaining -= count * denomination
+    return result
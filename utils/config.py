@@ -3,6 +3,7 @@ Configuration management for Toko Pintar application.
 """
 import os
 import json
+import threading
 import uuid
 import streamlit as st
 
@@ -28,17 +29,35 @@ DEFAULT_CONFIG = {
     "gameplay": {
         "max_skill_level": 5,
         "skill_increase_amount": 0.2,
-        "shop_level_threshold": 1.0
+        "shop_level_threshold": 1.0,
+        "challenge_pool_size": 20,  # pre-generated challenges per (game, level)
+        "challenge_seed": None,  # set for a reproducible challenge sequence per (game, level)
+        "compact_inventory_visuals": False,  # tiled emoji grids instead of one span per item
+        "game_fragments": True  # rerun only the game, not the whole app, on in-game input
     },
     "debug": {
         "enabled": True,  # Enable debug mode to verify calculations
         "log_level": "INFO"
+    },
+    "database": {
+        "storage_profile": "concurrent",  # see STORAGE_PROFILES in utils/db.py
+        "last_active_interval": 60  # minimum seconds between last_active writes
     }
 }
 
 # Path to config file
 CONFIG_FILE = os.path.join(DATA_DIR, 'config.json')
 
+# Database file. Set TOKO_PINTAR_DB_PATH to use another file, e.g. a
+# temporary copy for tests or profiling; it is read when the database
+# manager in utils.db is created.
+DB_PATH_ENV = "TOKO_PINTAR_DB_PATH"
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, 'user_data.db')
+
+def get_db_path():
+    """Get the database path from TOKO_PINTAR_DB_PATH, or the bundled database."""
+    return os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH
+
 def load_config():
     """Load configuration from file or create default if not exists."""
     if not os.path.exists(CONFIG_FILE):
@@ -181,54 +200,43 @@ SAMPLE_PRODUCTS = [
     {"name": "Mineral Water", "name_id": "Air Mineral", "buy_price": 2000, "sell_price": 3000, "stock": 24, "category": "Beverage"}
 ]
 
+# Bump when SAMPLE_PRODUCTS changes in a way existing databases should pick up
+PRODUCT_SEED_VERSION = 1
+
+_product_seed_lock = threading.Lock()
+_products_seeded = False
+
 def initialize_product_database():
-    """Initialize product database with sample data."""
-    from utils.db import db
+    """Initialize product database with sample data.
     
-    try:
-        # Check if products already exist
-        products = db.get_products()
-        if products:
+    Runs once per process; later calls return immediately without touching
+    the database.
+    """
+    global _products_seeded
+    if _products_seeded:
+        return
+    
+    with _product_seed_lock:
+        if _products_seeded:
             return
         
-        # Add sample products
-        for product in SAMPLE_PRODUCTS:
-            db.add_product(
-                name=product["name"],
-                name_id=product.get("name_id", product["name"]),
-                buy_price=product["buy_price"],
-                sell_price=product["sell_price"],
-                category=product["category"],
-                stock=product.get("stock", 0)
-            )
-    except Exception as e:
-        print(f"Error initializing product database: {e}")
+        from utils.db import db
+        
+        try:
+            db.seed_products(SAMPLE_PRODUCTS, PRODUCT_SEED_VERSION)
+            _products_seeded = True
+        except Exception as e:
+            print(f"Error initializing product database: {e}")
 
 def get_translation(key, language=None):
     """Get a translated string for the given key and language."""
+    from utils.i18n import get_lang_code, translate
+    
     if language is None:
         language = get_config('app.default_language')
     
-    # Load translation file
-    translation_file = os.path.join(I18N_DIR, f"{language}.json")
-    if not os.path.exists(translation_file):
-        # Create empty translation file
-        with open(translation_file, 'w') as f:
-            json.dump({}, f, indent=4)
-        return key
-    
-    try:
-        with open(translation_file, 'r') as f:
-            translations = json.load(f)
-            
-        if key in translations:
-            return translations[key]
-        else:
-            # Key not found, return the key itself
-            return key
-    except Exception as e:
-        print(f"Error loading translation: {e}")
-        return key
+    # Served from the in-memory catalog loaded by utils.i18n
+    return translate(key, get_lang_code(language))
         
 def generate_widget_key(prefix, identifier="", stable=False):
     """Generate a unique widget key with a prefix and optional identifier.
@@ -0,0 +1,197 @@
+"""
+Learning content store for Toko Pintar application.
+
+Pro tips, real-world examples, practice exercises and learning paths are
+kept as JSON files in assets/content. Each file is read the first time its
+content is needed and indexed once, so lookups are dictionary hits:
+
+    store = get_content_store()
+    store.get_tips("cash_handling", 3)             # tips for levels 1-3
+    store.get_tips("cash_handling", 3, "id")       # the same, in Indonesian
+    store.get_application("cash_handling", 3, "en")
+    store.get_exercises("cash_handling", 4)        # closest level with exercises
+
+Cumulative tip lists are built once per (skill, level, language) as tuples
+sharing the same tip dicts, so a lookup copies nothing. Returned content is
+shared and must not be modified.
+
+Edited files are picked up without a restart: a collection checks its
+file's modification time at most every RELOAD_CHECK_INTERVAL seconds and
+re-indexes it when it changed. If the new file cannot be loaded, the
+previous content stays in use.
+"""
+import os
+import json
+import threading
+import time
+
+CONTENT_DIR = os.path.join(os.path.dirname(__file__), '..', 'assets', 'content')
+
+# Seconds between modification time checks of a content file
+RELOAD_CHECK_INTERVAL = 2.0
+
+MAX_LEVEL = 5
+LANGUAGES = ("en", "id")
+
+def _clamp_level(level):
+    return min(MAX_LEVEL, max(1, int(level)))
+
+def _by_level(content):
+    """Convert the JSON level keys of {skill: {level: value}} to ints."""
+    return {
+        skill: {int(level): value for level, value in levels.items()}
+        for skill, levels in content.items()
+    }
+
+def _localize(texts, lang):
+    return texts[lang] if lang in texts else texts["en"]
+
+def _index_tips(content):
+    """(skill, level, lang) -> tips for levels 1..level; lang None keeps both languages."""
+    index = {}
+    for skill, levels in _by_level(content).items():
+        for lang in (None,) + LANGUAGES:
+            cumulative = ()
+            for level in range(1, MAX_LEVEL + 1):
+                tips = levels.get(level, ())
+                if lang is not None:
+                    tips = [
+                        {"title": _localize(tip["title"], lang), "content": _localize(tip["content"], lang)}
+                        for tip in tips
+                    ]
+                cumulative += tuple(tips)
+                index[(skill, level, lang)] = cumulative
+    return index
+
+def _index_applications(content):
+    """(skill, level, lang) -> example text of the closest level at or below level."""
+    index = {}
+    for skill, levels in _by_level(content).items():
+        closest = None
+        for level in range(1, MAX_LEVEL + 1):
+            closest = levels.get(level, closest)
+            if closest is None:
+                continue
+            index[(skill, level, None)] = closest
+            for lang in LANGUAGES:
+                if lang in closest:
+                    index[(skill, level, lang)] = closest[lang]
+    return index
+
+def _index_exercises(content):
+    """(skill, level) -> exercises of the closest level at or below level.
+    
+    Levels below the first one with exercises get the lowest level's.
+    """
+    index = {}
+    for skill, levels in _by_level(content).items():
+        available = sorted(level for level, exercises in levels.items() if exercises)
+        if not available:
+            continue
+        for level in range(1, MAX_LEVEL + 1):
+            closest = max((l for l in available if l <= level), default=available[0])
+            index[(skill, level)] = tuple(levels[closest])
+    return index
+
+class ContentCollection:
+    """One JSON content file with its index, loaded on first use."""
+    
+    def __init__(self, filename, build_index, content_dir=CONTENT_DIR):
+        self.path = os.path.join(content_dir, filename)
+        self._build_index = build_index
+        self._index = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _load(self, mtime):
+        with open(self.path, encoding='utf-8') as f:
+            content = json.load(f)
+        self._index = self._build_index(content)
+        self._mtime = mtime
+    
+    def get(self):
+        """Get the index, loading the file or reloading it if it changed."""
+        now = time.monotonic()
+        if self._index is not None and now - self._checked_at < RELOAD_CHECK_INTERVAL:
+            return self._index
+        
+        with self._lock:
+            if self._index is None or now - self._checked_at >= RELOAD_CHECK_INTERVAL:
+                try:
+                    mtime = os.stat(self.path).st_mtime_ns
+                    if mtime != self._mtime:
+                        self._load(mtime)
+                except (OSError, ValueError, KeyError) as e:
+                    if self._index is None:
+                        raise
+                    print(f"Keeping previous content, could not reload {self.path}: {e}")
+                self._checked_at = now
+        return self._index
+    
+    def reload(self):
+        """Re-read the file on the next access."""
+        with self._lock:
+            self._mtime = None
+            self._checked_at = 0.0
+
+class ContentStore:
+    """Learning content, indexed by skill, level and language."""
+    
+    def __init__(self, content_dir=CONTENT_DIR):
+        self.tips = ContentCollection("skill_tips.json", _index_tips, content_dir)
+        self.applications = ContentCollection("real_world_applications.json", _index_applications, content_dir)
+        self.exercises = ContentCollection("interactive_exercises.json", _index_exercises, content_dir)
+        self.learning_paths = ContentCollection("learning_paths.json", dict, content_dir)
+    
+    def get_tips(self, skill_key, level, lang=None):
+        """Get the tips for a skill up to and including a level.
+        
+        Args:
+            skill_key (str): Skill identifier
+            level (int): Skill level, clamped to 1-5
+            lang (str, optional): Language code. Without it each tip keeps
+                its title and content in every language.
+        
+        Returns:
+            tuple: Tips, or an empty tuple for unknown skills
+        """
+        return self.tips.get().get((skill_key, _clamp_level(level), lang), ())
+    
+    def get_application(self, skill_key, level, lang=None):
+        """Get the real-world examples for the closest level at or below a level.
+        
+        Returns:
+            str or dict: Text in the language, or a language -> text dict
+                without one; None if there are no examples
+        """
+        return self.applications.get().get((skill_key, _clamp_level(level), lang))
+    
+    def get_exercises(self, skill_key, level):
+        """Get the practice exercises for the closest level at or below a level.
+        
+        Returns:
+            tuple: Exercises, or an empty tuple for unknown skills
+        """
+        return self.exercises.get().get((skill_key, _clamp_level(level)), ())
+    
+    def get_learning_paths(self):
+        """Get all learning paths: path_id -> path."""
+        return self.learning_paths.get()
+    
+    def reload(self):
+        """Re-read every content file on its next access."""
+        for collection in (self.tips, self.applications, self.exercises, self.learning_paths):
+            collection.reload()
+
+_content_store = None
+_store_lock = threading.Lock()
+
+def get_content_store():
+    """Get the process-wide content store."""
+    global _content_store
+    if _content_store is None:
+        with _store_lock:
+            if _content_store is None:
+                _content_store = ContentStore()
+    return _content_store
@@ -4,8 +4,13 @@ Database operations for Toko Pintar application.
 import os
 import sqlite3
 import json
+import random
+import time
 import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional
 import streamlit as st
 import threading
 
@@ -13,115 +18,809 @@ import threading
 data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 os.makedirs(data_dir, exist_ok=True)
 
-# Thread-local storage for database connections
-thread_local = threading.local()
+# Storage profiles for the database file. journal_mode is stored in the
+# database itself; the other PRAGMAs are applied to every new connection.
+STORAGE_PROFILES = {
+    # Many concurrent sessions: readers never block the writer
+    "concurrent": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -16000,  # negative values are KiB
+        "busy_timeout": 5000,  # milliseconds
+        "write_retries": 6,
+        "retry_base_delay": 0.05,  # seconds
+        "retry_max_delay": 2.0  # seconds
+    },
+    # WAL with an fsync on every commit
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -16000,
+        "busy_timeout": 5000,
+        "write_retries": 6,
+        "retry_base_delay": 0.05,
+        "retry_max_delay": 2.0
+    },
+    # SQLite defaults, for file systems without shared memory support
+    "legacy": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "busy_timeout": 5000,
+        "write_retries": 3,
+        "retry_base_delay": 0.1,
+        "retry_max_delay": 2.0
+    }
+}
+
+DEFAULT_STORAGE_PROFILE = "concurrent"
+
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+def resolve_storage_profile(profile=None):
+    """Build a complete storage profile.
+    
+    Args:
+        profile (str or dict, optional): Profile name, or a dict with an optional
+            "profile" base name plus individual setting overrides
+    
+    Returns:
+        dict: Storage settings
+    """
+    if profile is None:
+        profile = DEFAULT_STORAGE_PROFILE
+    
+    if isinstance(profile, str):
+        overrides = {}
+        base_name = profile
+    else:
+        overrides = dict(profile)
+        base_name = overrides.pop("profile", DEFAULT_STORAGE_PROFILE)
+    
+    if base_name not in STORAGE_PROFILES:
+        print(f"Unknown storage profile '{base_name}', using '{DEFAULT_STORAGE_PROFILE}'")
+        base_name = DEFAULT_STORAGE_PROFILE
+    
+    settings = dict(STORAGE_PROFILES[base_name])
+    settings.update(overrides)
+    
+    # Validate values that end up inside PRAGMA statements
+    settings["journal_mode"] = str(settings["journal_mode"]).upper()
+    settings["synchronous"] = str(settings["synchronous"]).upper()
+    if settings["journal_mode"] not in JOURNAL_MODES:
+        raise ValueError(f"Invalid journal_mode: {settings['journal_mode']}")
+    if settings["synchronous"] not in SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Invalid synchronous level: {settings['synchronous']}")
+    for key in ("mmap_size", "cache_size", "busy_timeout", "write_retries"):
+        settings[key] = int(settings[key])
+    
+    return settings
+
+def load_storage_profile():
+    """Read the storage profile from the "database" section of the app config."""
+    from utils.config import load_config
+    
+    return (load_config().get("database") or {}).get("storage_profile")
+
+def is_lock_error(error):
+    """Check whether a SQLite error was caused by write contention."""
+    message = str(error).lower()
+    return isinstance(error, sqlite3.OperationalError) and ("locked" in message or "busy" in message)
+
+# Connection pool defaults
+DEFAULT_POOL_SIZE = 8
+DEFAULT_IDLE_TIMEOUT = 300  # seconds an unused connection is kept open
+DEFAULT_ACQUIRE_TIMEOUT = 10  # seconds to wait for a free connection
+
+class ConnectionPool:
+    """Bounded pool of long-lived SQLite connections.
+    
+    Each thread holds at most one connection at a time. Nested acquire()
+    calls on the same thread reuse it, so several DatabaseManager calls
+    inside one `session()` block share a single connection. When the
+    outermost caller releases it, the connection goes back to the pool
+    instead of being closed.
+    """
+    
+    def __init__(self, db_path, max_connections=DEFAULT_POOL_SIZE,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, acquire_timeout=DEFAULT_ACQUIRE_TIMEOUT,
+                 pragmas=None):
+        self.db_path = db_path
+        self.pragmas = pragmas or {}
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        
+        self._idle = []  # list of (connection, last_used) pairs, most recent last
+        self._size = 0  # open connections, idle or checked out
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._created = 0
+        self._reused = 0
+    
+    def _connect(self):
+        """Open a new SQLite connection."""
+        # Connections move between threads through the pool, but each one is
+        # only ever used by the thread that checked it out.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+    
+    def _is_healthy(self, conn):
+        """Check that a pooled connection is still usable."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    def _discard(self, conn):
+        """Close a connection and free its slot. Caller must hold the lock."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        self._size -= 1
+        self._condition.notify()
+    
+    def _prune_idle(self):
+        """Close connections idle for longer than idle_timeout. Caller must hold the lock."""
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.pop(0)
+            self._discard(conn)
+    
+    def _checkout(self):
+        """Take a connection from the pool, opening one if there is room."""
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                self._prune_idle()
+                while self._idle:
+                    conn, _ = self._idle.pop()
+                    if self._is_healthy(conn):
+                        self._reused += 1
+                        return conn
+                    self._discard(conn)
+                
+                if self._size < self.max_connections:
+                    self._size += 1
+                    break
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise sqlite3.OperationalError(
+                        f"Connection pool exhausted ({self.max_connections} connections in use)"
+                    )
+                self._condition.wait(remaining)
+        
+        try:
+            conn = self._connect()
+        except sqlite3.Error:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        self._created += 1
+        return conn
+    
+    def _checkin(self, conn):
+        """Return a connection to the pool."""
+        with self._condition:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                self._discard(conn)
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+    
+    def acquire(self):
+        """Get the current thread's connection, checking one out if needed."""
+        local = self._local
+        if getattr(local, 'conn', None) is not None:
+            local.depth += 1
+            return local.conn
+        
+        local.conn = self._checkout()
+        local.depth = 1
+        return local.conn
+    
+    def release(self):
+        """Release the current thread's connection.
+        
+        The connection only goes back to the pool once the outermost
+        acquire() on this thread has been released.
+        """
+        local = self._local
+        if getattr(local, 'conn', None) is None:
+            return
+        
+        local.depth -= 1
+        if local.depth > 0:
+            return
+        
+        conn = local.conn
+        local.conn = None
+        self._checkin(conn)
+    
+    def close_all(self):
+        """Close all idle connections."""
+        with self._condition:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+    
+    def stats(self):
+        """Get pool usage counters.
+        
+        Returns:
+            dict: Open, idle, created and reused connection counts
+        """
+        with self._condition:
+            return {
+                "open": self._size,
+                "idle": len(self._idle),
+                "max": self.max_connections,
+                "created": self._created,
+                "reused": self._reused
+            }
+
+# Skill columns in the skills table
+SKILL_COLUMNS = (
+    "inventory_management",
+    "cash_handling",
+    "pricing_strategy",
+    "customer_relations",
+    "bookkeeping"
+)
+
+# Score that counts as a perfect game (the score that earns full skill credit)
+PERFECT_SCORE = 30
+
+def _table_columns(cursor, table):
+    """Get the column names of a table."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {column[1] for column in cursor.fetchall()}
+
+def _add_user_metadata_column(cursor):
+    if 'metadata' not in _table_columns(cursor, 'users'):
+        cursor.execute("ALTER TABLE users ADD COLUMN metadata TEXT")
+
+def _add_product_stock_column(cursor):
+    if 'stock' not in _table_columns(cursor, 'products'):
+        cursor.execute("ALTER TABLE products ADD COLUMN stock INTEGER DEFAULT 0")
+
+def _add_lookup_indexes(cursor):
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_game_history_user_time ON game_history (user_id, timestamp)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_skills_user ON skills (user_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_name ON users (name)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_products_category ON products (category)")
+
+def _add_unique_achievement_index(cursor):
+    # Keep the earliest copy of any achievement that was awarded twice
+    cursor.execute('''
+    DELETE FROM achievements
+    WHERE achievement_id NOT IN (
+        SELECT MIN(achievement_id) FROM achievements GROUP BY user_id, achievement_type
+    )
+    ''')
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_achievements_user_type "
+        "ON achievements (user_id, achievement_type)"
+    )
+
+def _add_user_shop_name_column(cursor):
+    if 'shop_name' not in _table_columns(cursor, 'users'):
+        cursor.execute("ALTER TABLE users ADD COLUMN shop_name TEXT")
+    
+    # Backfill from the shop name stored in the metadata JSON
+    cursor.execute('''
+    UPDATE users
+    SET shop_name = trim(json_extract(metadata, '$.shop_name'))
+    WHERE shop_name IS NULL AND metadata IS NOT NULL AND json_valid(metadata)
+    ''')
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_login ON users (lower(name), lower(shop_name))"
+    )
+
+def _add_app_meta_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS app_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    ''')
+
+def _add_game_stats_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS game_stats (
+        user_id TEXT NOT NULL,
+        game_id TEXT NOT NULL,
+        play_count INTEGER NOT NULL DEFAULT 0,
+        best_score INTEGER NOT NULL DEFAULT 0,
+        last_score INTEGER NOT NULL DEFAULT 0,
+        average_score REAL NOT NULL DEFAULT 0,
+        perfect_streak INTEGER NOT NULL DEFAULT 0,
+        last_played TIMESTAMP,
+        PRIMARY KEY (user_id, game_id),
+        FOREIGN KEY (user_id) REFERENCES users(user_id)
+    ) WITHOUT ROWID
+    ''')
+    
+    # Backfill from existing history; history_id gives the play order
+    cursor.execute('''
+    INSERT OR REPLACE INTO game_stats
+        (user_id, game_id, play_count, best_score, last_score, average_score, perfect_streak, last_played)
+    SELECT
+        h.user_id,
+        h.game_id,
+        COUNT(*),
+        MAX(h.score),
+        (SELECT score FROM game_history
+         WHERE user_id = h.user_id AND game_id = h.game_id
+         ORDER BY history_id DESC LIMIT 1),
+        AVG(h.score),
+        (SELECT COUNT(*) FROM game_history
+         WHERE user_id = h.user_id AND game_id = h.game_id
+         AND history_id > COALESCE((
+             SELECT MAX(history_id) FROM game_history
+             WHERE user_id = h.user_id AND game_id = h.game_id AND score < ?
+         ), 0)),
+        MAX(h.timestamp)
+    FROM game_history h
+    GROUP BY h.user_id, h.game_id
+    ''', (PERFECT_SCORE,))
+
+def _add_history_paging_index(cursor):
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_game_history_user_id ON game_history (user_id, history_id)"
+    )
+
+# Schema migrations as (version, description, function) in the order they
+# are applied. Append new migrations with the next version number; never
+# change or reorder existing entries.
+MIGRATIONS = [
+    (1, "Add users.metadata column", _add_user_metadata_column),
+    (2, "Add products.stock column", _add_product_stock_column),
+    (3, "Add lookup indexes for history, skills, users and products", _add_lookup_indexes),
+    (4, "Deduplicate achievements and add unique (user_id, achievement_type) index",
+     _add_unique_achievement_index),
+    (5, "Add users.shop_name with a case-insensitive (name, shop_name) login index",
+     _add_user_shop_name_column),
+    (6, "Add app_meta table for data version markers", _add_app_meta_table),
+    (7, "Add per-user, per-game statistics table", _add_game_stats_table),
+    (8, "Add (user_id, history_id) index for paging game history", _add_history_paging_index)
+]
+
+@dataclass
+class PlayerProfile:
+    """A player's stored state, loaded in one read transaction."""
+    user_id: str
+    name: str
+    total_score: int
+    shop_level: int
+    shop_name: Optional[str] = None
+    metadata: dict = field(default_factory=dict)
+    skill_levels: dict = field(default_factory=dict)
+    achievements: list = field(default_factory=list)  # achievement rows, newest first
+    game_history: list = field(default_factory=list)  # game_history rows, newest first
+    game_stats: dict = field(default_factory=dict)  # game_id -> game_stats row
+
+def _insert_game_history(cursor, user_id, game_id, score, details=None):
+    """Insert a game_history row and update game_stats; returns the history_id."""
+    cursor.execute(
+        "INSERT INTO game_history (user_id, game_id, score, details) VALUES (?, ?, ?, ?)",
+        (user_id, game_id, score, json.dumps(details) if details else None)
+    )
+    history_id = cursor.lastrowid
+    cursor.execute(
+        '''
+        INSERT INTO game_stats
+            (user_id, game_id, play_count, best_score, last_score, average_score, perfect_streak, last_played)
+        VALUES (?, ?, 1, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT (user_id, game_id) DO UPDATE SET
+            play_count = play_count + 1,
+            best_score = MAX(best_score, excluded.best_score),
+            last_score = excluded.last_score,
+            average_score = average_score + (excluded.last_score - average_score) / (play_count + 1),
+            perfect_streak = CASE WHEN excluded.perfect_streak > 0 THEN perfect_streak + 1 ELSE 0 END,
+            last_played = excluded.last_played
+        ''',
+        (user_id, game_id, score, score, score, 1 if score >= PERFECT_SCORE else 0)
+    )
+    return history_id
+
+class WriteBatch:
+    """Unit of work that collects writes and applies them in one transaction.
+    
+    Use through DatabaseManager.batch():
+        with db.batch() as batch:
+            batch.update_total_score(user_id, 120)
+            batch.update_skills(user_id, skill_levels)
+    
+    Statements are (sql, params) pairs; an operation that needs the cursor
+    itself (e.g. for lastrowid) is queued as a callable with params None.
+    """
+    
+    def __init__(self, manager):
+        self.manager = manager
+        self.statements = []
+        self.receipts = []
+    
+    def __len__(self):
+        return len(self.statements)
+    
+    def add(self, sql, params=()):
+        """Queue a raw statement."""
+        self.statements.append((sql, params))
+    
+    def update_total_score(self, user_id, new_score):
+        """Queue a total score update."""
+        self.add("UPDATE users SET total_score = ? WHERE user_id = ?", (new_score, user_id))
+    
+    def update_shop_level(self, user_id, new_level):
+        """Queue a shop level update."""
+        self.add("UPDATE users SET shop_level = ? WHERE user_id = ?", (new_level, user_id))
+    
+    def update_last_active(self, user_id):
+        """Queue a last active timestamp update."""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.add("UPDATE users SET last_active = ? WHERE user_id = ?", (now, user_id))
+    
+    def update_skills(self, user_id, skill_levels):
+        """Queue an update of several skills as a single statement.
+        
+        Args:
+            user_id (str): User ID
+            skill_levels (dict): Skill name -> new value
+        """
+        skills = [(name, value) for name, value in skill_levels.items() if name in SKILL_COLUMNS]
+        if not skills:
+            return
+        assignments = ", ".join(f"{name} = ?" for name, _ in skills)
+        self.add(
+            f"UPDATE skills SET {assignments} WHERE user_id = ?",
+            tuple(value for _, value in skills) + (user_id,)
+        )
+    
+    def add_game_history(self, user_id, game_id, score, details=None):
+        """Queue a game history entry and its game statistics update.
+        
+        Returns:
+            dict: Receives the new "history_id" when the batch commits; stays
+                empty if it fails
+        """
+        receipt = {}
+        
+        def insert(cursor):
+            receipt["history_id"] = _insert_game_history(cursor, user_id, game_id, score, details)
+        
+        self.statements.append((insert, None))
+        self.receipts.append(receipt)
+        return receipt
+    
+    def add_achievements(self, user_id, achievement_types):
+        """Queue several achievements; ones the user already has are ignored."""
+        for achievement_type in achievement_types:
+            self.add(
+                "INSERT OR IGNORE INTO achievements (user_id, achievement_type) VALUES (?, ?)",
+                (user_id, achievement_type)
+            )
+    
+    def commit(self):
+        """Apply all queued statements in one transaction.
+        
+        Returns:
+            int: Number of statements applied
+        """
+        if not self.statements:
+            return 0
+        
+        statements = list(self.statements)
+        
+        def apply(cursor):
+            for sql, params in statements:
+                if callable(sql):
+                    sql(cursor)
+                else:
+                    cursor.execute(sql, params)
+        
+        try:
+            self.manager.execute_write(apply)
+        except sqlite3.Error:
+            # The IDs were rolled back with the transaction
+            for receipt in self.receipts:
+                receipt.clear()
+            raise
+        self.statements = []
+        self.receipts = []
+        return len(statements)
 
 class DatabaseManager:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 storage_profile=None):
         if db_path is None:
-            self.db_path = os.path.join(data_dir, 'user_data.db')
+            from utils.config import get_db_path
+            self.db_path = get_db_path()
         else:
             self.db_path = db_path
         
+        self.storage = resolve_storage_profile(storage_profile)
+        self.pool = ConnectionPool(
+            self.db_path,
+            max_connections=pool_size,
+            idle_timeout=idle_timeout,
+            pragmas={
+                "busy_timeout": self.storage["busy_timeout"],
+                "synchronous": self.storage["synchronous"],
+                "cache_size": self.storage["cache_size"],
+                "mmap_size": self.storage["mmap_size"]
+            }
+        )
+        
+        # Write contention counters
+        self._lock_stats_lock = threading.Lock()
+        self.lock_stats = {
+            "lock_waits": 0,
+            "retried_writes": 0,
+            "failed_writes": 0,
+            "wait_seconds": 0.0
+        }
+        
+        # Product catalog cache: category (None for all) -> tuple of product dicts
+        self._product_cache = {}
+        self._product_cache_lock = threading.Lock()
+        self.product_data_version = 0
+        self.product_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+        
         # Make sure tables exist
         self.ensure_tables_exist()
     
     def get_connection(self):
-        """Get or create SQLite connection for the current thread."""
-        if not hasattr(thread_local, 'conn') or thread_local.conn is None:
-            thread_local.conn = sqlite3.connect(self.db_path)
-            thread_local.conn.row_factory = sqlite3.Row
-        return thread_local.conn
+        """Get the pooled SQLite connection for the current thread."""
+        return self.pool.acquire()
     
     def close_connection(self):
-        """Close the database connection for the current thread."""
-        if hasattr(thread_local, 'conn') and thread_local.conn:
-            thread_local.conn.close()
-            thread_local.conn = None
+        """Release the current thread's connection back to the pool."""
+        self.pool.release()
+    
+    @contextmanager
+    def session(self):
+        """Share one pooled connection across several calls.
+        
+        Example:
+            with db.session():
+                user = db.get_user(user_id)
+                skills = db.get_skills(user_id)
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.close_connection()
+    
+    @contextmanager
+    def batch(self):
+        """Collect writes and commit them in a single transaction on exit.
+        
+        Nothing is written if the block raises.
+        """
+        batch = WriteBatch(self)
+        with self.session():
+            yield batch
+            batch.commit()
+    
+    def _record_lock_wait(self, delay=0.0, retried=False, failed=False):
+        """Update the write contention counters."""
+        with self._lock_stats_lock:
+            self.lock_stats["lock_waits"] += 1
+            self.lock_stats["wait_seconds"] += delay
+            if retried:
+                self.lock_stats["retried_writes"] += 1
+            if failed:
+                self.lock_stats["failed_writes"] += 1
+    
+    def get_lock_stats(self):
+        """Get write contention counters for monitoring.
+        
+        Returns:
+            dict: Lock waits, retried and failed writes, and total backoff time
+        """
+        with self._lock_stats_lock:
+            return dict(self.lock_stats)
+    
+    def execute_write(self, operation):
+        """Run a write in its own transaction, retrying when the database is locked.
+        
+        The transaction is started with BEGIN IMMEDIATE so the write lock is
+        taken up front. Lock errors are retried with jittered exponential
+        backoff; other errors are rolled back and raised.
+        
+        Args:
+            operation (callable): Called with a cursor; performs the statements
+        
+        Returns:
+            The return value of operation
+        
+        Raises:
+            sqlite3.Error: If the write fails or the retries are exhausted
+        """
+        retries = self.storage["write_retries"]
+        base_delay = self.storage["retry_base_delay"]
+        max_delay = self.storage["retry_max_delay"]
+        
+        conn = self.get_connection()
+        try:
+            attempt = 0
+            while True:
+                try:
+                    cursor = conn.cursor()
+                    if not conn.in_transaction:
+                        cursor.execute("BEGIN IMMEDIATE")
+                    result = operation(cursor)
+                    conn.commit()
+                    return result
+                except sqlite3.Error as e:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    if not is_lock_error(e) or attempt >= retries:
+                        if is_lock_error(e):
+                            self._record_lock_wait(failed=True)
+                        raise
+                    
+                    # Full jitter keeps writers that collided from retrying in lockstep
+                    delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+                    self._record_lock_wait(delay, retried=True)
+                    attempt += 1
+                    time.sleep(delay)
+        finally:
+            self.close_connection()
     
     def ensure_tables_exist(self):
         """Create tables if they don't exist."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.session() as conn:
+            cursor = conn.cursor()
+            
+            # Journal mode is persistent, so it only needs to be set once per file
+            try:
+                cursor.execute(f"PRAGMA journal_mode = {self.storage['journal_mode']}")
+            except sqlite3.Error as e:
+                print(f"Error setting journal mode: {e}")
+            
+            # Create users table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                user_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                total_score INTEGER DEFAULT 0,
+                shop_level INTEGER DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+            
+            # Create skills table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS skills (
+                skill_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                inventory_management REAL DEFAULT 0,
+                cash_handling REAL DEFAULT 0,
+                pricing_strategy REAL DEFAULT 0,
+                customer_relations REAL DEFAULT 0,
+                bookkeeping REAL DEFAULT 0,
+                FOREIGN KEY (user_id) REFERENCES users(user_id)
+            )
+            ''')
+            
+            # Create game_history table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS game_history (
+                history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                game_id TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                details TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(user_id)
+            )
+            ''')
+            
+            # Create achievements table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS achievements (
+                achievement_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                achievement_type TEXT NOT NULL,
+                earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                shown BOOLEAN DEFAULT 0,
+                FOREIGN KEY (user_id) REFERENCES users(user_id)
+            )
+            ''')
+            
+            # Create game_configs table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS game_configs (
+                config_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                game_id TEXT NOT NULL,
+                level INTEGER NOT NULL,
+                config_data TEXT NOT NULL,
+                UNIQUE(game_id, level)
+            )
+            ''')
+            
+            # Create products table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS products (
+                product_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                name_id TEXT,
+                buy_price INTEGER NOT NULL,
+                sell_price INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                image_path TEXT,
+                stock INTEGER DEFAULT 0
+            )
+            ''')
+            
+            # Create schema_version table
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+            
+            conn.commit()
         
-        # Create users table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            user_id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            total_score INTEGER DEFAULT 0,
-            shop_level INTEGER DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Create skills table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS skills (
-            skill_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            inventory_management REAL DEFAULT 0,
-            cash_handling REAL DEFAULT 0,
-            pricing_strategy REAL DEFAULT 0,
-            customer_relations REAL DEFAULT 0,
-            bookkeeping REAL DEFAULT 0,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-        ''')
-        
-        # Create game_history table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS game_history (
-            history_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            game_id TEXT NOT NULL,
-            score INTEGER NOT NULL,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            details TEXT,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-        ''')
-        
-        # Create achievements table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS achievements (
-            achievement_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id TEXT NOT NULL,
-            achievement_type TEXT NOT NULL,
-            earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            shown BOOLEAN DEFAULT 0,
-            FOREIGN KEY (user_id) REFERENCES users(user_id)
-        )
-        ''')
-        
-        # Create game_configs table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS game_configs (
-            config_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            game_id TEXT NOT NULL,
-            level INTEGER NOT NULL,
-            config_data TEXT NOT NULL,
-            UNIQUE(game_id, level)
-        )
-        ''')
-        
-        # Create products table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS products (
-            product_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            name_id TEXT,
-            buy_price INTEGER NOT NULL,
-            sell_price INTEGER NOT NULL,
-            category TEXT NOT NULL,
-            image_path TEXT,
-            stock INTEGER DEFAULT 0
-        )
-        ''')
+        self.apply_migrations()
+    
+    def get_schema_version(self):
+        """Get the highest applied migration version."""
+        conn = self.get_connection()
+        try:
+            return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+        finally:
+            self.close_connection()
+    
+    def apply_migrations(self):
+        """Apply pending schema migrations, each in its own transaction.
         
-        conn.commit()
-        self.close_connection()
+        Returns:
+            int: Number of migrations applied
+        """
+        applied = 0
+        for version, description, migrate in MIGRATIONS:
+            if version <= self.get_schema_version():
+                continue
+            
+            def run_migration(cursor):
+                # Another process may have applied it while we waited for the lock
+                cursor.execute("SELECT 1 FROM schema_version WHERE version = ?", (version,))
+                if cursor.fetchone():
+                    return False
+                migrate(cursor)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (version, description)
+                )
+                return True
+            
+            if self.execute_write(run_migration):
+                print(f"Applied database migration {version}: {description}")
+                applied += 1
+        return applied
     
     # User methods
     def create_user(self, name, extra_data=None):
@@ -135,42 +834,30 @@ class DatabaseManager:
             str: User ID or None if error
         """
         user_id = str(uuid.uuid4())
-        conn = self.get_connection()
-        cursor = conn.cursor()
         
-        # Check if we need to alter the users table to add a metadata column
-        try:
-            cursor.execute("PRAGMA table_info(users)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'metadata' not in columns:
-                cursor.execute("ALTER TABLE users ADD COLUMN metadata TEXT")
-                conn.commit()
-        except sqlite3.Error as e:
-            print(f"Error checking/adding metadata column: {e}")
+        # Prepare metadata JSON if provided
+        metadata_json = None
+        shop_name = None
+        if extra_data:
+            metadata_json = json.dumps(extra_data)
+            shop_name = (extra_data.get("shop_name") or "").strip() or None
         
-        try:
-            # Prepare metadata JSON if provided
-            metadata_json = None
-            if extra_data:
-                metadata_json = json.dumps(extra_data)
-            
+        def insert_user(cursor):
             cursor.execute(
-                "INSERT INTO users (user_id, name, metadata) VALUES (?, ?, ?)",
-                (user_id, name, metadata_json)
+                "INSERT INTO users (user_id, name, metadata, shop_name) VALUES (?, ?, ?, ?)",
+                (user_id, name, metadata_json, shop_name)
             )
             cursor.execute(
                 "INSERT INTO skills (user_id) VALUES (?)",
                 (user_id,)
             )
-            conn.commit()
+        
+        try:
+            self.execute_write(insert_user)
             return user_id
         except sqlite3.Error as e:
-            conn.rollback()
             print(f"Database error: {e}")
             return None
-        finally:
-            self.close_connection()
     
     def get_user(self, user_id):
         """Get user by ID."""
@@ -184,87 +871,56 @@ class DatabaseManager:
             self.close_connection()
     
     def get_user_by_name_and_shop(self, name, shop_name):
-        """Get user by name and shop name (from metadata)."""
+        """Get user by name and shop name, ignoring case.
+        
+        Served by the (lower(name), lower(shop_name)) index.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         try:
             cursor.execute(
-                "SELECT * FROM users WHERE name = ?",
-                (name,)
+                "SELECT * FROM users WHERE lower(name) = lower(?) AND lower(shop_name) = lower(?) LIMIT 1",
+                (name.strip(), shop_name.strip())
             )
-            users = cursor.fetchall()
-            for user in users:
-                # Check metadata for shop name
-                metadata = user["metadata"] if "metadata" in user.keys() else None
-                if metadata:
-                    try:
-                        meta_dict = json.loads(metadata)
-                        if meta_dict.get("shop_name", "").strip().lower() == shop_name.strip().lower():
-                            return dict(user)
-                    except Exception:
-                        continue
-            return None
+            result = cursor.fetchone()
+            return dict(result) if result else None
         finally:
             self.close_connection()
     
     def update_last_active(self, user_id):
         """Update user's last active timestamp."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cursor.execute(
-                "UPDATE users SET last_active = ? WHERE user_id = ?",
-                (now, user_id)
-            )
-            conn.commit()
-        finally:
-            self.close_connection()
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.execute_write(lambda cursor: cursor.execute(
+            "UPDATE users SET last_active = ? WHERE user_id = ?",
+            (now, user_id)
+        ))
     
     def update_total_score(self, user_id, new_score):
         """Update user's total score."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "UPDATE users SET total_score = ? WHERE user_id = ?",
-                (new_score, user_id)
-            )
-            conn.commit()
-        finally:
-            self.close_connection()
+        self.execute_write(lambda cursor: cursor.execute(
+            "UPDATE users SET total_score = ? WHERE user_id = ?",
+            (new_score, user_id)
+        ))
     
     def update_shop_level(self, user_id, new_level):
         """Update user's shop level."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "UPDATE users SET shop_level = ? WHERE user_id = ?",
-                (new_level, user_id)
-            )
-            conn.commit()
-        finally:
-            self.close_connection()
+        self.execute_write(lambda cursor: cursor.execute(
+            "UPDATE users SET shop_level = ? WHERE user_id = ?",
+            (new_level, user_id)
+        ))
     
     # Skills methods
     def update_skill(self, user_id, skill_name, new_value):
         """Update a single skill value."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute(
+            self.execute_write(lambda cursor: cursor.execute(
                 f"UPDATE skills SET {skill_name} = ? WHERE user_id = ?",
                 (new_value, user_id)
-            )
-            conn.commit()
+            ))
             return True
         except sqlite3.Error as e:
-            conn.rollback()
             print(f"Database error updating skill: {e}")
             return False
-        finally:
-            self.close_connection()
     
     def get_skills(self, user_id):
         """Get all skills for a user."""
@@ -279,22 +935,20 @@ class DatabaseManager:
     
     # Game history methods
     def add_game_history(self, user_id, game_id, score, details=None):
-        """Add a game history entry."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        """Add a game history entry and update the game's statistics.
+        
+        Both writes happen in the same transaction.
+        
+        Returns:
+            int: The new history_id, or False on error
+        """
         try:
-            cursor.execute(
-                "INSERT INTO game_history (user_id, game_id, score, details) VALUES (?, ?, ?, ?)",
-                (user_id, game_id, score, json.dumps(details) if details else None)
+            return self.execute_write(
+                lambda cursor: _insert_game_history(cursor, user_id, game_id, score, details)
             )
-            conn.commit()
-            return True
         except sqlite3.Error as e:
-            conn.rollback()
             print(f"Database error adding game history: {e}")
             return False
-        finally:
-            self.close_connection()
     
     def get_game_history(self, user_id, limit=10):
         """Get recent game history for a user."""
@@ -309,32 +963,175 @@ class DatabaseManager:
         finally:
             self.close_connection()
     
-    # Achievement methods
-    def add_achievement(self, user_id, achievement_type):
-        """Add a new achievement."""
+    def get_game_history_page(self, user_id, before_id=None, limit=20):
+        """Get one page of a user's game history, newest first.
+        
+        Pages are keyed on history_id rather than OFFSET, so every page is an
+        index range scan however far back it is.
+        
+        Args:
+            user_id (str): User ID
+            before_id (int, optional): Only return games older than this
+                history_id. Defaults to starting from the newest game.
+            limit (int, optional): Page size
+        
+        Returns:
+            tuple: (rows, next_before_id); next_before_id is None on the last page
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         try:
-            # Check if achievement already exists
+            if before_id is None:
+                cursor.execute(
+                    "SELECT * FROM game_history WHERE user_id = ? ORDER BY history_id DESC LIMIT ?",
+                    (user_id, limit)
+                )
+            else:
+                cursor.execute(
+                    "SELECT * FROM game_history WHERE user_id = ? AND history_id < ? "
+                    "ORDER BY history_id DESC LIMIT ?",
+                    (user_id, before_id, limit)
+                )
+            rows = [dict(row) for row in cursor.fetchall()]
+        finally:
+            self.close_connection()
+        
+        next_before_id = rows[-1]["history_id"] if len(rows) == limit else None
+        return rows, next_before_id
+
+    def load_player_profile(self, user_id, history_limit=10):
+        """Load a user, their skills, achievements, recent games and game stats together.
+        
+        All reads run in one transaction on one connection, so the profile is
+        a consistent snapshot. Called inside a session with an open
+        transaction, the reads join it and the transaction is left open.
+        
+        Args:
+            user_id (str): User ID
+            history_limit (int, optional): Number of recent games to include
+        
+        Returns:
+            PlayerProfile: The profile, or None if the user does not exist
+        """
+        skill_columns = ", ".join(f"s.{name}" for name in SKILL_COLUMNS)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        # Inside a caller's transaction, read within it and leave it open
+        owns_transaction = not conn.in_transaction
+        try:
+            if owns_transaction:
+                cursor.execute("BEGIN")
             cursor.execute(
-                "SELECT COUNT(*) FROM achievements WHERE user_id = ? AND achievement_type = ?",
-                (user_id, achievement_type)
+                f"SELECT u.*, {skill_columns} FROM users u "
+                "LEFT JOIN skills s ON s.user_id = u.user_id WHERE u.user_id = ?",
+                (user_id,)
             )
-            if cursor.fetchone()[0] > 0:
-                return False  # Achievement already exists
-                
+            user = cursor.fetchone()
+            if not user:
+                return None
+            
+            cursor.execute(
+                "SELECT * FROM achievements WHERE user_id = ? ORDER BY earned_at DESC",
+                (user_id,)
+            )
+            achievements = [dict(row) for row in cursor.fetchall()]
+            
+            cursor.execute(
+                "SELECT * FROM game_history WHERE user_id = ? ORDER BY timestamp DESC LIMIT ?",
+                (user_id, history_limit)
+            )
+            game_history = [dict(row) for row in cursor.fetchall()]
+            
+            cursor.execute("SELECT * FROM game_stats WHERE user_id = ?", (user_id,))
+            game_stats = {row["game_id"]: dict(row) for row in cursor.fetchall()}
+        finally:
+            if owns_transaction and conn.in_transaction:
+                conn.rollback()
+            self.close_connection()
+        
+        metadata = {}
+        if user["metadata"]:
+            try:
+                metadata = json.loads(user["metadata"])
+            except json.JSONDecodeError:
+                print(f"Error parsing user metadata JSON")
+        
+        return PlayerProfile(
+            user_id=user["user_id"],
+            name=user["name"],
+            total_score=user["total_score"],
+            shop_level=user["shop_level"],
+            shop_name=user["shop_name"],
+            metadata=metadata,
+            skill_levels={name: user[name] if user[name] is not None else 0 for name in SKILL_COLUMNS},
+            achievements=achievements,
+            game_history=game_history,
+            game_stats=game_stats
+        )
+    
+    def get_game_stats(self, user_id, game_id=None):
+        """Get play statistics maintained alongside the game history.
+        
+        Args:
+            user_id (str): User ID
+            game_id (str, optional): Only return this game's statistics
+        
+        Returns:
+            dict: game_id -> statistics (play_count, best_score, last_score,
+                average_score, perfect_streak, last_played). With game_id, that
+                game's statistics or None if it was never played.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            if game_id:
+                cursor.execute(
+                    "SELECT * FROM game_stats WHERE user_id = ? AND game_id = ?",
+                    (user_id, game_id)
+                )
+                result = cursor.fetchone()
+                return dict(result) if result else None
+            
+            cursor.execute("SELECT * FROM game_stats WHERE user_id = ?", (user_id,))
+            return {row["game_id"]: dict(row) for row in cursor.fetchall()}
+        finally:
+            self.close_connection()
+    
+    # Achievement methods
+    def add_achievement(self, user_id, achievement_type):
+        """Add a new achievement."""
+        def insert_achievement(cursor):
+            # The unique (user_id, achievement_type) index skips duplicates
             cursor.execute(
-                "INSERT INTO achievements (user_id, achievement_type) VALUES (?, ?)",
+                "INSERT OR IGNORE INTO achievements (user_id, achievement_type) VALUES (?, ?)",
                 (user_id, achievement_type)
             )
-            conn.commit()
-            return True
+            return cursor.rowcount > 0
+        
+        try:
+            return self.execute_write(insert_achievement)
         except sqlite3.Error as e:
-            conn.rollback()
             print(f"Database error adding achievement: {e}")
             return False
-        finally:
-            self.close_connection()
+    
+    def add_achievements(self, user_id, achievement_types):
+        """Add several achievements in one transaction.
+        
+        Returns:
+            int: Number of achievements that were new
+        """
+        def insert_achievements(cursor):
+            cursor.executemany(
+                "INSERT OR IGNORE INTO achievements (user_id, achievement_type) VALUES (?, ?)",
+                [(user_id, achievement_type) for achievement_type in achievement_types]
+            )
+            return cursor.rowcount
+        
+        try:
+            return self.execute_write(insert_achievements)
+        except sqlite3.Error as e:
+            print(f"Database error adding achievements: {e}")
+            return 0
     
     def get_achievements(self, user_id):
         """Get all achievements for a user."""
@@ -351,53 +1148,140 @@ class DatabaseManager:
     
     def mark_achievement_shown(self, achievement_id):
         """Mark an achievement as shown to the user."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute(
+            self.execute_write(lambda cursor: cursor.execute(
                 "UPDATE achievements SET shown = 1 WHERE achievement_id = ?",
                 (achievement_id,)
-            )
-            conn.commit()
+            ))
             return True
         except sqlite3.Error as e:
-            conn.rollback()
             print(f"Database error marking achievement shown: {e}")
             return False
-        finally:
-            self.close_connection()
     
     # Product methods
     def add_product(self, name, buy_price, sell_price, category, name_id=None, image_path=None, stock=0):
         """Add a new product."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
+        def insert_product(cursor):
             cursor.execute(
                 "INSERT INTO products (name, name_id, buy_price, sell_price, category, image_path, stock) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (name, name_id, buy_price, sell_price, category, image_path, stock)
             )
-            conn.commit()
             return cursor.lastrowid
+        
+        try:
+            product_id = self.execute_write(insert_product)
         except sqlite3.Error as e:
-            conn.rollback()
             print(f"Database error adding product: {e}")
             return None
-        finally:
-            self.close_connection()
+        
+        self.invalidate_product_cache()
+        return product_id
+    
+    def seed_products(self, products, seed_version):
+        """Insert sample products into an empty products table.
+        
+        Runs at most once per seed_version: the version is recorded in the
+        app_meta table, so later startups skip both the check and the insert.
+        
+        Args:
+            products (list): Product dicts as in utils.config.SAMPLE_PRODUCTS
+            seed_version (int): Version of the sample product data
+        
+        Returns:
+            int: Number of products inserted
+        """
+        def seed(cursor):
+            cursor.execute("SELECT value FROM app_meta WHERE key = 'product_seed_version'")
+            row = cursor.fetchone()
+            if row and int(row[0]) >= seed_version:
+                return 0
+            
+            inserted = 0
+            cursor.execute("SELECT 1 FROM products LIMIT 1")
+            if cursor.fetchone() is None:
+                cursor.executemany(
+                    "INSERT INTO products (name, name_id, buy_price, sell_price, category, image_path, stock) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            product["name"],
+                            product.get("name_id", product["name"]),
+                            product["buy_price"],
+                            product["sell_price"],
+                            product["category"],
+                            product.get("image_path"),
+                            product.get("stock", 0)
+                        )
+                        for product in products
+                    ]
+                )
+                inserted = len(products)
+            
+            cursor.execute(
+                "INSERT OR REPLACE INTO app_meta (key, value) VALUES ('product_seed_version', ?)",
+                (str(seed_version),)
+            )
+            return inserted
+        
+        inserted = self.execute_write(seed)
+        if inserted:
+            self.invalidate_product_cache()
+        return inserted
+    
+    def invalidate_product_cache(self):
+        """Drop cached product lists and bump the product data version.
+        
+        Call this after changing the products table outside of add_product.
+        """
+        with self._product_cache_lock:
+            self._product_cache.clear()
+            self.product_data_version += 1
+            self.product_cache_stats["invalidations"] += 1
+    
+    def get_product_cache_stats(self):
+        """Get product cache hit/miss counters.
+        
+        Returns:
+            dict: Hits, misses, invalidations, cached keys and data version
+        """
+        with self._product_cache_lock:
+            stats = dict(self.product_cache_stats)
+            stats["cached_keys"] = len(self._product_cache)
+            stats["data_version"] = self.product_data_version
+            return stats
     
     def get_products(self, category=None):
-        """Get all products, optionally filtered by category."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            if category:
-                cursor.execute("SELECT * FROM products WHERE category = ?", (category,))
-            else:
-                cursor.execute("SELECT * FROM products")
-            return [dict(row) for row in cursor.fetchall()]
-        finally:
-            self.close_connection()
+        """Get all products, optionally filtered by category.
+        
+        Served from an in-process cache after the first load. Each call gets
+        fresh dict copies, so callers may modify the products they receive.
+        """
+        key = category or None
+        with self._product_cache_lock:
+            products = self._product_cache.get(key)
+            if products is not None:
+                self.product_cache_stats["hits"] += 1
+            version = self.product_data_version
+        
+        if products is None:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            try:
+                if category:
+                    cursor.execute("SELECT * FROM products WHERE category = ?", (category,))
+                else:
+                    cursor.execute("SELECT * FROM products")
+                products = tuple(dict(row) for row in cursor.fetchall())
+            finally:
+                self.close_connection()
+            
+            with self._product_cache_lock:
+                self.product_cache_stats["misses"] += 1
+                # Don't cache a result that an invalidation raced past
+                if version == self.product_data_version:
+                    self._product_cache[key] = products
+        
+        return [dict(product) for product in products]
     
     def get_product(self, product_id):
         """Get a product by ID."""
@@ -411,49 +1295,35 @@ class DatabaseManager:
             self.close_connection()
 
 # Create a singleton instance for use in Streamlit
-db = DatabaseManager()
+db = DatabaseManager(storage_profile=load_storage_profile())
 
 # Helper function to initialize session from database
 def initialize_session_from_db(user_id):
     """Initialize Streamlit session state from database for a user."""
-    user = db.get_user(user_id)
-    if not user:
+    from utils.game_history import GameHistory, DEFAULT_HISTORY_CAPACITY
+
+    profile = db.load_player_profile(user_id, history_limit=DEFAULT_HISTORY_CAPACITY)
+    if not profile:
         return False
     
-    skills = db.get_skills(user_id)
-    achievements_db = db.get_achievements(user_id)
-    game_history = db.get_game_history(user_id)
-    
     # Update session state
     st.session_state.user_id = user_id
-    st.session_state.player_name = user['name']
-    st.session_state.total_score = user['total_score']
-    st.session_state.shop_level = user['shop_level']
+    st.session_state.player_name = profile.name
+    st.session_state.total_score = profile.total_score
+    st.session_state.shop_level = profile.shop_level
     
-    # Parse metadata JSON if exists
-    if 'metadata' in user and user['metadata']:
-        try:
-            metadata = json.loads(user['metadata'])
-            # Add each metadata key to session state
-            for key, value in metadata.items():
-                st.session_state[key] = value
-        except json.JSONDecodeError:
-            print(f"Error parsing user metadata JSON")
+    # Add each metadata key to session state
+    for key, value in profile.metadata.items():
+        st.session_state[key] = value
     
     # Update skill levels
-    st.session_state.skill_levels = {
-        "inventory_management": skills['inventory_management'],
-        "cash_handling": skills['cash_handling'],
-        "pricing_strategy": skills['pricing_strategy'],
-        "customer_relations": skills['customer_relations'],
-        "bookkeeping": skills['bookkeeping']
-    }
+    st.session_state.skill_levels = dict(profile.skill_levels)
     
     # Update achievements - convert database format to session format
-    from utils.achievements import get_achievement_details
+    from utils.achievements import get_achievement_details, reset_achievement_counters
     
     st.session_state.achievements = []
-    for achievement_db in achievements_db:
+    for achievement_db in profile.achievements:
         achievement_id = achievement_db.get('achievement_type')
         achievement_details = get_achievement_details(achievement_id)
         
@@ -466,29 +1336,130 @@ def initialize_session_from_db(user_id):
                 "earned_at": achievement_db.get('earned_at', datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
             })
     
-    # Update game history
-    st.session_state.game_history = game_history
+    # Update game history and statistics; achievement counters are rebuilt
+    # from them on next use. Only recent games are kept in memory; older
+    # ones are paged from the database on demand.
+    st.session_state.game_history = GameHistory.from_rows(profile.game_history, user_id=user_id)
+    st.session_state.game_stats = profile.game_stats
+    reset_achievement_counters()
     
     # Mark user as active
     db.update_last_active(user_id)
     
+    # The session now matches the database, so the next save can be skipped
+    mark_session_persisted(user_id)
+    
     return True
 
+# Default minimum seconds between last_active writes for a session
+DEFAULT_LAST_ACTIVE_INTERVAL = 60
+
+def get_session_snapshot():
+    """Get a copy of the session state fields that are stored in the database."""
+    return {
+        "total_score": st.session_state.get('total_score', 0),
+        "shop_level": st.session_state.get('shop_level', 1),
+        "skill_levels": dict(st.session_state.get('skill_levels', {}))
+    }
+
+def mark_session_persisted(user_id, last_active_written=True):
+    """Record that the database now matches the session state."""
+    previous = st.session_state.get('_db_snapshot') or {}
+    snapshot = get_session_snapshot()
+    snapshot["user_id"] = user_id
+    if last_active_written or previous.get("user_id") != user_id:
+        snapshot["last_active_at"] = time.time()
+    else:
+        snapshot["last_active_at"] = previous.get("last_active_at", 0)
+    st.session_state._db_snapshot = snapshot
+
+def get_dirty_fields(user_id, force=False):
+    """Compare the session state with the last persisted snapshot.
+    
+    Args:
+        user_id (str): Current user ID
+        force (bool, optional): Treat every field as changed
+    
+    Returns:
+        dict: Changed fields. "skill_levels" only holds the skills that changed
+            and "last_active" is True when the coalescing interval has passed.
+    """
+    persisted = st.session_state.get('_db_snapshot')
+    if force or not persisted or persisted.get("user_id") != user_id:
+        persisted = {"skill_levels": {}, "last_active_at": 0}
+    
+    current = get_session_snapshot()
+    dirty = {}
+    
+    for field in ("total_score", "shop_level"):
+        if current[field] != persisted.get(field):
+            dirty[field] = current[field]
+    
+    changed_skills = {
+        name: level for name, level in current["skill_levels"].items()
+        if persisted["skill_levels"].get(name) != level
+    }
+    if changed_skills:
+        dirty["skill_levels"] = changed_skills
+    
+    from utils.config import get_config
+    interval = get_config("database.last_active_interval")
+    if interval is None:
+        interval = DEFAULT_LAST_ACTIVE_INTERVAL
+    if time.time() - persisted.get("last_active_at", 0) >= interval:
+        dirty["last_active"] = True
+    
+    return dirty
+
+def queue_session_state(batch, user_id, dirty):
+    """Queue the writes for the dirty fields from get_dirty_fields on a batch.
+    
+    Call mark_session_persisted once the batch has committed.
+    """
+    # Update user record
+    if "total_score" in dirty:
+        batch.update_total_score(user_id, dirty["total_score"])
+    if "shop_level" in dirty:
+        batch.update_shop_level(user_id, dirty["shop_level"])
+    if "last_active" in dirty:
+        batch.update_last_active(user_id)
+    
+    # Update skills
+    if "skill_levels" in dirty:
+        batch.update_skills(user_id, dirty["skill_levels"])
+
 # Helper function to save session state to database
-def save_session_state_to_db():
-    """Save current session state to database."""
+def save_session_state_to_db(force=False):
+    """Save changed session state fields to database in one transaction.
+    
+    Only fields that differ from the last save or load are written, and
+    last_active is written at most once per "database.last_active_interval"
+    seconds.
+    
+    A failed write (e.g. the database is still locked after the retries)
+    is logged and leaves the fields dirty, so the next rerun tries again.
+    
+    Args:
+        force (bool, optional): Write every field regardless of changes
+    
+    Returns:
+        bool: True if the state is persisted, False if there is no user or
+            the write failed
+    """
     if 'user_id' not in st.session_state:
         return False
     
     user_id = st.session_state.user_id
+    dirty = get_dirty_fields(user_id, force)
+    if not dirty:
+        return True
     
-    # Update user record
-    db.update_total_score(user_id, st.session_state.total_score)
-    db.update_shop_level(user_id, st.session_state.shop_level)
-    db.update_last_active(user_id)
-    
-    # Update skills
-    for skill_name, level in st.session_state.skill_levels.items():
-        db.update_skill(user_id, skill_name, level)
+    try:
+        with db.batch() as batch:
+            queue_session_state(batch, user_id, dirty)
+    except sqlite3.Error as e:
+        print(f"Database error saving session state: {e}")
+        return False
     
-    return True
\ No newline at end of file
+    mark_session_persisted(user_id, last_active_written="last_active" in dirty)
+    return True
@@ -95,6 +95,24 @@ def show_debug_page():
         config = get_config()
         st.json(config)
     
+    # Database health
+    st.header("Database")
+    with st.expander("Connection Pool, Write Contention and Caches"):
+        from utils.db import db
+        st.write(f"Storage profile: journal_mode={db.storage['journal_mode']}, "
+                 f"synchronous={db.storage['synchronous']}")
+        st.json({
+            "pool": db.pool.stats(),
+            "locks": db.get_lock_stats(),
+            "product_cache": db.get_product_cache_stats()
+        })
+    
+    # Challenge pools
+    st.header("Challenge Pools")
+    with st.expander("Pre-generated Challenges"):
+        from utils.challenge_pool import challenge_pool
+        st.json(challenge_pool.get_stats())
+    
     # Tools
     st.header("Tools")
     
@@ -0,0 +1,184 @@
+"""
+Offline exam sets for Toko Pintar application.
+
+Generates printable worksheets with answer keys from the same challenge
+generators the games use, and grades answer sheets in bulk. Runs without
+a browser session:
+
+    python -m utils.exam_sets generate --game margin_calculator --per-level 500 \
+        --seed 2024 --output margin_key.parquet
+    python -m utils.exam_sets grade --key margin_key.parquet \
+        --answers answers.csv --output graded.csv
+
+Files ending in .parquet are read and written as Parquet (needs pyarrow),
+anything else as CSV. Answer files need challenge_id and answer columns;
+any other columns (e.g. student_id) are carried through to the results.
+"""
+import os
+import random
+import numpy as np
+import pandas as pd
+from utils.challenges import ANSWER_TOLERANCES, MARGIN_BASE_SCORES
+from utils.challenge_pool import ChallengePool, CHALLENGE_LEVELS
+from utils.change_solver import get_solver
+
+# Games whose challenges have a single numeric answer
+EXAM_GAMES = ("change_making", "margin_calculator")
+
+def _flatten(game_id, challenge):
+    """Turn a challenge into one answer-key row."""
+    row = {"game_id": game_id, "level": challenge["level"], "seed": challenge["seed"]}
+    
+    if game_id == "change_making":
+        row.update(
+            type="give_change",
+            items="; ".join(f"{item['name']} (Rp {item['sell_price']:,})" for item in challenge["items"]),
+            total_price=challenge["total_price"],
+            payment=challenge["payment"],
+            correct_answer=challenge["correct_change"]
+        )
+    else:
+        product = challenge["product"]
+        row.update(
+            type=challenge["type"],
+            product=product["name"],
+            buy_price=product["buy_price"],
+            sell_price=product["sell_price"],
+            correct_answer=challenge["correct_answer"]
+        )
+        for field in ("target_margin", "quantity", "fixed_cost", "current_demand", "elasticity"):
+            if field in challenge:
+                row[field] = challenge[field]
+    return row
+
+def generate_exam_set(game_id, per_level, levels=CHALLENGE_LEVELS, seed=None, products=None):
+    """Generate an answer key with `per_level` challenges for each level.
+    
+    Args:
+        game_id (str): One of EXAM_GAMES
+        per_level (int): Challenges per level
+        levels (iterable, optional): Levels to include
+        seed (int, optional): Seed for a reproducible set
+        products (list, optional): Product catalog. Defaults to the database.
+    
+    Returns:
+        pandas.DataFrame: One row per challenge, with a challenge_id and
+            correct_answer column
+    """
+    if game_id not in EXAM_GAMES:
+        raise ValueError(f"Unsupported game for exam sets: {game_id}")
+    
+    pool = ChallengePool(products=products)
+    seeds = random.Random(seed)
+    rows = [
+        _flatten(game_id, pool.generate(game_id, level, seeds.getrandbits(63)))
+        for level in levels
+        for _ in range(per_level)
+    ]
+    key = pd.DataFrame(rows)
+    key.insert(0, "challenge_id", [
+        f"{game_id[:2].upper()}{level}-{number:05d}"
+        for level, number in zip(key["level"], key.groupby("level").cumcount() + 1)
+    ])
+    
+    if game_id == "change_making":
+        # Fewest notes and coins, for worksheets that ask for the breakdown too
+        key["min_pieces"] = get_solver().min_pieces(key["correct_answer"].to_numpy())
+    return key
+
+def grade_answers(key, answers):
+    """Grade answer sheets against an answer key.
+    
+    Uses the same tolerances and base scores as the games; there is no time
+    bonus on paper.
+    
+    Args:
+        key (pandas.DataFrame): Answer key from generate_exam_set
+        answers (pandas.DataFrame): challenge_id and answer columns
+    
+    Returns:
+        pandas.DataFrame: The answers with level, type, correct_answer,
+            difference, is_correct and score columns. Answers to unknown
+            challenge IDs, and blank answers, are graded as incorrect.
+    """
+    columns = ["challenge_id", "game_id", "level", "type", "correct_answer"]
+    graded = answers.merge(key[columns], on="challenge_id", how="left", validate="many_to_one")
+    
+    answer = pd.to_numeric(graded["answer"], errors="coerce").to_numpy(dtype=float)
+    correct = graded["correct_answer"].to_numpy(dtype=float)
+    tolerance = graded["type"].map(ANSWER_TOLERANCES).fillna(0).to_numpy(dtype=float)
+    level = graded["level"].fillna(0).to_numpy(dtype=int)
+    
+    difference = np.abs(answer - correct)
+    is_correct = difference <= tolerance  # NaN compares False
+    
+    margin_score = (
+        graded["level"].map(MARGIN_BASE_SCORES).fillna(15).to_numpy(dtype=int)
+        + level * 2
+        + np.where(difference < tolerance / 2, 5 * level, 0)
+    )
+    score = np.where(graded["game_id"] == "change_making", 10 * level, margin_score)
+    
+    graded["difference"] = difference
+    graded["is_correct"] = is_correct
+    graded["score"] = np.where(is_correct, score, 0)
+    return graded
+
+def summarize(graded, by="level"):
+    """Get answer count, accuracy and mean score per group."""
+    return graded.groupby(by).agg(
+        answers=("is_correct", "size"),
+        accuracy=("is_correct", "mean"),
+        mean_score=("score", "mean")
+    )
+
+def read_table(path):
+    """Read a Parquet or CSV file."""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+def write_table(df, path):
+    """Write a Parquet or CSV file."""
+    if path.endswith(".parquet"):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+def main(argv=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Generate and grade Toko Pintar exam sets")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    generate = commands.add_parser("generate", help="Generate challenges with an answer key")
+    generate.add_argument("--game", choices=EXAM_GAMES, required=True)
+    generate.add_argument("--per-level", type=int, default=100, help="Challenges per level")
+    generate.add_argument("--levels", type=int, nargs="+", default=list(CHALLENGE_LEVELS))
+    generate.add_argument("--seed", type=int, help="Seed for a reproducible set")
+    generate.add_argument("--output", required=True, help=".parquet or .csv file")
+    
+    grade = commands.add_parser("grade", help="Grade answer sheets against an answer key")
+    grade.add_argument("--key", required=True, help="Answer key from the generate command")
+    grade.add_argument("--answers", required=True, help="File with challenge_id and answer columns")
+    grade.add_argument("--output", help="Write graded answers to this .parquet or .csv file")
+    grade.add_argument("--by", default="level", help="Column to summarize by, e.g. student_id")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "generate":
+        key = generate_exam_set(args.game, args.per_level, args.levels, args.seed)
+        write_table(key, args.output)
+        print(f"Wrote {len(key)} {args.game} challenges to {args.output}")
+    else:
+        for path in (args.key, args.answers):
+            if not os.path.exists(path):
+                parser.error(f"File not found: {path}")
+        graded = grade_answers(read_table(args.key), read_table(args.answers))
+        if args.output:
+            write_table(graded, args.output)
+            print(f"Wrote {len(graded)} graded answers to {args.output}")
+        print(summarize(graded, args.by).to_string())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Bounded in-session game history for Toko Pintar application.
+"""
+from collections import deque
+from itertools import chain
+import streamlit as st
+
+# Number of recent games kept in memory per session
+DEFAULT_HISTORY_CAPACITY = 50
+
+class GameHistory:
+    """Ring buffer of a player's most recent games, oldest first.
+
+    Behaves like the list it replaces for iteration, len(), indexing and
+    slicing, but only holds the last `capacity` entries. Older games are
+    paged from the database on demand, and totals come from the game
+    statistics instead of the in-memory entries.
+    """
+
+    def __init__(self, entries=(), capacity=DEFAULT_HISTORY_CAPACITY, user_id=None):
+        self.capacity = capacity
+        self.user_id = user_id
+        self._entries = deque(entries, maxlen=capacity)
+
+    @classmethod
+    def from_rows(cls, rows, user_id=None, capacity=DEFAULT_HISTORY_CAPACITY):
+        """Build a history from game_history rows ordered newest first."""
+        return cls(reversed(rows), capacity=capacity, user_id=user_id)
+
+    def append(self, entry):
+        """Add a game, dropping the oldest in-memory entry when full."""
+        self._entries.append(entry)
+
+    def clear(self):
+        """Remove all in-memory entries."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __reversed__(self):
+        return reversed(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._entries)[index]
+        return self._entries[index]
+
+    def __repr__(self):
+        return f"GameHistory({len(self._entries)} of {self.capacity} recent games, total {self.total_count})"
+
+    def recent(self, limit=10):
+        """Get the most recent games, newest first."""
+        return list(self._entries)[-limit:][::-1]
+
+    def iter_older(self, page_size=20):
+        """Page through stored games that are not held in memory, newest first.
+
+        Paging starts below the oldest in-memory game with a history_id.
+        Entries without one (anonymous play, or a round whose write failed)
+        were never stored, so when no entry has an id every stored game is
+        older. Rows whose history_id is already in memory are skipped.
+
+        Args:
+            page_size (int, optional): Rows fetched per database round trip
+
+        Yields:
+            dict: game_history rows
+        """
+        user_id = self.user_id or st.session_state.get('user_id')
+        if not user_id:
+            return
+
+        from utils.db import db
+
+        loaded = {entry["history_id"] for entry in self._entries if entry.get("history_id")}
+        cursor = min(loaded) if loaded else None
+        while True:
+            rows, cursor = db.get_game_history_page(user_id, before_id=cursor, limit=page_size)
+            for row in rows:
+                if row["history_id"] not in loaded:
+                    yield row
+            if cursor is None:
+                return
+
+    def iter_all(self, page_size=20):
+        """Iterate over every game, newest first: in memory, then stored older ones."""
+        return chain(list(reversed(self._entries)), self.iter_older(page_size))
+
+    # Aggregates come from the per-game statistics, which cover all games
+    def _stats(self):
+        return st.session_state.get('game_stats') or {}
+
+    @property
+    def total_count(self):
+        """Number of games played, including those no longer in memory."""
+        stats = self._stats()
+        if stats:
+            return sum(game["play_count"] for game in stats.values())
+        return len(self._entries)
+
+    @property
+    def average_score(self):
+        """Average score over all games played."""
+        stats = self._stats()
+        if stats:
+            total = sum(game["play_count"] for game in stats.values())
+            return sum(game["average_score"] * game["play_count"] for game in stats.values()) / max(1, total)
+        return sum(entry["score"] for entry in self._entries) / max(1, len(self._entries))
+
+    def best_score(self, game_id):
+        """Highest score ever earned in a game."""
+        stats = self._stats().get(game_id)
+        if stats:
+            return stats["best_score"]
+        return max((entry["score"] for entry in self._entries if entry["game_id"] == game_id), default=0)
+
+def get_game_history():
+    """Get the session's game history, converting a plain list if needed.
+
+    Returns:
+        GameHistory: The session history
+    """
+    history = st.session_state.get('game_history')
+    if not isinstance(history, GameHistory):
+        history = GameHistory(history or [], user_id=st.session_state.get('user_id'))
+        st.session_state.game_history = history
+    return history
@@ -4,7 +4,7 @@ Provides standardized level management across different games.
 """
 import streamlit as st
 from utils.config import get_config
-from utils.i18n import tr
+from utils.i18n import get_translator, tr
 
 def display_level_selection(game_id, level_descriptions, get_level_limits=None, on_level_select=None):
     """Display a standardized level selection UI.
@@ -15,6 +15,7 @@ def display_level_selection(game_id, level_descriptions, get_level_limits=None,
         get_level_limits (callable, optional): Function to get time limits for levels
         on_level_select (callable, optional): Function to call when level is selected
     """
+    t = get_translator()
     # Get language preference
     lang = get_config("app.default_language") or "en"
     
@@ -32,7 +33,7 @@ def display_level_selection(game_id, level_descriptions, get_level_limits=None,
     max_available_level = min(5, max(1, int(skill_level) + 1))
     
     # Display level selection UI
-    st.markdown(tr('level_selection_header'))
+    st.markdown(t('level_selection_header'))
     
     # Create level selection cards
     cols = st.columns(5)
@@ -43,7 +44,7 @@ def display_level_selection(game_id, level_descriptions, get_level_limits=None,
         is_unlocked = level_num <= max_available_level
         
         with col:
-            level_title = tr('level_title', level_num=level_num)
+            level_title = t('level_title', level_num=level_num)
             
             # Get short description for this level
             desc_key = "en" if lang == "en" else "id"
@@ -68,7 +69,7 @@ def display_level_selection(game_id, level_descriptions, get_level_limits=None,
             if get_level_limits:
                 time_limit = get_level_limits(level_num)
                 if time_limit:
-                    time_text = tr('time_text')
+                    time_text = t('time_text')
                     time_info = f"⏱️ {time_limit} {time_text}"
             
             # Create a card for each level with appropriate styling
@@ -78,12 +79,12 @@ def display_level_selection(game_id, level_descriptions, get_level_limits=None,
                     <h4 style="margin: 0;">{level_title}</h4>
                     <p style="font-size: 0.8em; margin: 5px 0; height: 40px;">{level_desc}</p>
                     <div style="margin-top: 5px; font-size: 0.8em;">{time_info}</div>
-                    <div style="margin-top: 5px; color: {color};">{tr('unlocked_text')}</div>
+                    <div style="margin-top: 5px; color: {color};">{t('unlocked_text')}</div>
                 </div>
                 """, unsafe_allow_html=True)
                 
                 # Button to select this level
-                if st.button(tr('select_level_button', level_num=level_num), key=f"select_{game_id}_level_{level_num}"):
+                if st.button(t('select_level_button', level_num=level_num), key=f"select_{game_id}_level_{level_num}"):
                     level_selected = level_num
             else:
                 # Locked level
@@ -92,7 +93,7 @@ def display_level_selection(game_id, level_descriptions, get_level_limits=None,
                     <h4 style="margin: 0;">{level_title}</h4>
                     <p style="font-size: 0.8em; margin: 5px 0; height: 40px;">{level_desc}</p>
                     <div style="margin-top: 5px; font-size: 0.8em;">{time_info}</div>
-                    <div style="margin-top: 5px; color: #888;">{tr('locked_text')}</div>
+                    <div style="margin-top: 5px; color: #888;">{t('locked_text')}</div>
                 </div>
                 """, unsafe_allow_html=True)
     
@@ -205,16 +206,17 @@ def display_score_breakdown(base_score, level_bonus=0, time_bonus=0, accuracy_bo
     Returns:
         int: Total score
     """
+    t = get_translator()
     total_score = base_score + level_bonus + time_bonus + accuracy_bonus
     
     # Translations
-    score_breakdown = tr('score_breakdown_text')
-    base_score_text = tr('base_score_text')
-    level_bonus_text = tr('level_bonus_text')
-    time_bonus_text = tr('time_bonus_text')
-    accuracy_bonus_text = tr('accuracy_bonus_text')
-    total_score_text = tr('total_score_text')
-    points = tr('points_text')
+    score_breakdown = t('score_breakdown_text')
+    base_score_text = t('base_score_text')
+    level_bonus_text = t('level_bonus_text')
+    time_bonus_text = t('time_bonus_text')
+    accuracy_bonus_text = t('accuracy_bonus_text')
+    total_score_text = t('total_score_text')
+    points = t('points_text')
     
     # Create score breakdown table
     st.markdown(f"### {score_breakdown}")
@@ -222,8 +224,8 @@ def display_score_breakdown(base_score, level_bonus=0, time_bonus=0, accuracy_bo
     score_table = f"""
     <table style="width: 100%; border-collapse: collapse; margin-bottom: 15px;">
         <tr style="background-color: #f0f0f0;">
-            <th style="padding: 8px; text-align: left; border: 1px solid #ddd;">{tr('component_text')}</th>
-            <th style="padding: 8px; text-align: right; border: 1px solid #ddd;">{tr('points_text')}</th>
+            <th style="padding: 8px; text-align: left; border: 1px solid #ddd;">{t('component_text')}</th>
+            <th style="padding: 8px; text-align: right; border: 1px solid #ddd;">{t('points_text')}</th>
         </tr>
         <tr>
             <td style="padding: 8px; border: 1px solid #ddd;">{base_score_text}</td>
@@ -3,9 +3,9 @@ Game UI utilities for Toko Pintar application.
 Provides standardized UI components across games.
 """
 import streamlit as st
-import random
 from utils.config import get_config, get_product_emoji
 from utils.i18n import tr
+from utils.visualization import render_visualization
 
 def display_product_card(product, lang="en"):
     """Display a product card with consistent styling.
@@ -184,7 +184,7 @@ def display_accuracy_gauge(accuracy, lang="en"):
     </div>
     """, unsafe_allow_html=True)
 
-def generate_visualization(items, count, style="default", level=1):
+def generate_visualization(items, count, style="default", level=1, seed=0):
     """Generate a visual representation of items.
     
     Args:
@@ -192,47 +192,10 @@ def generate_visualization(items, count, style="default", level=1):
         count (int): Number of items to display
         style (str): Visual style to use (default, random, grid, etc.)
         level (int): Game difficulty level
+        seed (int): Seed for the random and dynamic layouts, so a round
+            keeps its layout across reruns
         
     Returns:
         str: HTML string for the visualization
     """
-    # Start container
-    container_style = "display: flex; flex-wrap: wrap; margin-bottom: 10px; padding: 10px; border-radius: 5px;"
-    html = f"<div style='{container_style}'>"
-    
-    # Apply different visualization styles
-    if style == "random":
-        # Random arrangement with varied spacing
-        for i in range(count):
-            margin = f"{random.randint(2, 10)}px"
-            size = f"{random.randint(24, 32)}px"
-            html += f"<div style='font-size: {size}; margin: {margin}; display: inline-block;'>{items}</div>"
-    
-    elif style == "grid":
-        # Organized grid arrangement
-        for i in range(count):
-            html += f"<div style='font-size: 28px; margin: 4px; display: inline-block;'>{items}</div>"
-            if (i + 1) % 5 == 0 and i < count - 1:
-                html += "</div><div style='{container_style}'>"
-    
-    elif style == "dynamic":
-        # Size, opacity and position vary based on level
-        indices = list(range(count))
-        random.shuffle(indices)
-        
-        for i in range(count):
-            # Randomize size, spacing, and opacity based on level
-            size_variance = 8 + (level * 2)  # More variance at higher levels
-            size = f"{random.randint(28 - size_variance//2, 28 + size_variance//2)}px"
-            margin = f"{random.randint(2, 4 + level)}px"
-            opacity = random.uniform(0.8, 1.0) if level >= 4 else 1.0
-            
-            html += f"<div style='font-size: {size}; margin: {margin}; opacity: {opacity}; display: inline-block;'>{items}</div>"
-    
-    else:
-        # Default display
-        for i in range(count):
-            html += f"<div style='font-size: 28px; margin: 4px; display: inline-block;'>{items}</div>"
-    
-    html += "</div>"
-    return html
\ No newline at end of file
+    return render_visualization(items, count, style, level, seed)
\ No newline at end of file
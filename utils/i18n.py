@@ -1,24 +1,150 @@
+"""
+Translation engine for Toko Pintar application.
+
+Catalogs are loaded from app_translations.json once per process. Each
+language gets a flat key -> text dict.
+
+Use tr() for one-off lookups, or get_translator() once per render to skip
+the session language lookup on every call:
+    
+    t = get_translator()
+    st.markdown(t("welcome"))
+"""
 import os
 import json
+import threading
+import timeit
 import streamlit as st
 
 TRANSLATION_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'i18n', 'app_translations.json')
 
+# Language names shown in the UI -> catalog codes
+LANGUAGE_CODES = {
+    "English": "en",
+    "Bahasa Indonesia": "id"
+}
+DEFAULT_LANGUAGE_CODE = "en"
+
 # Cache translations in memory
 _translations = None
+_catalogs = None
+_load_lock = threading.Lock()
 
 def load_translations():
-    global _translations
+    """Load the raw translation file once per process."""
+    global _translations, _catalogs
     if _translations is None:
-        with open(TRANSLATION_PATH, encoding='utf-8') as f:
-            _translations = json.load(f)
+        with _load_lock:
+            if _translations is None:
+                with open(TRANSLATION_PATH, encoding='utf-8') as f:
+                    translations = json.load(f)
+                
+                _catalogs = {code: dict(entries) for code, entries in translations.items()}
+                _translations = translations
     return _translations
 
+def get_lang_code(language=None):
+    """Get the catalog code for a language name.
+    
+    Args:
+        language (str, optional): UI language name or code. Defaults to the
+            language selected in the session.
+    
+    Returns:
+        str: Language code ("en" or "id")
+    """
+    if language is None:
+        language = st.session_state.get('language', 'English')
+    return LANGUAGE_CODES.get(language, language if language in LANGUAGE_CODES.values() else DEFAULT_LANGUAGE_CODE)
+
+def translate(key, lang_code=DEFAULT_LANGUAGE_CODE, **kwargs):
+    """Translate a key for an explicit language code.
+    
+    Missing keys are returned unchanged.
+    """
+    if _catalogs is None:
+        load_translations()
+    catalog = _catalogs.get(lang_code)
+    if catalog is None:
+        return key
+    value = catalog.get(key, key)
+    if kwargs:
+        return value.format(**kwargs)
+    return value
+
+def get_translator(language=None):
+    """Get a translation function bound to one language.
+    
+    Resolve it once per render and reuse it for every string on the page.
+    
+    Args:
+        language (str, optional): UI language name or code. Defaults to the
+            language selected in the session.
+    
+    Returns:
+        callable: Function taking (key, **kwargs) and returning the text
+    """
+    if _catalogs is None:
+        load_translations()
+    lang_code = get_lang_code(language)
+    catalog = _catalogs.get(lang_code, {})
+    
+    def translator(key, **kwargs):
+        value = catalog.get(key, key)
+        if kwargs:
+            return value.format(**kwargs)
+        return value
+    
+    translator.lang_code = lang_code
+    return translator
+
 def tr(key, **kwargs):
-    translations = load_translations()
-    lang = st.session_state.get('language', 'English')
-    lang_code = 'id' if lang == 'Bahasa Indonesia' else 'en'
-    value = translations.get(lang_code, {}).get(key, key)
+    """Translate a key into the language selected in the session."""
+    if _catalogs is None:
+        load_translations()
+    lang_code = LANGUAGE_CODES.get(st.session_state.get('language', 'English'), DEFAULT_LANGUAGE_CODE)
+    value = _catalogs[lang_code].get(key, key)
     if kwargs:
         return value.format(**kwargs)
     return value
+
+def benchmark(lookups=1000, repeat=5):
+    """Measure the cost of 1,000 translation lookups.
+    
+    Compares the previous per-call implementation with tr() and a bound
+    translator, for plain keys and for keys with placeholders.
+    
+    Returns:
+        dict: Best time in microseconds per `lookups` calls for each variant
+    """
+    load_translations()
+    keys = list(_catalogs[DEFAULT_LANGUAGE_CODE].keys())
+    keys = (keys * (lookups // len(keys) + 1))[:lookups]
+    
+    def legacy_tr(key, **kwargs):
+        translations = load_translations()
+        lang = st.session_state.get('language', 'English')
+        lang_code = 'id' if lang == 'Bahasa Indonesia' else 'en'
+        value = translations.get(lang_code, {}).get(key, key)
+        if kwargs:
+            return value.format(**kwargs)
+        return value
+    
+    t = get_translator()
+    variants = {
+        "legacy_tr": lambda: [legacy_tr(key) for key in keys],
+        "tr": lambda: [tr(key) for key in keys],
+        "bound_translator": lambda: [t(key) for key in keys],
+        "legacy_tr_format": lambda: [legacy_tr("success_welcome", player_name="Budi") for _ in keys],
+        "tr_format": lambda: [tr("success_welcome", player_name="Budi") for _ in keys],
+        "bound_translator_format": lambda: [t("success_welcome", player_name="Budi") for _ in keys]
+    }
+    return {
+        name: min(timeit.repeat(run, number=1, repeat=repeat)) * 1_000_000
+        for name, run in variants.items()
+    }
+
+if __name__ == "__main__":
+    # python -m utils.i18n
+    for name, micros in benchmark().items():
+        print(f"{name:<24} {micros:10.1f} us per 1,000 lookups")
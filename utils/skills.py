@@ -1,11 +1,26 @@
 """
 Skills progression system for Toko Pintar application.
 """
+import sqlite3
 import streamlit as st
 from datetime import datetime
-from utils.db import db
+from utils.db import (
+    db,
+    get_dirty_fields,
+    mark_session_persisted,
+    queue_session_state,
+    PERFECT_SCORE
+)
 from utils.config import get_config
-from utils.achievements import check_achievements
+from utils.game_history import get_game_history
+from utils.achievements import (
+    add_session_achievements,
+    get_achievement_counters,
+    record_events,
+    EVENT_GAME_COMPLETED,
+    EVENT_SKILL_CHANGED,
+    EVENT_SHOP_LEVEL_CHANGED
+)
 
 # Skill definitions with display names
 SKILL_DEFINITIONS = {
@@ -85,18 +100,23 @@ def initialize_skills():
             "bookkeeping": 0
         }
 
-def update_skills(game_id, score):
+def update_skills(game_id, score, details=None):
     """Update player skills based on the game played and score earned.
     
     Args:
         game_id (str): Identifier of the game played
         score (int): Score earned in the game
+        details (dict, optional): Extra data stored with the game history
+            entry, e.g. the challenge level and seed for replays
         
     Returns:
         dict: Updated skills information
     """
     initialize_skills()
     
+    # Build the achievement counters from the history before this game is added
+    get_achievement_counters()
+    
     # Get skill increase amount from config
     skill_increase = get_config("gameplay.skill_increase_amount") or 0.2
     max_skill_level = get_config("gameplay.max_skill_level") or 5
@@ -123,10 +143,6 @@ def update_skills(game_id, score):
                 "new_level": new_level,
                 "increased": new_level > current_level
             }
-            
-            # Update in database if user is logged in
-            if hasattr(st.session_state, 'user_id'):
-                db.update_skill(st.session_state.user_id, primary_skill, new_level)
         
         # Update secondary skill if present
         secondary_skill = GAME_SKILL_MAPPING[game_id]["secondary"]
@@ -143,41 +159,55 @@ def update_skills(game_id, score):
                 "new_level": new_level,
                 "increased": new_level > current_level
             }
-            
-            # Update in database if user is logged in
-            if hasattr(st.session_state, 'user_id'):
-                db.update_skill(st.session_state.user_id, secondary_skill, new_level)
     
     # Update total score
     if 'total_score' not in st.session_state:
         st.session_state.total_score = 0
     st.session_state.total_score += score
     
-    # Update in database if user is logged in
-    if hasattr(st.session_state, 'user_id'):
-        db.update_total_score(st.session_state.user_id, st.session_state.total_score)
-    
     # Record game in history
-    if 'game_history' not in st.session_state:
-        st.session_state.game_history = []
-        
     game_entry = {
         "game_id": game_id,
         "score": score,
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
-    
-    st.session_state.game_history.append(game_entry)
-    
-    # Add to database if user is logged in
-    if hasattr(st.session_state, 'user_id'):
-        db.add_game_history(st.session_state.user_id, game_id, score)
+    get_game_history().append(game_entry)
+    update_game_stats(game_id, score)
     
     # Update shop level
-    update_shop_level()
+    shop_level_changed = update_shop_level()
     
-    # Check for achievements
-    new_achievements = check_achievements()
+    # The history entry, achievements, skills, score and shop level are
+    # written in one transaction if the user is logged in
+    user_id = st.session_state.get('user_id')
+    new_achievements = []
+    try:
+        with db.batch() as batch:
+            if user_id:
+                receipt = batch.add_game_history(user_id, game_id, score, details)
+            
+            # Check the achievements that depend on what just happened
+            events = [(EVENT_GAME_COMPLETED, {"game_id": game_id, "score": score})]
+            if any(change["increased"] for change in updated_skills.values()):
+                events.append((EVENT_SKILL_CHANGED, {"skills": list(updated_skills)}))
+            if shop_level_changed:
+                events.append((EVENT_SHOP_LEVEL_CHANGED, {"shop_level": st.session_state.shop_level}))
+            new_achievements = record_events(events, batch)
+            
+            if user_id:
+                dirty = get_dirty_fields(user_id)
+                queue_session_state(batch, user_id, dirty)
+    except sqlite3.Error as e:
+        # Score, skills and shop level stay dirty, so the end-of-run save
+        # retries them. The history entry, game statistics and achievements
+        # of this round are not retried and are lost.
+        print(f"Database error saving game result: {e}")
+        st.warning("Your score was kept, but this game could not be saved to your history.")
+    else:
+        add_session_achievements(new_achievements)
+        if user_id:
+            game_entry["history_id"] = receipt["history_id"]
+            mark_session_persisted(user_id, last_active_written="last_active" in dirty)
     
     return {
         "updated_skills": updated_skills,
@@ -187,6 +217,62 @@ def update_skills(game_id, score):
         "shop_level": st.session_state.shop_level
     }
 
+def score_round(round_state, game_id, score, details=None):
+    """Score a submitted round once, then rerun the whole app.
+    
+    Games run as fragments (see app.run_game), and their result screens are
+    redrawn on every fragment rerun. The round is scored on the first call
+    only; that call then reruns the whole app so the dashboard and the
+    end-of-run save see the new score.
+    
+    Args:
+        round_state (dict): The game's session state for this round
+        game_id (str): Identifier of the game played
+        score (int): Score earned in the round
+        details (dict, optional): Extra data for the game history entry
+    
+    Returns:
+        dict: Updated skills information from update_skills
+    """
+    if round_state.get("scored"):
+        return round_state.get("results")
+    
+    round_state["results"] = update_skills(game_id, score, details)
+    round_state["scored"] = True
+    try:
+        st.rerun(scope="app")
+    except TypeError:
+        # Streamlit versions without rerun scopes always rerun the app
+        st.rerun()
+
+def update_game_stats(game_id, score):
+    """Update the session copy of the game statistics after a game.
+    
+    Mirrors the game_stats update done by DatabaseManager.add_game_history,
+    so the session does not have to re-read the table.
+    """
+    if 'game_stats' not in st.session_state:
+        st.session_state.game_stats = {}
+    
+    stats = st.session_state.game_stats.get(game_id)
+    if stats is None:
+        stats = {
+            "game_id": game_id,
+            "play_count": 0,
+            "best_score": score,
+            "last_score": score,
+            "average_score": 0.0,
+            "perfect_streak": 0
+        }
+        st.session_state.game_stats[game_id] = stats
+    
+    stats["play_count"] += 1
+    stats["best_score"] = max(stats["best_score"], score)
+    stats["last_score"] = score
+    stats["average_score"] += (score - stats["average_score"]) / stats["play_count"]
+    stats["perfect_streak"] = stats["perfect_streak"] + 1 if score >= PERFECT_SCORE else 0
+    stats["last_played"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
 def update_shop_level():
     """Update shop level based on skill levels.
     
@@ -207,14 +293,10 @@ def update_shop_level():
     old_level = st.session_state.shop_level if 'shop_level' in st.session_state else 1
     new_level = max(1, min(5, int(avg_skill / threshold) + 1))
     
-    # Update session state if changed
+    # Update session state if changed; the database copy is written with
+    # the rest of the session state
     if new_level != old_level:
         st.session_state.shop_level = new_level
-        
-        # Update in database if user is logged in
-        if hasattr(st.session_state, 'user_id'):
-            db.update_shop_level(st.session_state.user_id, new_level)
-        
         return True
     
     # Ensure shop_level exists in session state
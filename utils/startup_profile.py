@@ -0,0 +1,126 @@
+"""
+Startup import profiler for Toko Pintar application.
+
+Imports the app in a fresh interpreter with `python -X importtime` and
+reports what each module costs, so cold-start regressions (a heavy library
+imported at module level, a content module pulled in by a package
+__init__) are easy to spot:
+
+    python -m utils.startup_profile
+    python -m utils.startup_profile --top 20 --sort self
+    python -m utils.startup_profile --module components.learning --project-only
+
+Importing app also opens and migrates the database, as a real worker
+start does. The profiled interpreter works on a temporary copy of the
+configured database, so profiling never modifies it.
+"""
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Top-level packages that belong to this project
+PROJECT_PACKAGES = ("app", "components", "games", "utils")
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+def profile_imports(modules=("app",)):
+    """Import modules in a fresh interpreter and time every import.
+    
+    Args:
+        modules (iterable, optional): Modules to import, in order
+    
+    Returns:
+        list: One dict per imported module, in import order, with module,
+            self_ms, cumulative_ms and depth (0 for modules imported by
+            the profiled statement itself)
+    
+    Raises:
+        RuntimeError: If the import fails
+    """
+    from utils.config import DB_PATH_ENV, get_db_path
+    
+    code = "; ".join(f"import {module}" for module in modules)
+    work_dir = tempfile.mkdtemp(prefix="toko-pintar-profile-")
+    try:
+        db_copy = os.path.join(work_dir, "user_data.db")
+        if os.path.exists(get_db_path()):
+            source = sqlite3.connect(f"file:{get_db_path()}?mode=ro", uri=True)
+            target = sqlite3.connect(db_copy)
+            source.backup(target)
+            source.close()
+            target.close()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+            env=dict(os.environ, **{DB_PATH_ENV: db_copy})
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{result.stderr[-2000:]}")
+    
+    records = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append({
+                "module": module,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": (len(indent) - 1) // 2
+            })
+    return records
+
+def summarize_packages(records):
+    """Get the total self time per top-level package, largest first."""
+    totals = defaultdict(float)
+    for record in records:
+        totals[record["module"].split(".")[0]] += record["self_ms"]
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+def format_report(records, top=25, sort="cumulative", project_only=False):
+    """Format the profile as a plain-text report."""
+    total_ms = sum(record["self_ms"] for record in records)
+    lines = [f"Imported {len(records)} modules in {total_ms:.1f} ms", ""]
+    
+    lines.append("By top-level package (self time):")
+    for package, package_ms in summarize_packages(records)[:top]:
+        lines.append(f"  {package_ms:9.1f} ms  {package_ms / total_ms:6.1%}  {package}")
+    lines.append("")
+    
+    if project_only:
+        records = [r for r in records if r["module"].split(".")[0] in PROJECT_PACKAGES]
+    key = "self_ms" if sort == "self" else "cumulative_ms"
+    lines.append(f"Top modules by {sort} time:")
+    lines.append(f"  {'self ms':>9}  {'cumul. ms':>9}  module")
+    for record in sorted(records, key=lambda r: r[key], reverse=True)[:top]:
+        lines.append(f"  {record['self_ms']:9.1f}  {record['cumulative_ms']:9.1f}  {record['module']}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Report the import cost of each module at app startup")
+    parser.add_argument("--module", action="append", help="Module to import (default: app); repeat for several")
+    parser.add_argument("--top", type=int, default=25, help="Rows per table")
+    parser.add_argument("--sort", choices=("cumulative", "self"), default="cumulative")
+    parser.add_argument("--project-only", action="store_true", help="List only this project's modules")
+    args = parser.parse_args(argv)
+    
+    try:
+        records = profile_imports(args.module or ["app"])
+    except RuntimeError as e:
+        parser.exit(1, f"{e}\n")
+    print(format_report(records, args.top, args.sort, args.project_only))
+
+if __name__ == "__main__":
+    main()
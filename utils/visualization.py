@@ -0,0 +1,138 @@
+"""
+Emoji visualizations for Toko Pintar counting games.
+
+Grids are built with str.join from templates bound once, and cached by all
+of their inputs. Random layouts take a seed, so a round looks the same on
+every rerun and can be rebuilt exactly from the round's seed.
+
+The compact form draws the emoji as a repeated background tile on at most
+two elements (full rows and the remainder), so its size does not depend on
+the count.
+"""
+import random
+from functools import lru_cache
+from urllib.parse import quote
+
+# Container for the span/div layouts
+_CONTAINER_TEMPLATE = (
+    "<div style='display: flex; flex-wrap: wrap; margin-bottom: 10px; padding: 10px; border-radius: 5px;'>"
+    "{items}</div>"
+).format
+
+_ITEM_TEMPLATE = "<div style='font-size: {size}px; margin: {margin}px; display: inline-block;'>{emoji}</div>".format
+_FADED_ITEM_TEMPLATE = (
+    "<div style='font-size: {size}px; margin: {margin}px; opacity: {opacity:.2f}; display: inline-block;'>{emoji}</div>"
+).format
+
+# Items per row in the grid style
+GRID_COLUMNS = 5
+
+_INVENTORY_CARD_TEMPLATE = (
+    "<div class='inventory-card'>"
+    "<div class='inventory-card-emoji-row'>{emojis}</div>"
+    "<div class='inventory-card-name'>{name}</div>"
+    "</div>"
+).format
+
+_INVENTORY_EMOJI_TEMPLATE = "<span class='inventory-card-emoji'>{emoji}</span>".format
+
+# Compact form: one background-tiled block per run of rows
+_TILE_BLOCK_TEMPLATE = (
+    "<div class='emoji-tiles' data-count='{count}' style='"
+    "width: {width}px; height: {height}px; "
+    "background-image: url(\"{tile}\"); background-size: {cell}px {cell}px; background-repeat: repeat;'>"
+    "</div>"
+).format
+
+_TILE_SVG_TEMPLATE = (
+    "<svg xmlns='http://www.w3.org/2000/svg' width='{cell}' height='{cell}'>"
+    "<text x='50%' y='50%' font-size='{font_size}' text-anchor='middle' dominant-baseline='central'>{emoji}</text>"
+    "</svg>"
+).format
+
+COMPACT_CELL_SIZE = 40  # px per item in the compact form
+COMPACT_COLUMNS = 10
+
+@lru_cache(maxsize=256)
+def _emoji_tile(emoji, cell):
+    """Get an SVG data URI that draws one emoji."""
+    svg = _TILE_SVG_TEMPLATE(cell=cell, font_size=int(cell * 0.7), emoji=emoji)
+    return "data:image/svg+xml;utf8," + quote(svg)
+
+@lru_cache(maxsize=512)
+def render_compact_grid(emoji, count, columns=COMPACT_COLUMNS, cell=COMPACT_CELL_SIZE):
+    """Render `count` emoji as a tiled grid of at most two elements.
+    
+    Returns:
+        str: HTML
+    """
+    tile = _emoji_tile(emoji, cell)
+    full_rows, remainder = divmod(count, columns)
+    blocks = []
+    if full_rows:
+        blocks.append(_TILE_BLOCK_TEMPLATE(
+            count=full_rows * columns, width=columns * cell, height=full_rows * cell, tile=tile, cell=cell
+        ))
+    if remainder:
+        blocks.append(_TILE_BLOCK_TEMPLATE(
+            count=remainder, width=remainder * cell, height=cell, tile=tile, cell=cell
+        ))
+    return f"<div class='emoji-tile-grid' data-count='{count}'>{''.join(blocks)}</div>"
+
+@lru_cache(maxsize=512)
+def render_visualization(emoji, count, style="default", level=1, seed=0):
+    """Render `count` emoji in one of the game layouts.
+    
+    Args:
+        emoji (str): Emoji or text of the item
+        count (int): Number of items
+        style (str, optional): default, grid, random or dynamic
+        level (int, optional): Game difficulty level (for dynamic)
+        seed (int, optional): Seed for the random and dynamic layouts
+    
+    Returns:
+        str: HTML
+    """
+    if style == "random":
+        # Random arrangement with varied spacing
+        rng = random.Random(seed)
+        items = [
+            _ITEM_TEMPLATE(size=rng.randint(24, 32), margin=rng.randint(2, 10), emoji=emoji)
+            for _ in range(count)
+        ]
+    elif style == "dynamic":
+        # Size, opacity and spacing vary more at higher levels
+        rng = random.Random(seed)
+        size_variance = 8 + (level * 2)
+        items = [
+            _FADED_ITEM_TEMPLATE(
+                size=rng.randint(28 - size_variance//2, 28 + size_variance//2),
+                margin=rng.randint(2, 4 + level),
+                opacity=rng.uniform(0.8, 1.0) if level >= 4 else 1.0,
+                emoji=emoji
+            )
+            for _ in range(count)
+        ]
+    else:
+        item = _ITEM_TEMPLATE(size=28, margin=4, emoji=emoji)
+        if style == "grid":
+            # Organized rows of GRID_COLUMNS
+            full_rows, remainder = divmod(count, GRID_COLUMNS)
+            rows = [item * GRID_COLUMNS] * full_rows + ([item * remainder] if remainder else [])
+            return "".join(_CONTAINER_TEMPLATE(items=row) for row in rows) or _CONTAINER_TEMPLATE(items="")
+        items = [item] * count
+    
+    return _CONTAINER_TEMPLATE(items="".join(items))
+
+@lru_cache(maxsize=512)
+def render_inventory_card(emoji, count, name, compact=False):
+    """Render an inventory counting card: one icon per item, no count shown.
+    
+    Returns:
+        str: HTML
+    """
+    if compact:
+        emojis = render_compact_grid(emoji, count)
+    else:
+        emojis = _INVENTORY_EMOJI_TEMPLATE(emoji=emoji) * count
+    return _INVENTORY_CARD_TEMPLATE(emojis=emojis, name=name)